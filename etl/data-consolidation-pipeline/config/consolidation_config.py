@@ -550,8 +550,9 @@ class ConsolidationConfig:
     
     # === CONFIGURATION EXPORT ===
     EXPORT_CONFIG = {
-        "formats": ["parquet", "csv", "geojson", "hdf5"],
-        "compression": "snappy",  # Compression Parquet
+        "formats": ["parquet", "geojson", "hdf5"],  # Parquet canonique, CSV sur demande
+        "compression": "zstd",  # Compression Parquet
+        "compression_level": 3,
         "encoding": "utf-8",
         "float_format": "%.6f",
         "index": False
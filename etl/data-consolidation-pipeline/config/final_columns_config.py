@@ -8,6 +8,10 @@ Configuration exacte selon real_estate_prompt.md
 25-30 colonnes finales maximum
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 # === COLONNES FINALES SELON LE PROMPT ===
 FINAL_COLUMNS_SPECIFICATION = {
     "identifiants": [
@@ -101,6 +105,9 @@ COLUMNS_TO_REMOVE = [
 TOTAL_FINAL_COLUMNS = len(FINAL_COLUMNS_LIST)
 EXPECTED_REDUCTION_PERCENTAGE = ((78 - TOTAL_FINAL_COLUMNS) / 78) * 100
 
-print(f"📊 Colonnes finales spécifiées: {TOTAL_FINAL_COLUMNS}")
-print(f"📉 Réduction attendue: {EXPECTED_REDUCTION_PERCENTAGE:.1f}%")
-print(f"🎯 Objectif atteint: {'✅' if EXPECTED_REDUCTION_PERCENTAGE >= 65 else '❌'}")
+# Résumé unique, sans écriture sur stdout à l'import du module
+logger.debug(
+    f"📊 Colonnes finales: {TOTAL_FINAL_COLUMNS} | "
+    f"📉 Réduction attendue: {EXPECTED_REDUCTION_PERCENTAGE:.1f}% | "
+    f"🎯 Objectif atteint: {'✅' if EXPECTED_REDUCTION_PERCENTAGE >= 65 else '❌'}"
+)
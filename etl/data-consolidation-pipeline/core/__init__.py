@@ -7,11 +7,22 @@
 Modules principaux du pipeline de consolidation modulaire
 """
 
-from .pipeline_manager import PipelineManager
-from .data_processor import DataProcessor
-from .export_manager import ExportManager
-from .report_generator import ReportGenerator
-from .config_manager import ConfigManager
+try:
+    from ..utils.lazy_imports import lazy_attributes
+except ImportError:
+    from utils.lazy_imports import lazy_attributes
+
+# Attribut public -> sous-module, importé au premier accès: importer core.components.X
+# ne charge plus tout le gestionnaire de pipeline
+_LAZY_IMPORTS = {
+    "PipelineManager": ".pipeline_manager",
+    "DataProcessor": ".data_processor",
+    "ExportManager": ".export_manager",
+    "ReportGenerator": ".report_generator",
+    "ConfigManager": ".config_manager"
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "PipelineManager",
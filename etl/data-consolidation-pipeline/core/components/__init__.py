@@ -8,12 +8,22 @@ Export de tous les composants spécialisés du pipeline ETL
 """
 
 # === COMPOSANTS PRINCIPAUX ===
-from .data_extractor import DataExtractor
-from .data_consolidator import DataConsolidator
-from .data_cleaner import DataCleaner
-from .data_enricher import DataEnricher
-from .data_validator import DataValidator
-from .pipeline_orchestrator import PipelineOrchestrator
+try:
+    from ...utils.lazy_imports import lazy_attributes
+except ImportError:
+    from utils.lazy_imports import lazy_attributes
+
+# Composant -> sous-module, importé au premier accès
+_LAZY_IMPORTS = {
+    "DataExtractor": ".data_extractor",
+    "DataConsolidator": ".data_consolidator",
+    "DataCleaner": ".data_cleaner",
+    "DataEnricher": ".data_enricher",
+    "DataValidator": ".data_validator",
+    "PipelineOrchestrator": ".pipeline_orchestrator"
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 # === ORCHESTRATEUR PRINCIPAL ===
 # Import supprimé pour éviter l'import circulaire
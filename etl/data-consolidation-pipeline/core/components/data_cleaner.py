@@ -14,8 +14,18 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 import warnings
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
 
+# Écriture Parquet incrémentale pour le nettoyage en flux (optionnel)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Imports des utilitaires (avec gestion d'erreur pour compatibilité)
 try:
     from ...utils.property_type_normalizer import PropertyTypeNormalizer
@@ -35,9 +45,28 @@ except ImportError:
             def normalize(self, property_type):
                 return str(property_type).lower().strip() if property_type else None
 
+try:
+    from ...utils.date_utils import parse_datetime_column
+except ImportError:
+    from utils.date_utils import parse_datetime_column
+
+try:
+    from ...utils.null_utils import count_nulls
+except ImportError:
+    from utils.null_utils import count_nulls
+
+try:
+    from ...utils.memory_utils import downcast_float_lossless
+except ImportError:
+    from utils.memory_utils import downcast_float_lossless
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Table de traduction des noms de colonnes (construite une fois, appliquée à chaque chunk)
+# Les tirets sont conservés: les groupes de consolidation référencent 'plex-revenu', etc.
+_COLUMN_NAME_TABLE = str.maketrans({' ': '_'})
+
 class DataCleaner:
     """
     Composant spécialisé dans le nettoyage et la validation des données
@@ -50,6 +79,7 @@ class DataCleaner:
         self.cleaning_results = {}
         self.cleaning_stats = {}
         self.validation_rules = self._initialize_validation_rules()
+        self.max_workers = min(4, os.cpu_count() or 1)  # Conversions de colonnes en parallèle
         logger.info("🧹 DataCleaner initialisé")
     
     def clean_data(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -72,8 +102,9 @@ class DataCleaner:
             initial_rows = len(df)
             initial_columns = len(df.columns)
             
-            # Copie des données pour éviter la modification de l'original
-            df_cleaned = df.copy()
+            # Pas de copie défensive: la phase 1 (dropna) produit déjà un nouveau
+            # DataFrame et seules les dimensions initiales sont conservées
+            df_cleaned = df
             
             # === PHASE 1: NETTOYAGE BASIQUE ===
             logger.info("🧹 Phase 1: Nettoyage basique")
@@ -121,6 +152,133 @@ class DataCleaner:
             logger.error(f"❌ Erreur lors du nettoyage: {e}")
             raise
     
+    def clean_csv_streaming(self, input_path: str, output_path: str,
+                            chunksize: int = 100_000, **read_csv_kwargs) -> Dict[str, Any]:
+        """
+        Nettoyage d'un CSV par blocs vers un fichier Parquet (mémoire constante)
+        
+        Seules les étapes locales à une ligne sont appliquées bloc par bloc
+        (lignes vides, noms de colonnes, espaces, types, doublons via une
+        empreinte par ligne); les étapes qui exigent des statistiques globales
+        (imputation médiane, IQR) restent réservées à clean_data.
+        
+        Le schéma Parquet est fixé une fois pour tout le fichier: types des
+        règles métier pour leurs colonnes; pour les autres (lues en str par
+        défaut), float64 si toutes les valeurs du premier bloc sont numériques,
+        texte sinon. Une colonne vide dans le premier bloc reste en texte et
+        n'impose pas un type incompatible avec les blocs suivants; une valeur
+        non numérique d'un bloc suivant dans une colonne numérique devient nulle
+        (signalée dans les logs).
+        
+        Args:
+            input_path: Chemin du CSV source
+            output_path: Chemin du fichier Parquet de sortie
+            chunksize: Nombre de lignes lues par bloc
+            **read_csv_kwargs: Options supplémentaires pour pd.read_csv
+                (un dtype explicite remplace la lecture en texte)
+            
+        Returns:
+            Dict avec les statistiques du nettoyage en flux
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("❌ PyArrow requis pour le nettoyage en flux")
+        
+        logger.info(f"🧹 === NETTOYAGE EN FLUX: {input_path} ({chunksize} lignes/bloc) ===")
+        start_time = datetime.now()
+        
+        writer = None
+        numeric_columns = None
+        seen_hashes = np.empty(0, dtype=np.uint64)
+        rows_read = rows_written = chunks = 0
+        # Colonnes hors règles en texte: aucun type déduit d'un seul bloc
+        read_csv_kwargs.setdefault('dtype', str)
+        
+        try:
+            for chunk in pd.read_csv(input_path, chunksize=chunksize, **read_csv_kwargs):
+                chunks += 1
+                rows_read += len(chunk)
+                chunk = self._clean_chunk(chunk)
+                if numeric_columns is None:
+                    numeric_columns = self._infer_numeric_columns(chunk)
+                chunk = self._apply_numeric_columns(chunk, numeric_columns)
+                
+                # Doublons: au sein du bloc puis par rapport aux blocs déjà écrits
+                if len(chunk):
+                    row_hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy()
+                    _, first_positions = np.unique(row_hashes, return_index=True)
+                    first_positions = np.sort(first_positions)
+                    keep = first_positions[~np.isin(row_hashes[first_positions], seen_hashes)]
+                    chunk = chunk.iloc[keep]
+                    seen_hashes = np.union1d(seen_hashes, row_hashes[keep])
+                
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, self._streaming_schema(table.schema), compression='zstd')
+                writer.write_table(table.cast(writer.schema))
+                rows_written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        self.cleaning_stats = {
+            'initial_rows': rows_read,
+            'final_rows': rows_written,
+            'rows_removed': rows_read - rows_written,
+            'chunks': chunks,
+            'output_path': output_path,
+            'processing_time': (datetime.now() - start_time).total_seconds()
+        }
+        
+        logger.info(f"✅ Nettoyage en flux terminé: {rows_read} → {rows_written} lignes ({chunks} blocs)")
+        return self.cleaning_stats.copy()
+    
+    def _clean_chunk(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Étapes de nettoyage indépendantes des autres blocs"""
+        chunk = self._normalize_column_names(chunk.dropna(how='all'))
+        
+        for col in chunk.select_dtypes(include=['object', 'string']).columns:
+            # Colonnes object mixtes (dtype fourni par l'appelant) laissées intactes
+            if pd.api.types.is_string_dtype(chunk[col]):
+                chunk[col] = chunk[col].str.strip()
+        
+        return self._normalize_data_types(chunk)
+    
+    def _infer_numeric_columns(self, chunk: pd.DataFrame) -> List[str]:
+        """Colonnes texte hors règles métier dont toutes les valeurs du premier bloc sont numériques"""
+        numeric_columns = []
+        for col in chunk.columns:
+            if col in self.validation_rules or not pd.api.types.is_string_dtype(chunk[col]):
+                continue
+            values = chunk[col].dropna()
+            if len(values) and pd.to_numeric(values, errors='coerce').notna().all():
+                numeric_columns.append(col)
+        return numeric_columns
+    
+    @staticmethod
+    def _apply_numeric_columns(chunk: pd.DataFrame, numeric_columns: List[str]) -> pd.DataFrame:
+        """Conversion en float64 des colonnes déduites du premier bloc (même schéma pour chaque bloc)"""
+        for col in numeric_columns:
+            converted = pd.to_numeric(chunk[col], errors='coerce').astype(np.float64)
+            lost = int(converted.isna().sum() - chunk[col].isna().sum())
+            if lost:
+                logger.warning("⚠️ %s valeur(s) non numérique(s) ignorée(s) dans la colonne %s", lost, col)
+            chunk[col] = converted
+        return chunk
+    
+    def _streaming_schema(self, chunk_schema: 'pa.Schema') -> 'pa.Schema':
+        """Schéma du fichier en flux: type fixe par règle métier, type lu pour les autres colonnes"""
+        rule_types = {
+            'numeric': pa.float64(),
+            'integer': pa.int64(),
+            'datetime': pa.timestamp('ns'),
+            'categorical': pa.string()
+        }
+        fields = []
+        for field in chunk_schema:
+            data_type = self.validation_rules.get(field.name, {}).get('data_type')
+            fields.append(field.with_type(rule_types.get(data_type, field.type)))
+        return pa.schema(fields)
+    
     def _initialize_validation_rules(self) -> Dict[str, Any]:
         """Initialisation des règles de validation métier"""
         return {
@@ -186,7 +344,7 @@ class DataCleaner:
                 logger.info(f"🗑️ {cols_removed} colonnes complètement vides supprimées")
             
             # Nettoyage des noms de colonnes
-            df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+            df = self._normalize_column_names(df)
             
             # Suppression des espaces en début/fin des valeurs string
             for col in df.select_dtypes(include=['object']).columns:
@@ -205,13 +363,28 @@ class DataCleaner:
             self.cleaning_results['basic_cleaning'] = {'success': False, 'error': str(e)}
             return df
     
+    def _normalize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Noms de colonnes en snake_case, homonymes fusionnés à la source"""
+        df.columns = [str(col).strip().lower().translate(_COLUMN_NAME_TABLE) for col in df.columns]
+        
+        # La normalisation peut créer des homonymes ('Price ' et 'price')
+        duplicated_columns = df.columns.duplicated(keep='first')
+        if duplicated_columns.any():
+            logger.warning(f"⚠️ Colonnes en double après normalisation (première conservée): {df.columns[duplicated_columns].unique().tolist()}")
+            df = df.loc[:, ~duplicated_columns]
+        return df
+    
     def _handle_missing_values(self, df: pd.DataFrame) -> pd.DataFrame:
         """Gestion des valeurs manquantes"""
         try:
             missing_stats = {}
+            median_columns = []
+            
+            # Un seul comptage pour toutes les colonnes, sans masque booléen N x M
+            missing_counts = pd.Series(count_nulls(df), index=df.columns)
             
             for col in df.columns:
-                missing_count = df[col].isna().sum()
+                missing_count = missing_counts[col]
                 if missing_count > 0:
                     missing_percentage = (missing_count / len(df)) * 100
                     missing_stats[col] = {
@@ -224,17 +397,22 @@ class DataCleaner:
                         rule = self.validation_rules[col]
                         if rule['required'] and missing_percentage > 50:
                             # Trop de valeurs manquantes pour une colonne requise
-                            logger.warning(f"⚠️ Trop de valeurs manquantes pour {col}: {missing_percentage:.1f}%")
+                            logger.warning("⚠️ Trop de valeurs manquantes pour %s: %.1f%%", col, missing_percentage)
                         elif rule['data_type'] == 'numeric':
-                            # Imputation par la médiane pour les numériques
-                            median_value = df[col].median()
-                            df[col] = df[col].fillna(median_value)
-                            logger.info(f"🔢 Imputation médiane pour {col}: {median_value}")
+                            # Imputation par la médiane, regroupée après la boucle
+                            median_columns.append(col)
                         elif rule['data_type'] == 'categorical':
                             # Imputation par le mode pour les catégorielles
                             mode_value = df[col].mode().iloc[0] if not df[col].mode().empty else 'Unknown'
                             df[col] = df[col].fillna(mode_value)
-                            logger.info(f"🏷️ Imputation mode pour {col}: {mode_value}")
+                            logger.info("🏷️ Imputation mode pour %s: %s", col, mode_value)
+            
+            # Imputation médiane en un seul appel vectorisé
+            if median_columns:
+                medians = df[median_columns].median(numeric_only=True)
+                df[median_columns] = df[median_columns].fillna(medians)
+                for col, median_value in medians.items():
+                    logger.info("🔢 Imputation médiane pour %s: %s", col, median_value)
             
             self.cleaning_results['missing_values'] = {
                 'missing_stats': missing_stats,
@@ -267,13 +445,17 @@ class DataCleaner:
                         df.loc[df[col] > rule['max_value'], col] = rule['max_value']
                     
                     # Détection statistique des outliers (méthode IQR)
-                    Q1 = df[col].quantile(0.25)
-                    Q3 = df[col].quantile(0.75)
-                    IQR = Q3 - Q1
-                    lower_bound = Q1 - 1.5 * IQR
-                    upper_bound = Q3 + 1.5 * IQR
-                    
-                    outliers_iqr = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
+                    # Quartiles en un seul np.percentile sur les valeurs non nulles
+                    values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                    values = values[~np.isnan(values)]
+                    if values.size > 0:
+                        Q1, Q3 = np.percentile(values, [25, 75])
+                        IQR = Q3 - Q1
+                        lower_bound = Q1 - 1.5 * IQR
+                        upper_bound = Q3 + 1.5 * IQR
+                        outliers_iqr = int(np.count_nonzero((values < lower_bound) | (values > upper_bound)))
+                    else:
+                        outliers_iqr = 0
                     
                     outlier_stats[col] = {
                         'outliers_below_limit': outliers_below if 'min_value' in rule else 0,
@@ -283,7 +465,7 @@ class DataCleaner:
                     }
                     
                     if outlier_stats[col]['total_outliers'] > 0:
-                        logger.info(f"🔍 Outliers détectés pour {col}: {outlier_stats[col]['total_outliers']}")
+                        logger.info("🔍 Outliers détectés pour %s: %s", col, outlier_stats[col]['total_outliers'])
             
             self.cleaning_results['outliers'] = {
                 'outlier_stats': outlier_stats,
@@ -297,36 +479,62 @@ class DataCleaner:
             self.cleaning_results['outliers'] = {'success': False, 'error': str(e)}
             return df
     
+    def _convert_column(self, series: pd.Series, data_type: str) -> pd.Series:
+        """Conversion d'une colonne selon le type de sa règle métier"""
+        # Les colonnes déjà typées ne repassent pas par to_numeric
+        already_numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        if data_type == 'numeric':
+            return series if already_numeric else pd.to_numeric(series, errors='coerce')
+        if data_type == 'integer':
+            # Entier nullable: pas de float64 + NaN pour un champ entier partiellement rempli
+            if series.dtype == 'Int64':
+                return series
+            numeric = series if already_numeric else pd.to_numeric(series, errors='coerce')
+            # Int64 fixe: même dtype quel que soit le bloc (les valeurs fractionnaires
+            # ne sont pas arrondies, la conversion échoue et la colonne est conservée)
+            return numeric.astype('Int64')
+        if data_type == 'datetime':
+            return parse_datetime_column(series)
+        if data_type == 'categorical':
+            return series.astype('category')
+        return series
+    
     def _normalize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Normalisation des types de données"""
         try:
             type_changes = {}
-            
-            for col in df.columns:
-                if col in self.validation_rules:
-                    rule = self.validation_rules[col]
-                    current_type = str(df[col].dtype)
-                    
-                    try:
-                        if rule['data_type'] == 'numeric':
-                            df[col] = pd.to_numeric(df[col], errors='coerce')
-                        elif rule['data_type'] == 'integer':
-                            df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-                        elif rule['data_type'] == 'datetime':
-                            df[col] = pd.to_datetime(df[col], errors='coerce')
-                        elif rule['data_type'] == 'categorical':
-                            df[col] = df[col].astype('category')
-                        
-                        new_type = str(df[col].dtype)
-                        if current_type != new_type:
-                            type_changes[col] = {
-                                'from': current_type,
-                                'to': new_type
-                            }
-                            logger.info(f"🔄 Type changé pour {col}: {current_type} → {new_type}")
-                    
-                    except Exception as e:
-                        logger.warning(f"⚠️ Impossible de convertir {col} en {rule['data_type']}: {e}")
+            rule_columns = [col for col in df.columns if col in self.validation_rules]
+            
+            # Les colonnes sont indépendantes: conversions réparties sur un pool de
+            # threads (to_numeric/to_datetime travaillent sur des tableaux NumPy)
+            def _convert(col: str):
+                try:
+                    return col, self._convert_column(df[col], self.validation_rules[col]['data_type']), None
+                except Exception as e:
+                    return col, None, e
+            
+            workers = min(self.max_workers, len(rule_columns))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    conversions = list(executor.map(_convert, rule_columns))
+            else:
+                conversions = [_convert(col) for col in rule_columns]
+            
+            for col, converted, error in conversions:
+                rule = self.validation_rules[col]
+                if error is not None:
+                    logger.warning("⚠️ Impossible de convertir %s en %s: %s", col, rule['data_type'], error)
+                    continue
+                
+                current_type = str(df[col].dtype)
+                df[col] = converted
+                new_type = str(converted.dtype)
+                if current_type != new_type:
+                    type_changes[col] = {
+                        'from': current_type,
+                        'to': new_type
+                    }
+                    logger.info("🔄 Type changé pour %s: %s → %s", col, current_type, new_type)
             
             # Normalisation spéciale pour les types de propriétés
             if 'type' in df.columns:
@@ -396,7 +604,7 @@ class DataCleaner:
                     
                     if violations:
                         business_rule_violations[col] = violations
-                        logger.warning(f"⚠️ Violations des règles métier pour {col}: {violations}")
+                        logger.warning("⚠️ Violations des règles métier pour %s: %s", col, violations)
             
             self.cleaning_results['business_rules'] = {
                 'violations': business_rule_violations,
@@ -415,7 +623,7 @@ class DataCleaner:
         try:
             # Suppression des doublons
             initial_rows = len(df)
-            df = df.drop_duplicates()
+            df = self._drop_duplicate_rows(df)
             duplicates_removed = initial_rows - len(df)
             if duplicates_removed > 0:
                 logger.info(f"🗑️ {duplicates_removed} doublons supprimés")
@@ -438,28 +646,53 @@ class DataCleaner:
             self.cleaning_results['final_cleaning'] = {'success': False, 'error': str(e)}
             return df
     
+    def _drop_duplicate_rows(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Suppression des doublons via une empreinte uint64 par ligne
+        
+        Un seul hachage vectorisé de toutes les colonnes isole les lignes dont
+        l'empreinte est partagée; l'égalité réelle n'est vérifiée (duplicated)
+        que sur ces candidates, ce qui écarte les collisions et les valeurs
+        distinctes de même texte (1 et "1" dans une colonne object)
+        """
+        if df.empty:
+            return df
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        except TypeError as e:
+            logger.warning(f"⚠️ Hachage des lignes impossible, repli sur duplicated(): {e}")
+            duplicated_rows = df.duplicated(keep='first')
+            # Masque booléen seul; aucune copie du DataFrame s'il n'y a pas de doublon
+            return df.loc[~duplicated_rows] if duplicated_rows.any() else df
+        
+        _, inverse, counts = np.unique(row_hashes, return_inverse=True, return_counts=True)
+        candidates = np.flatnonzero(counts[inverse] > 1)
+        if candidates.size == 0:
+            return df
+        
+        duplicated_rows = df.iloc[candidates].duplicated(keep='first').to_numpy()
+        if not duplicated_rows.any():
+            return df
+        keep = np.ones(len(df), dtype=bool)
+        keep[candidates[duplicated_rows]] = False
+        return df.iloc[np.flatnonzero(keep)]
+    
     def _optimize_data_types(self, df: pd.DataFrame) -> pd.DataFrame:
         """Optimisation des types de données pour la mémoire"""
         try:
-            for col in df.columns:
-                # Optimisation des entiers
-                if df[col].dtype == 'int64':
-                    col_min, col_max = df[col].min(), df[col].max()
-                    if col_min >= np.iinfo(np.int8).min and col_max <= np.iinfo(np.int8).max:
-                        df[col] = df[col].astype(np.int8)
-                    elif col_min >= np.iinfo(np.int16).min and col_max <= np.iinfo(np.int16).max:
-                        df[col] = df[col].astype(np.int16)
-                    elif col_min >= np.iinfo(np.int32).min and col_max <= np.iinfo(np.int32).max:
-                        df[col] = df[col].astype(np.int32)
-                
-                # Optimisation des flottants
-                elif df[col].dtype == 'float64':
-                    if df[col].isna().sum() == 0:  # Pas de valeurs manquantes
-                        df[col] = df[col].astype(np.float32)
-                
-                # Optimisation des catégorielles
-                elif df[col].dtype == 'object':
-                    if df[col].nunique() / len(df) < 0.5:  # Moins de 50% de valeurs uniques
+            # Optimisation des entiers (y compris Int64 nullable)
+            for col in df.select_dtypes(include=['integer']).columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+            
+            # Optimisation des flottants (float32 seulement si l'aller-retour est exact, NaN compris)
+            for col in df.select_dtypes(include=['floating']).columns:
+                df[col] = downcast_float_lossless(df[col])
+            
+            # Optimisation des catégorielles: dictionnaire + codes int8/int16
+            # ('string' couvre le dtype texte par défaut de pandas 3)
+            if len(df):
+                for col in df.select_dtypes(include=['object', 'string']).columns:
+                    if df[col].nunique(dropna=False) / len(df) < 0.5:  # Moins de 50% de valeurs uniques
                         df[col] = df[col].astype('category')
             
             return df
@@ -490,7 +723,9 @@ class DataCleaner:
             quality_scores = {}
             
             # Complétude
-            completeness = 1 - (df.isna().sum().sum() / (len(df) * len(df.columns)))
+            total_cells = df.size
+            null_cells = int(count_nulls(df).sum())
+            completeness = 1 - (null_cells / total_cells) if total_cells else 0.0
             quality_scores['completeness'] = round(completeness, 3)
             
             # Cohérence des types
@@ -49,9 +49,17 @@ except ImportError:
             def __init__(self):
                 pass
 
+try:
+    from ...utils.jit_kernels import first_non_nan
+except ImportError:
+    from utils.jit_kernels import first_non_nan
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Unités datetime de la plus grossière à la plus fine
+_DATETIME_UNITS = ('s', 'ms', 'us', 'ns')
+
 class DataConsolidator:
     """
     Composant spécialisé dans la consolidation des variables similaires
@@ -92,19 +100,28 @@ class DataConsolidator:
             
             # Application de la consolidation par groupe
             df_consolidated = df.copy()
+            columns_to_remove = []
+            # Sources déjà consommées par un groupe qui les supprime: suppression différée
+            # en un seul drop, mais jamais réutilisées par un groupe suivant
+            consumed_columns = set()
             
             for group_name, group in self.config.consolidation_groups.items():
                 logger.info(f"🔗 Consolidation du groupe: {group_name}")
                 
                 # Vérification de la disponibilité des colonnes sources
-                available_columns = [col for col in group.source_columns if col in df.columns]
+                available_columns = [col for col in group.source_columns
+                                     if col in df.columns and col not in consumed_columns]
+                
+                reused_columns = [col for col in group.source_columns if col in consumed_columns]
+                if reused_columns:
+                    logger.info(f"ℹ️ Colonnes déjà consolidées ignorées pour {group_name}: {reused_columns}")
                 
                 if not available_columns:
                     logger.warning(f"⚠️ Aucune colonne source disponible pour le groupe {group_name}")
                     continue
                 
-                if len(available_columns) < len(group.source_columns):
-                    missing_columns = set(group.source_columns) - set(available_columns)
+                missing_columns = set(group.source_columns) - set(available_columns) - consumed_columns
+                if missing_columns:
                     logger.warning(f"⚠️ Colonnes manquantes pour {group_name}: {missing_columns}")
                 
                 # Consolidation du groupe
@@ -118,10 +135,10 @@ class DataConsolidator:
                     # Ajout de la colonne consolidée
                     df_consolidated[group.target_column] = consolidated_column
                     
-                    # Suppression des colonnes sources si demandé
+                    # Suppression des colonnes sources si demandé (différée, un seul drop)
                     if group.remove_source_columns:
-                        df_consolidated = df_consolidated.drop(columns=available_columns)
-                        logger.info(f"🗑️ Colonnes sources supprimées: {available_columns}")
+                        columns_to_remove.extend(available_columns)
+                        consumed_columns.update(available_columns)
                     
                     # Enregistrement des résultats
                     self.consolidation_results[group_name] = {
@@ -141,6 +158,13 @@ class DataConsolidator:
                         'success': False
                     }
             
+            # Suppression groupée des colonnes sources (une seule copie du DataFrame)
+            target_columns = {group.target_column for group in self.config.consolidation_groups.values()}
+            columns_to_remove = [col for col in dict.fromkeys(columns_to_remove) if col not in target_columns]
+            if columns_to_remove:
+                df_consolidated = df_consolidated.drop(columns=columns_to_remove, errors='ignore')
+                logger.info(f"🗑️ Colonnes sources supprimées: {len(columns_to_remove)}")
+            
             # Statistiques de consolidation
             final_columns = len(df_consolidated.columns)
             self.consolidation_stats = {
@@ -207,6 +231,105 @@ class DataConsolidator:
             logger.error(f"❌ Erreur consolidation groupe {group.name}: {e}")
             return None
     
+    @staticmethod
+    def _first_valid(data: pd.DataFrame) -> pd.Series:
+        """
+        Première valeur non nulle de chaque ligne, de gauche à droite
+        
+        Remplissage arrière vectorisé sur l'axe des colonnes au lieu d'un
+        apply ligne par ligne en Python
+        
+        Args:
+            data: Données du groupe (colonnes dans l'ordre de priorité)
+            
+        Returns:
+            Série consolidée (NaN/NaT si aucune valeur valide)
+        """
+        if data.shape[1] == 0:
+            return pd.Series(np.nan, index=data.index)
+        return data.bfill(axis=1).iloc[:, 0]
+    
+    @classmethod
+    def _first_valid_numeric(cls, data: pd.DataFrame) -> pd.Series:
+        """
+        Première valeur non nulle de chaque ligne pour un groupe numérique
+        
+        Groupes entiers: coalescence exacte en int64 (aucun passage par float64),
+        dtype commun conservé; autres groupes: matrice float64 parcourue en une
+        passe (noyau Numba parallèle si disponible, NumPy sinon)
+        
+        Args:
+            data: Colonnes numériques du groupe (dans l'ordre de priorité)
+            
+        Returns:
+            Série consolidée (NaN/<NA> si aucune valeur valide)
+        """
+        if data.shape[1] == 0:
+            return cls._first_valid(data)
+        
+        dtypes = data.dtypes
+        if all(pd.api.types.is_integer_dtype(dtype) for dtype in dtypes):
+            if all(isinstance(dtype, np.dtype) for dtype in dtypes):
+                # Entiers NumPy: aucune valeur manquante, la première colonne l'emporte
+                return data.iloc[:, 0]
+            valid = data.notna().to_numpy()
+            values = data.to_numpy(dtype=np.int64, na_value=0)
+            rows = np.arange(len(data))
+            first = valid.argmax(axis=1)
+            result = pd.Series(
+                pd.arrays.IntegerArray(values[rows, first], ~valid[rows, first]),
+                index=data.index
+            )
+            return result.astype(dtypes.iloc[0]) if dtypes.nunique() == 1 else result
+        
+        matrix = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        return pd.Series(first_non_nan(matrix), index=data.index)
+    
+    @staticmethod
+    def _datetime_extreme(data: pd.DataFrame, latest: bool = True) -> pd.Series:
+        """
+        Date la plus récente (ou la plus ancienne) par ligne, NaT ignorés
+        
+        Les colonnes sont empilées en une matrice int64 (époque UTC dans leur unité)
+        réduite en une seule passe NumPy. Des colonnes d'unités ou de fuseaux
+        différents sont d'abord ramenées à l'unité la plus fine et au fuseau de la
+        première colonne qui en a un (les dates naïves y sont localisées)
+        
+        Args:
+            data: Colonnes datetime du groupe
+            latest: True pour la plus récente, False pour la plus ancienne
+            
+        Returns:
+            Série du dtype des colonnes, unité et fuseau compris (NaT si aucune date valide)
+        """
+        if data.shape[1] == 0:
+            return pd.Series(pd.NaT, index=data.index, dtype='datetime64[ns]')
+        
+        columns = [data.iloc[:, i] for i in range(data.shape[1])]
+        if len({col.dtype for col in columns}) > 1:
+            unit = max((col.dt.unit for col in columns), key=_DATETIME_UNITS.index)
+            tz = next((col.dt.tz for col in columns if col.dt.tz is not None), None)
+            columns = [col.dt.as_unit(unit) for col in columns]
+            if tz is not None:
+                columns = [col.dt.tz_localize(tz) if col.dt.tz is None else col.dt.tz_convert(tz)
+                           for col in columns]
+        unit, tz = columns[0].dt.unit, columns[0].dt.tz
+        
+        nat = np.iinfo(np.int64).min  # Représentation entière de NaT
+        matrix = np.stack([col.array.asi8 for col in columns], axis=1)
+        if latest:
+            # NaT est le plus petit int64: le max l'ignore naturellement
+            result = matrix.max(axis=1)
+        else:
+            valid = matrix != nat
+            result = np.where(valid, matrix, np.iinfo(np.int64).max).min(axis=1)
+            result[~valid.any(axis=1)] = nat
+        
+        consolidated = pd.Series(result.view(f'datetime64[{unit}]'), index=data.index)
+        if tz is not None:
+            consolidated = consolidated.dt.tz_localize('UTC').dt.tz_convert(tz)
+        return consolidated
+    
     def _consolidate_numeric_group(self, data: pd.DataFrame, group: ConsolidationGroup) -> pd.Series:
         """
         Consolidation d'un groupe de variables numériques
@@ -234,10 +357,10 @@ class DataConsolidator:
             elif group.consolidation_strategy == 'min':
                 consolidated = numeric_data.min(axis=1)
             elif group.consolidation_strategy == 'first_valid':
-                consolidated = numeric_data.apply(lambda x: x.dropna().iloc[0] if not x.dropna().empty else np.nan, axis=1)
+                consolidated = self._first_valid_numeric(numeric_data)
             else:
                 # Stratégie par défaut: première valeur valide
-                consolidated = numeric_data.apply(lambda x: x.dropna().iloc[0] if not x.dropna().empty else np.nan, axis=1)
+                consolidated = self._first_valid_numeric(numeric_data)
             
             # Application des transformations post-consolidation
             if group.post_processing:
@@ -266,14 +389,14 @@ class DataConsolidator:
             
             # Application de la stratégie de consolidation
             if group.consolidation_strategy == 'first_valid':
-                consolidated = string_data.apply(lambda x: x[x != 'nan'].iloc[0] if not (x == 'nan').all() else np.nan, axis=1)
+                consolidated = self._first_valid(string_data.where(string_data != 'nan'))
             elif group.consolidation_strategy == 'most_frequent':
                 consolidated = string_data.apply(lambda x: x.mode().iloc[0] if not x.mode().empty else np.nan, axis=1)
             elif group.consolidation_strategy == 'concatenate':
                 consolidated = string_data.apply(lambda x: ' | '.join(x[x != 'nan']), axis=1)
             else:
                 # Stratégie par défaut: première valeur valide
-                consolidated = string_data.apply(lambda x: x[x != 'nan'].iloc[0] if not (x == 'nan').all() else np.nan, axis=1)
+                consolidated = self._first_valid(string_data.where(string_data != 'nan'))
             
             # Application des transformations post-consolidation
             if group.post_processing:
@@ -298,18 +421,20 @@ class DataConsolidator:
         """
         try:
             # Conversion en datetime
-            datetime_data = data.apply(pd.to_datetime, errors='coerce')
+            datetime_data = data.apply(
+                lambda col: col if pd.api.types.is_datetime64_any_dtype(col) else pd.to_datetime(col, errors='coerce')
+            )
             
             # Application de la stratégie de consolidation
             if group.consolidation_strategy == 'latest':
-                consolidated = datetime_data.max(axis=1)
+                consolidated = self._datetime_extreme(datetime_data, latest=True)
             elif group.consolidation_strategy == 'earliest':
-                consolidated = datetime_data.min(axis=1)
+                consolidated = self._datetime_extreme(datetime_data, latest=False)
             elif group.consolidation_strategy == 'first_valid':
-                consolidated = datetime_data.apply(lambda x: x.dropna().iloc[0] if not x.dropna().empty else pd.NaT, axis=1)
+                consolidated = self._first_valid(datetime_data)
             else:
                 # Stratégie par défaut: première valeur valide
-                consolidated = datetime_data.apply(lambda x: x.dropna().iloc[0] if not x.dropna().empty else pd.NaT, axis=1)
+                consolidated = self._first_valid(datetime_data)
             
             return consolidated
             
@@ -463,7 +588,7 @@ class DataConsolidator:
                 return 0.0
             
             # Métriques de qualité
-            completeness = 1 - (series.isna().sum() / len(series))
+            completeness = series.count() / len(series)
             uniqueness = 1 - (series.nunique() / len(series)) if len(series) > 0 else 0
             consistency = 1.0  # À améliorer selon les besoins
             
@@ -14,7 +14,6 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 import warnings
 from datetime import datetime
-import math
 
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
@@ -29,6 +28,7 @@ class DataEnricher:
         """Initialise l'enricheur de données"""
         self.enrichment_results = {}
         self.enrichment_stats = {}
+        self._current_year = datetime.now().year
         self.metric_calculators = self._initialize_metric_calculators()
         logger.info("🚀 DataEnricher initialisé")
     
@@ -50,6 +50,8 @@ class DataEnricher:
             
             start_time = datetime.now()
             initial_columns = len(df.columns)
+            # Année de référence figée pour toute l'exécution (âge et tendance cohérents)
+            self._current_year = start_time.year
             
             # Copie des données pour éviter la modification de l'original
             df_enriched = df.copy()
@@ -74,6 +76,9 @@ class DataEnricher:
             logger.info("🚀 Phase 5: Métriques dérivées")
             df_enriched = self._calculate_derived_metrics(df_enriched)
             
+            # Libellés générés à faible cardinalité -> category
+            df_enriched = self._categorize_label_columns(df_enriched)
+            
             # Statistiques d'enrichissement
             final_columns = len(df_enriched.columns)
             self.enrichment_stats = {
@@ -94,6 +99,16 @@ class DataEnricher:
             logger.error(f"❌ Erreur lors de l'enrichissement: {e}")
             raise
     
+    # Colonnes de libellés produites par l'enrichissement (quelques valeurs distinctes)
+    LABEL_COLUMNS = ('region', 'property_category', 'investor_type', 'trend_indicator')
+    
+    def _categorize_label_columns(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convertit les libellés générés en category (mémoire, groupby et exports)"""
+        for col in self.LABEL_COLUMNS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+    
     def _initialize_metric_calculators(self) -> Dict[str, Any]:
         """Initialisation des calculateurs de métriques"""
         return {
@@ -107,14 +122,12 @@ class DataEnricher:
     def _calculate_financial_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calcul des métriques financières"""
         try:
-            # Prix au m²
+            # Prix au m² et ratio prix/surface: une seule division, deux arrondis
             if 'price' in df.columns and 'surface' in df.columns:
-                df['price_per_sqm'] = (df['price'] / df['surface']).round(2)
+                price_per_surface = df['price'] / df['surface']
+                df['price_per_sqm'] = price_per_surface.round(2)
                 logger.info("💰 Prix au m² calculé")
-            
-            # Ratio prix/surface
-            if 'price' in df.columns and 'surface' in df.columns:
-                df['price_surface_ratio'] = (df['price'] / df['surface']).round(4)
+                df['price_surface_ratio'] = price_per_surface.round(4)
                 logger.info("📊 Ratio prix/surface calculé")
             
             # Catégorisation des prix
@@ -129,8 +142,9 @@ class DataEnricher:
             
             # ROI estimé (basé sur des hypothèses)
             if 'price' in df.columns and 'year_built' in df.columns:
-                current_year = datetime.now().year
-                df['age'] = current_year - df['year_built']
+                age = self._current_year - pd.to_numeric(df['year_built'], errors='coerce')
+                # int16 suffit pour un âge; float32 si des années manquent (NaN)
+                df['age'] = age.astype(np.int16) if age.notna().all() else age.astype(np.float32)
                 df['roi_estimate'] = self._estimate_roi(df['price'], df['age'])
                 logger.info("📈 ROI estimé calculé")
             
@@ -159,7 +173,7 @@ class DataEnricher:
                     'Gatineau': 800,
                     'Sherbrooke': 900
                 }
-                df['city_density'] = df['city'].map(city_density)
+                df['city_density'] = df['city'].map(city_density).astype(float)
                 logger.info("🌍 Densité de population ajoutée")
             
             # Région administrative
@@ -185,12 +199,20 @@ class DataEnricher:
                     'Laval': (45.5698, -73.7241)
                 }
                 
-                df['distance_to_center'] = df.apply(
-                    lambda row: self._calculate_distance(
-                        row['latitude'], row['longitude'],
-                        city_centers.get(row.get('city', 'Montréal'), (45.5017, -73.5673))
-                    ) if pd.notna(row.get('latitude')) and pd.notna(row.get('longitude')) else np.nan,
-                    axis=1
+                # Centre de référence par ligne (Montréal par défaut), puis Haversine vectorisé
+                default_center = city_centers['Montréal']
+                if 'city' in df.columns:
+                    # astype(float): city peut être catégorielle après le nettoyage
+                    center_lat = df['city'].map({city: lat for city, (lat, _) in city_centers.items()}).astype(float).fillna(default_center[0])
+                    center_lon = df['city'].map({city: lon for city, (_, lon) in city_centers.items()}).astype(float).fillna(default_center[1])
+                else:
+                    center_lat, center_lon = default_center
+                
+                df['distance_to_center'] = self._calculate_distance(
+                    pd.to_numeric(df['latitude'], errors='coerce').to_numpy(dtype=np.float64),
+                    pd.to_numeric(df['longitude'], errors='coerce').to_numpy(dtype=np.float64),
+                    np.asarray(center_lat, dtype=np.float64),
+                    np.asarray(center_lon, dtype=np.float64)
                 )
                 logger.info("📍 Distances au centre-ville calculées")
             
@@ -262,7 +284,7 @@ class DataEnricher:
             # Indicateur de bon rapport qualité-prix
             if 'price_per_sqm' in df.columns:
                 median_price_sqm = df['price_per_sqm'].median()
-                df['good_value_indicator'] = (df['price_per_sqm'] < median_price_sqm).astype(int)
+                df['good_value_indicator'] = (df['price_per_sqm'] < median_price_sqm).astype(np.int8)
                 logger.info("💎 Indicateurs de bon rapport qualité-prix créés")
             
             self.enrichment_results['opportunity_metrics'] = {
@@ -316,8 +338,11 @@ class DataEnricher:
             
             # Catégorisation par investisseur
             if 'opportunity_score' in df.columns:
-                df['investor_type'] = df['opportunity_score'].apply(
-                    lambda x: 'Conservateur' if x < 0.4 else 'Modéré' if x < 0.7 else 'Agressif'
+                opportunity_score = df['opportunity_score']
+                df['investor_type'] = np.select(
+                    [opportunity_score < 0.4, opportunity_score < 0.7],
+                    ['Conservateur', 'Modéré'],
+                    default='Agressif'
                 )
                 logger.info("👥 Types d'investisseurs définis")
             
@@ -371,9 +396,11 @@ class DataEnricher:
             
             # Indicateur de tendance
             if 'year_built' in df.columns:
-                current_year = datetime.now().year
-                df['trend_indicator'] = df['year_built'].apply(
-                    lambda x: 'Moderne' if x >= 2000 else 'Récent' if x >= 1980 else 'Classique' if x >= 1960 else 'Ancien'
+                year_built = pd.to_numeric(df['year_built'], errors='coerce')
+                df['trend_indicator'] = np.select(
+                    [year_built >= 2000, year_built >= 1980, year_built >= 1960],
+                    ['Moderne', 'Récent', 'Classique'],
+                    default='Ancien'
                 )
                 logger.info("📈 Indicateurs de tendance créés")
             
@@ -397,34 +424,40 @@ class DataEnricher:
             
             # Appréciation annuelle estimée (2-5% selon l'âge)
             appreciation_rate = np.where(age < 10, 0.05, np.where(age < 25, 0.03, 0.02))
-            annual_appreciation = price * appreciation_rate
             
             # Revenus locatifs estimés (4-6% du prix)
             rental_rate = np.where(age < 15, 0.06, 0.04)
-            annual_rental = price * rental_rate
             
-            # ROI total
-            total_roi = (annual_appreciation + annual_rental) / price
+            # ROI total: (prix × taux) / prix se simplifie en somme des taux,
+            # indéfini (NaN) lorsque le prix est manquant, nul ou infini
+            price_values = pd.to_numeric(price, errors='coerce').to_numpy(dtype=np.float64)
+            valid_price = np.isfinite(price_values) & (price_values != 0)
+            total_roi = np.where(valid_price, appreciation_rate + rental_rate, np.nan)
             
-            return total_roi.round(3)
+            return pd.Series(total_roi, index=price.index).round(3)
             
         except Exception as e:
             logger.error(f"❌ Erreur calcul ROI: {e}")
             return pd.Series([0.05] * len(price))  # ROI par défaut 5%
     
-    def _calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calcul de la distance entre deux points géographiques (formule de Haversine)"""
+    def _calculate_distance(self, lat1, lon1, lat2, lon2):
+        """
+        Distance en km entre deux points géographiques (formule de Haversine)
+        
+        Accepte des scalaires ou des tableaux NumPy (calcul vectorisé);
+        les coordonnées manquantes donnent NaN
+        """
         try:
             # Conversion en radians
-            lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+            lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
             
             # Différences
             dlat = lat2 - lat1
             dlon = lon2 - lon1
             
             # Formule de Haversine
-            a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-            c = 2 * math.asin(math.sqrt(a))
+            a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+            c = 2 * np.arcsin(np.sqrt(a))
             
             # Rayon de la Terre en km
             r = 6371
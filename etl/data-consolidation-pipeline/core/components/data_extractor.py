@@ -5,7 +5,7 @@
 ==================================================
 
 Module spécialisé dans l'extraction de données depuis différentes sources
-(MongoDB, CSV, JSON, etc.) avec gestion d'erreurs et validation
+(MongoDB, CSV, Parquet, JSON, etc.) avec gestion d'erreurs et validation
 """
 
 import pandas as pd
@@ -17,6 +17,13 @@ import json
 import os
 import numpy as np
 
+# Lecteurs CSV multi-thread et Parquet de PyArrow (optionnel)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Imports des utilitaires (avec gestion d'erreur pour compatibilité)
 try:
     from ...utils.db import read_mongodb_to_dataframe, get_mongodb_stats
@@ -47,7 +54,7 @@ logger = logging.getLogger(__name__)
 class DataExtractor:
     """
     Composant spécialisé dans l'extraction de données
-    Supporte MongoDB, CSV, JSON et datasets de test
+    Supporte MongoDB, CSV, Parquet, JSON et datasets de test
     """
     
     def __init__(self):
@@ -61,7 +68,7 @@ class DataExtractor:
         Point d'entrée principal pour l'extraction de données
         
         Args:
-            input_source: Source des données ("mongodb", "csv", "json", "test")
+            input_source: Source des données ("mongodb", "csv", "parquet", "json", "test")
             input_config: Configuration d'entrée spécifique à la source
             
         Returns:
@@ -74,6 +81,8 @@ class DataExtractor:
                 df = self._extract_from_mongodb(input_config)
             elif input_source == "csv":
                 df = self._extract_from_csv(input_config)
+            elif input_source == "parquet":
+                df = self._extract_from_parquet(input_config)
             elif input_source == "json":
                 df = self._extract_from_json(input_config)
             elif input_source == "test":
@@ -84,6 +93,12 @@ class DataExtractor:
             if df is None or df.empty:
                 raise ValueError("❌ Aucune donnée extraite")
             
+            # Colonnes homonymes: df[col] renverrait un DataFrame dans les étapes suivantes
+            duplicated_columns = df.columns.duplicated(keep='first')
+            if duplicated_columns.any():
+                logger.warning(f"⚠️ Colonnes en double fusionnées (première conservée): {df.columns[duplicated_columns].unique().tolist()}")
+                df = df.loc[:, ~duplicated_columns]
+            
             # Statistiques d'extraction
             self.extraction_stats = {
                 'source': input_source,
@@ -153,7 +168,7 @@ class DataExtractor:
         Extraction depuis un fichier CSV
         
         Args:
-            input_config: Configuration CSV (file_path, encoding, separator)
+            input_config: Configuration CSV (file_path, encoding, separator, usecols)
             
         Returns:
             DataFrame avec les données CSV
@@ -173,13 +188,32 @@ class DataExtractor:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"❌ Fichier CSV introuvable: {file_path}")
             
-            # Lecture du CSV
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                sep=separator,
-                low_memory=False
-            )
+            # Projection optionnelle: les colonnes non listées ne sont jamais matérialisées
+            usecols = input_config.get('usecols')
+            
+            # Lecture du CSV (moteur PyArrow multi-thread, repli sur le moteur C)
+            df = None
+            if PYARROW_AVAILABLE:
+                try:
+                    df = pd.read_csv(
+                        file_path,
+                        encoding=encoding,
+                        sep=separator,
+                        usecols=usecols,
+                        engine='pyarrow'
+                    )
+                    logger.info("⚡ CSV lu avec le moteur PyArrow")
+                except Exception as e:
+                    logger.warning(f"⚠️ Moteur PyArrow indisponible pour ce fichier, repli sur le moteur C: {e}")
+            
+            if df is None:
+                df = pd.read_csv(
+                    file_path,
+                    encoding=encoding,
+                    sep=separator,
+                    usecols=usecols,
+                    low_memory=False
+                )
             
             logger.info(f"✅ CSV lu avec succès: {df.shape}")
             return df
@@ -188,6 +222,42 @@ class DataExtractor:
             logger.error(f"❌ Erreur lecture CSV: {e}")
             raise
     
+    def _extract_from_parquet(self, input_config: Dict = None) -> pd.DataFrame:
+        """
+        Extraction depuis un fichier Parquet
+        
+        Les types (dates, entiers, listes, dicts) sont stockés dans le fichier:
+        aucune analyse de texte ni ré-inférence des types, contrairement au CSV
+        
+        Args:
+            input_config: Configuration Parquet (file_path, columns)
+            
+        Returns:
+            DataFrame avec les données Parquet
+        """
+        try:
+            if not input_config or 'file_path' not in input_config:
+                raise ValueError("❌ Chemin du fichier Parquet manquant")
+            
+            file_path = input_config['file_path']
+            logger.info(f"📁 Lecture Parquet: {file_path}")
+            
+            if not os.path.exists(file_path):
+                raise FileNotFoundError(f"❌ Fichier Parquet introuvable: {file_path}")
+            
+            if not PYARROW_AVAILABLE:
+                raise ImportError("❌ PyArrow requis pour lire les fichiers Parquet")
+            
+            # Projection: seules les colonnes demandées sont décompressées
+            df = pd.read_parquet(file_path, engine='pyarrow', columns=input_config.get('columns'))
+            
+            logger.info(f"✅ Parquet lu avec succès: {df.shape}")
+            return df
+            
+        except Exception as e:
+            logger.error(f"❌ Erreur lecture Parquet: {e}")
+            raise
+    
     def _extract_from_json(self, input_config: Dict = None) -> pd.DataFrame:
         """
         Extraction depuis un fichier JSON
@@ -238,18 +308,21 @@ class DataExtractor:
         try:
             logger.info("🧪 Création d'un dataset de test")
             
+            # Générateur local: tirages reproductibles sans modifier l'état global de NumPy
+            rng = np.random.default_rng(42)
+            
             # Données de test réalistes
             test_data = {
                 'id': range(1, 101),
                 'type': ['maison', 'appartement', 'duplex', 'triplex'] * 25,
                 'city': ['Montréal', 'Trois-Rivières', 'Québec', 'Laval'] * 25,
-                'price': np.random.randint(200000, 800000, 100),
-                'surface': np.random.randint(800, 2500, 100),
-                'rooms': np.random.randint(2, 6, 100),
-                'bathrooms': np.random.randint(1, 4, 100),
-                'year_built': np.random.randint(1950, 2024, 100),
-                'latitude': np.random.uniform(45.4, 45.7, 100),
-                'longitude': np.random.uniform(-73.8, -73.5, 100)
+                'price': rng.integers(200000, 800000, 100),
+                'surface': rng.integers(800, 2500, 100),
+                'rooms': rng.integers(2, 6, 100),
+                'bathrooms': rng.integers(1, 4, 100),
+                'year_built': rng.integers(1950, 2024, 100),
+                'latitude': rng.uniform(45.4, 45.7, 100),
+                'longitude': rng.uniform(-73.8, -73.5, 100)
             }
             
             df = pd.DataFrame(test_data)
@@ -14,11 +14,32 @@ import logging
 from typing import Dict, List, Optional, Any, Tuple
 import warnings
 from datetime import datetime
+from bisect import bisect_right
 import json
 
+try:
+    from ...utils.null_utils import count_nulls
+except ImportError:
+    from utils.null_utils import count_nulls
+
+try:
+    from ...utils.jit_kernels import range_counts
+except ImportError:
+    from utils.jit_kernels import range_counts
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Paliers du statut global: bornes inférieures croissantes (>=) et (statut, message) associés
+_STATUS_THRESHOLDS = (0.6, 0.7, 0.8, 0.9)
+_STATUS_LEVELS = (
+    ('FAILED', 'Qualité insuffisante, rejet des données'),
+    ('WARNING', 'Qualité modérée nécessitant des améliorations'),
+    ('WARNING', 'Qualité acceptable avec quelques points d\'attention'),
+    ('PASSED', 'Bonne qualité des données'),
+    ('PASSED', 'Excellente qualité des données'),
+)
+
 class DataValidator:
     """
     Composant spécialisé dans la validation complète des données
@@ -51,13 +72,16 @@ class DataValidator:
             
             start_time = datetime.now()
             
+            # Valeurs manquantes comptées une seule fois pour toutes les phases
+            null_counts = count_nulls(df)
+            
             # === PHASE 1: VALIDATION DE BASE ===
             logger.info("✅ Phase 1: Validation de base")
-            basic_validation = self._validate_basic_data_quality(df)
+            basic_validation = self._validate_basic_data_quality(df, null_counts=null_counts)
             
             # === PHASE 2: VALIDATION DES RÈGLES MÉTIER ===
             logger.info("✅ Phase 2: Validation des règles métier")
-            business_validation = self._validate_business_rules(df)
+            business_validation = self._validate_business_rules(df, basic_validation)
             
             # === PHASE 3: VALIDATION DE LA COHÉRENCE ===
             logger.info("✅ Phase 3: Validation de la cohérence")
@@ -65,7 +89,7 @@ class DataValidator:
             
             # === PHASE 4: VALIDATION DES MÉTRIQUES DE CONSOLIDATION ===
             logger.info("✅ Phase 4: Validation des métriques de consolidation")
-            consolidation_validation = self._validate_consolidation_metrics(df)
+            consolidation_validation = self._validate_consolidation_metrics(df, null_counts=null_counts)
             
             # === PHASE 5: VALIDATION DES DONNÉES ENRICHIES ===
             logger.info("✅ Phase 5: Validation des données enrichies")
@@ -161,16 +185,55 @@ class DataValidator:
             }
         }
     
-    def _validate_basic_data_quality(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _range_violation_counts(self, df: pd.DataFrame) -> Dict[str, Tuple[int, int]]:
+        """
+        Comptes (< min_value, > max_value) de toutes les règles à bornes
+        
+        Chaque colonne ciblée est convertie une fois en float64 puis comptée en
+        une passe. Les valeurs manquantes ou non numériques (NaN) ne sont
+        comptées d'aucun côté
+        
+        Returns:
+            Dict champ -> (nombre < min_value, nombre > max_value)
+        """
+        counts = {}
+        for field, rule in self.business_rules.items():
+            if ('min_value' not in rule and 'max_value' not in rule) or field not in df.columns:
+                continue
+            values = pd.to_numeric(df[field], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            _, below, above = range_counts(values, rule.get('min_value', -np.inf), rule.get('max_value', np.inf))
+            counts[field] = (below, above)
+        return counts
+    
+    @staticmethod
+    def _count_disallowed(series: pd.Series, allowed_values: List[Any]) -> int:
+        """
+        Nombre de valeurs hors de la liste autorisée (valeurs manquantes comprises)
+        
+        Encodage catégoriel sur les valeurs autorisées: code -1 = valeur hors liste.
+        Une colonne déjà catégorielle est seulement recodée (catégories, pas lignes)
+        """
+        codes = pd.Categorical(series, categories=allowed_values).codes
+        return int(np.count_nonzero(codes == -1))
+    
+    @staticmethod
+    def _count_in_range(series: pd.Series, min_value: float, max_value: float) -> int:
+        """Nombre de valeurs numériques dans [min_value, max_value] (NaN exclus)"""
+        values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        n_valid, n_below, n_above = range_counts(values, min_value, max_value)
+        return n_valid - n_below - n_above
+    
+    def _validate_basic_data_quality(self, df: pd.DataFrame, null_counts: np.ndarray = None) -> Dict[str, Any]:
         """Validation de base de la qualité des données"""
         try:
             validation_results = {}
+            if null_counts is None:
+                null_counts = count_nulls(df)
             
             # 1. Complétude des données
             completeness_scores = {}
-            for col in df.columns:
-                missing_count = df[col].isna().sum()
-                total_count = len(df)
+            total_count = len(df)
+            for col, missing_count in zip(df.columns, null_counts.tolist()):
                 completeness = 1 - (missing_count / total_count)
                 completeness_scores[col] = {
                     'score': round(completeness, 3),
@@ -178,7 +241,8 @@ class DataValidator:
                     'missing_percentage': round((missing_count / total_count) * 100, 1)
                 }
             
-            overall_completeness = np.mean([score['score'] for score in completeness_scores.values()])
+            column_scores = [score['score'] for score in completeness_scores.values()]
+            overall_completeness = sum(column_scores) / len(column_scores) if column_scores else 0.0
             validation_results['completeness'] = {
                 'score': round(overall_completeness, 3),
                 'threshold': self.quality_thresholds['completeness'],
@@ -198,7 +262,8 @@ class DataValidator:
                     'duplicate_percentage': round((1 - uniqueness) * 100, 1)
                 }
             
-            overall_uniqueness = np.mean([score['score'] for score in uniqueness_scores.values()])
+            column_scores = [score['score'] for score in uniqueness_scores.values()]
+            overall_uniqueness = sum(column_scores) / len(column_scores) if column_scores else 0.0
             validation_results['uniqueness'] = {
                 'score': round(overall_uniqueness, 3),
                 'threshold': self.quality_thresholds['uniqueness'],
@@ -226,7 +291,8 @@ class DataValidator:
                     'valid': type_valid
                 }
             
-            overall_type_validity = sum(1 for v in type_validation.values() if v['valid']) / len(type_validation)
+            overall_type_validity = (sum(1 for v in type_validation.values() if v['valid']) / len(type_validation)
+                                     if type_validation else 0.0)
             validation_results['type_consistency'] = {
                 'score': round(overall_type_validity, 3),
                 'threshold': self.quality_thresholds['consistency'],
@@ -253,48 +319,65 @@ class DataValidator:
             logger.error(f"❌ Erreur validation de base: {e}")
             return {'error': str(e), 'status': 'FAILED'}
     
-    def _validate_business_rules(self, df: pd.DataFrame) -> Dict[str, Any]:
-        """Validation des règles métier"""
+    def _validate_business_rules(self, df: pd.DataFrame,
+                                 basic_validation: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Validation des règles métier
+        
+        Les comptes de valeurs manquantes et la validité des types déjà calculés
+        par la validation de base sont réutilisés au lieu d'être recalculés.
+        """
         try:
             validation_results = {}
             rule_violations = {}
+            basic_validation = basic_validation or {}
+            completeness_details = basic_validation.get('completeness', {}).get('details', {})
+            type_details = basic_validation.get('type_consistency', {}).get('details', {})
             
+            # Bornes numériques de tous les champs évaluées en un seul balayage
+            range_counts = self._range_violation_counts(df)
+            
+            checked_fields = 0
             for field, rule in self.business_rules.items():
                 if field not in df.columns:
                     if rule.get('required', False):
+                        checked_fields += 1
                         rule_violations[field] = ['Champ requis manquant']
                     continue
                 
+                checked_fields += 1
+                
                 field_violations = []
                 
                 # Vérification des valeurs requises
                 if rule.get('required', False):
-                    missing_count = df[field].isna().sum()
+                    if field in completeness_details:
+                        missing_count = completeness_details[field]['missing_count']
+                    else:
+                        missing_count = df[field].isna().sum()
                     if missing_count > 0:
                         field_violations.append(f"Valeurs manquantes: {missing_count}")
                 
                 # Vérification des limites numériques
-                if 'min_value' in rule:
-                    below_limit = (df[field] < rule['min_value']).sum()
+                if field in range_counts:
+                    below_limit, above_limit = range_counts[field]
                     if below_limit > 0:
                         field_violations.append(f"Valeurs < {rule['min_value']}: {below_limit}")
-                
-                if 'max_value' in rule:
-                    above_limit = (df[field] > rule['max_value']).sum()
                     if above_limit > 0:
                         field_violations.append(f"Valeurs > {rule['max_value']}: {above_limit}")
                 
                 # Vérification des valeurs autorisées
                 if 'allowed_values' in rule:
-                    invalid_values = ~df[field].isin(rule['allowed_values'])
-                    invalid_count = invalid_values.sum()
+                    invalid_count = self._count_disallowed(df[field], rule['allowed_values'])
                     if invalid_count > 0:
                         field_violations.append(f"Valeurs invalides: {invalid_count}")
                 
                 # Vérification des types de données
                 if 'data_type' in rule:
                     type_valid = True
-                    if rule['data_type'] == 'numeric':
+                    if field in type_details:
+                        type_valid = type_details[field]['valid']
+                    elif rule['data_type'] == 'numeric':
                         type_valid = pd.api.types.is_numeric_dtype(df[field])
                     elif rule['data_type'] == 'categorical':
                         type_valid = pd.api.types.is_categorical_dtype(df[field]) or pd.api.types.is_object_dtype(df[field])
@@ -308,15 +391,18 @@ class DataValidator:
                     rule_violations[field] = field_violations
             
             # Calcul du score de validation des règles métier
+            # Taux = champs valides / (champs valides + champs en violation) ;
+            # les champs optionnels absents ne sont ni réussis ni échoués
             total_fields = len(self.business_rules)
-            valid_fields = total_fields - len(rule_violations)
-            business_rule_score = valid_fields / total_fields if total_fields > 0 else 0
+            valid_fields = checked_fields - len(rule_violations)
+            business_rule_score = valid_fields / checked_fields if checked_fields > 0 else 1.0
             
             validation_results = {
                 'score': round(business_rule_score, 3),
                 'threshold': self.quality_thresholds['validity'],
                 'passed': business_rule_score >= self.quality_thresholds['validity'],
                 'total_fields': total_fields,
+                'checked_fields': checked_fields,
                 'valid_fields': valid_fields,
                 'violations': rule_violations,
                 'status': 'PASSED' if business_rule_score >= 0.9 else 'WARNING' if business_rule_score >= 0.7 else 'FAILED'
@@ -340,12 +426,17 @@ class DataValidator:
             
             # 1. Cohérence prix/surface
             if 'price' in df.columns and 'surface' in df.columns:
-                price_surface_ratio = df['price'] / df['surface']
-                median_ratio = price_surface_ratio.median()
+                price = pd.to_numeric(df['price'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                surface = pd.to_numeric(df['surface'], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    price_surface_ratio = price / surface
+                # Surfaces nulles ou manquantes (inf/NaN) écartées de la médiane et du comptage
+                price_surface_ratio = price_surface_ratio[np.isfinite(price_surface_ratio)]
+                median_ratio = float(np.median(price_surface_ratio)) if price_surface_ratio.size else np.nan
                 
                 # Détection des anomalies (ratio > 3x la médiane)
                 threshold = median_ratio * 3
-                anomalies = (price_surface_ratio > threshold).sum()
+                anomalies = int(np.count_nonzero(price_surface_ratio > threshold))
                 
                 consistency_checks['price_surface_ratio'] = {
                     'median_ratio': round(median_ratio, 2),
@@ -357,8 +448,8 @@ class DataValidator:
             # 2. Cohérence géographique
             if 'latitude' in df.columns and 'longitude' in df.columns:
                 # Vérification des coordonnées dans des plages raisonnables pour le Québec
-                lat_valid = ((df['latitude'] >= 45.0) & (df['latitude'] <= 46.0)).sum()
-                lon_valid = ((df['longitude'] >= -74.0) & (df['longitude'] <= -73.0)).sum()
+                lat_valid = self._count_in_range(df['latitude'], 45.0, 46.0)
+                lon_valid = self._count_in_range(df['longitude'], -74.0, -73.0)
                 
                 consistency_checks['geographic_coordinates'] = {
                     'latitude_valid': int(lat_valid),
@@ -371,7 +462,7 @@ class DataValidator:
             # 3. Cohérence temporelle
             if 'year_built' in df.columns:
                 current_year = datetime.now().year
-                age_valid = ((df['year_built'] >= 1800) & (df['year_built'] <= current_year)).sum()
+                age_valid = self._count_in_range(df['year_built'], 1800, current_year)
                 
                 consistency_checks['temporal_consistency'] = {
                     'valid_years': int(age_valid),
@@ -384,7 +475,7 @@ class DataValidator:
             if consistency_checks:
                 consistency_scores = [check.get('coordinate_validity', check.get('year_validity', 1.0)) 
                                    for check in consistency_checks.values()]
-                overall_consistency = np.mean(consistency_scores)
+                overall_consistency = sum(consistency_scores) / len(consistency_scores)
                 
                 validation_results = {
                     'score': round(overall_consistency, 3),
@@ -409,9 +500,11 @@ class DataValidator:
             logger.error(f"❌ Erreur validation cohérence: {e}")
             return {'error': str(e), 'status': 'FAILED'}
     
-    def _validate_consolidation_metrics(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _validate_consolidation_metrics(self, df: pd.DataFrame, null_counts: np.ndarray = None) -> Dict[str, Any]:
         """Validation des métriques de consolidation"""
         try:
+            if null_counts is None:
+                null_counts = count_nulls(df)
             consolidation_checks = {}
             
             # 1. Vérification des colonnes consolidées
@@ -420,7 +513,8 @@ class DataValidator:
                 'rooms_final', 'bathrooms_final', 'year_built_final'
             ]
             
-            available_consolidated = [col for col in expected_consolidated_columns if col in df.columns]
+            existing_columns = set(df.columns)
+            available_consolidated = [col for col in expected_consolidated_columns if col in existing_columns]
             consolidation_coverage = len(available_consolidated) / len(expected_consolidated_columns)
             
             consolidation_checks['consolidation_coverage'] = {
@@ -433,12 +527,12 @@ class DataValidator:
             # 2. Qualité des colonnes consolidées
             if available_consolidated:
                 quality_scores = {}
+                missing_by_column = dict(zip(df.columns, null_counts.tolist()))
                 for col in available_consolidated:
-                    if col in df.columns:
-                        completeness = 1 - (df[col].isna().sum() / len(df))
-                        quality_scores[col] = round(completeness, 3)
+                    completeness = 1 - (missing_by_column[col] / len(df))
+                    quality_scores[col] = round(completeness, 3)
                 
-                avg_quality = np.mean(list(quality_scores.values())) if quality_scores else 0
+                avg_quality = sum(quality_scores.values()) / len(quality_scores) if quality_scores else 0
                 
                 consolidation_checks['consolidated_quality'] = {
                     'quality_scores': quality_scores,
@@ -479,30 +573,31 @@ class DataValidator:
         """Validation des données enrichies"""
         try:
             enrichment_checks = {}
+            # Ensemble des colonnes construit une fois pour les trois familles de métriques
+            existing_columns = set(df.columns)
             
             # 1. Vérification des métriques financières
             financial_metrics = ['price_per_sqm', 'price_surface_ratio', 'roi_estimate']
-            available_financial = [col for col in financial_metrics if col in df.columns]
+            available_financial = [col for col in financial_metrics if col in existing_columns]
             
             if available_financial:
                 financial_quality = {}
                 for col in available_financial:
-                    if col in df.columns:
-                        # Vérification que les valeurs sont dans des plages raisonnables
-                        if col == 'price_per_sqm':
-                            valid_range = (100, 10000)  # 100$ à 10k$ par m²
-                        elif col == 'price_surface_ratio':
-                            valid_range = (100, 10000)
-                        elif col == 'roi_estimate':
-                            valid_range = (0, 0.5)  # 0% à 50%
-                        
-                        if 'valid_range' in locals():
-                            min_val, max_val = valid_range
-                            valid_count = ((df[col] >= min_val) & (df[col] <= max_val)).sum()
-                            quality_score = valid_count / len(df)
-                            financial_quality[col] = round(quality_score, 3)
+                    # Vérification que les valeurs sont dans des plages raisonnables
+                    if col == 'price_per_sqm':
+                        valid_range = (100, 10000)  # 100$ à 10k$ par m²
+                    elif col == 'price_surface_ratio':
+                        valid_range = (100, 10000)
+                    elif col == 'roi_estimate':
+                        valid_range = (0, 0.5)  # 0% à 50%
+                    
+                    if 'valid_range' in locals():
+                        min_val, max_val = valid_range
+                        valid_count = ((df[col] >= min_val) & (df[col] <= max_val)).sum()
+                        quality_score = valid_count / len(df)
+                        financial_quality[col] = round(quality_score, 3)
                 
-                avg_financial_quality = np.mean(list(financial_quality.values())) if financial_quality else 0
+                avg_financial_quality = sum(financial_quality.values()) / len(financial_quality) if financial_quality else 0
                 
                 enrichment_checks['financial_metrics'] = {
                     'available_metrics': available_financial,
@@ -513,7 +608,7 @@ class DataValidator:
             
             # 2. Vérification des métriques géographiques
             geographic_metrics = ['city_density', 'region', 'distance_to_center', 'zone_type']
-            available_geographic = [col for col in geographic_metrics if col in df.columns]
+            available_geographic = [col for col in geographic_metrics if col in existing_columns]
             
             if available_geographic:
                 geographic_coverage = len(available_geographic) / len(geographic_metrics)
@@ -526,19 +621,18 @@ class DataValidator:
             
             # 3. Vérification des scores d'opportunité
             opportunity_metrics = ['opportunity_score', 'opportunity_level', 'quality_index']
-            available_opportunity = [col for col in opportunity_metrics if col in df.columns]
+            available_opportunity = [col for col in opportunity_metrics if col in existing_columns]
             
             if available_opportunity:
                 opportunity_quality = {}
                 for col in available_opportunity:
-                    if col in df.columns:
-                        if col == 'opportunity_score':
-                            # Vérification que le score est entre 0 et 1
-                            valid_count = ((df[col] >= 0) & (df[col] <= 1)).sum()
-                            quality_score = valid_count / len(df)
-                            opportunity_quality[col] = round(quality_score, 3)
+                    if col == 'opportunity_score':
+                        # Vérification que le score est entre 0 et 1
+                        valid_count = ((df[col] >= 0) & (df[col] <= 1)).sum()
+                        quality_score = valid_count / len(df)
+                        opportunity_quality[col] = round(quality_score, 3)
                 
-                avg_opportunity_quality = np.mean(list(opportunity_quality.values())) if opportunity_quality else 0
+                avg_opportunity_quality = sum(opportunity_quality.values()) / len(opportunity_quality) if opportunity_quality else 0
                 
                 enrichment_checks['opportunity_metrics'] = {
                     'available_metrics': available_opportunity,
@@ -556,7 +650,7 @@ class DataValidator:
                     elif 'coverage_percentage' in check:
                         enrichment_scores.append(check['coverage_percentage'] / 100)
                 
-                overall_enrichment = np.mean(enrichment_scores) if enrichment_scores else 0
+                overall_enrichment = sum(enrichment_scores) / len(enrichment_scores) if enrichment_scores else 0
                 
                 validation_results = {
                     'score': round(overall_enrichment, 3),
@@ -609,22 +703,10 @@ class DataValidator:
             
             overall_score = weighted_score / total_weight if total_weight > 0 else 0
             
-            # Détermination du statut global
-            if overall_score >= 0.9:
-                status = 'PASSED'
-                message = 'Excellente qualité des données'
-            elif overall_score >= 0.8:
-                status = 'PASSED'
-                message = 'Bonne qualité des données'
-            elif overall_score >= 0.7:
-                status = 'WARNING'
-                message = 'Qualité acceptable avec quelques points d\'attention'
-            elif overall_score >= 0.6:
-                status = 'WARNING'
-                message = 'Qualité modérée nécessitant des améliorations'
-            else:
-                status = 'FAILED'
-                message = 'Qualité insuffisante, rejet des données'
+            # Détermination du statut global (palier trouvé par recherche dichotomique,
+            # score NaN au palier le plus bas)
+            level = 0 if pd.isna(overall_score) else bisect_right(_STATUS_THRESHOLDS, overall_score)
+            status, message = _STATUS_LEVELS[level]
             
             overall_status = {
                 'status': status,
@@ -657,14 +739,15 @@ class DataValidator:
         """Retourne les statistiques de validation"""
         return self.validation_stats.copy()
     
-    def generate_validation_report(self) -> str:
+    def generate_validation_report(self, generated_at: datetime = None) -> str:
         """Génération d'un rapport de validation en format texte"""
         try:
+            generated_at = generated_at or datetime.now()
             report = []
             report.append("=" * 60)
             report.append("📊 RAPPORT DE VALIDATION DES DONNÉES")
             report.append("=" * 60)
-            report.append(f"📅 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            report.append(f"📅 Date: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
             report.append(f"📊 Forme des données: {self.validation_stats.get('data_shape', 'N/A')}")
             report.append("")
             
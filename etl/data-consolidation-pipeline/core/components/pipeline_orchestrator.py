@@ -24,6 +24,11 @@ from .data_cleaner import DataCleaner
 from .data_enricher import DataEnricher
 from .data_validator import DataValidator
 
+try:
+    from ...utils.memory_utils import estimate_memory_usage_mb
+except ImportError:
+    from utils.memory_utils import estimate_memory_usage_mb
+
 # Imports des modules externes (avec gestion d'erreur pour compatibilité)
 try:
     from ...config.consolidation_config import ConsolidationConfig
@@ -116,7 +121,7 @@ class PipelineOrchestrator:
         Exécute le pipeline ETL complet
         
         Args:
-            input_source: Source des données ("mongodb", "csv", "json", "test")
+            input_source: Source des données ("mongodb", "csv", "parquet", "json", "test")
             input_config: Configuration d'entrée
             output_config: Configuration de sortie
             
@@ -351,7 +356,7 @@ class PipelineOrchestrator:
             if not output_config:
                 output_config = {
                     'output_dir': 'exports/',
-                    'formats': ['csv', 'parquet'],
+                    'formats': ['parquet'],  # CSV uniquement sur demande
                     'filename_prefix': 'real_estate_data_consolidated'
                 }
             
@@ -375,16 +380,20 @@ class PipelineOrchestrator:
             reports_dir = Path('exports/reports')
             reports_dir.mkdir(parents=True, exist_ok=True)
             
+            # Une seule lecture de l'horloge: noms de fichiers et date du rapport concordent
+            report_time = datetime.now()
+            timestamp = report_time.strftime('%Y%m%d_%H%M%S')
+            
             # Rapport de validation
-            validation_report = self.data_validator.generate_validation_report()
-            validation_report_path = reports_dir / f"validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            validation_report = self.data_validator.generate_validation_report(report_time)
+            validation_report_path = reports_dir / f"validation_report_{timestamp}.txt"
             
             with open(validation_report_path, 'w', encoding='utf-8') as f:
                 f.write(validation_report)
             
             # Rapport de pipeline
-            pipeline_report = self._generate_pipeline_report(df, validation_results, export_results)
-            pipeline_report_path = reports_dir / f"pipeline_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+            pipeline_report = self._generate_pipeline_report(df, validation_results, export_results, report_time)
+            pipeline_report_path = reports_dir / f"pipeline_report_{timestamp}.md"
             
             with open(pipeline_report_path, 'w', encoding='utf-8') as f:
                 f.write(pipeline_report)
@@ -432,27 +441,27 @@ class PipelineOrchestrator:
                     'extraction': {
                         'shape': df_extracted.shape if df_extracted is not None else (0, 0),
                         'columns': list(df_extracted.columns) if df_extracted is not None else [],
-                        'memory_usage_mb': df_extracted.memory_usage(deep=True).sum() / 1024 / 1024 if df_extracted is not None else 0
+                        'memory_usage_mb': estimate_memory_usage_mb(df_extracted) if df_extracted is not None else 0
                     },
                     'cleaning': {
                         'shape': df_cleaned.shape if df_cleaned is not None else (0, 0),
                         'columns': list(df_cleaned.columns) if df_cleaned is not None else [],
-                        'memory_usage_mb': df_cleaned.memory_usage(deep=True).sum() / 1024 / 1024 if df_cleaned is not None else 0
+                        'memory_usage_mb': estimate_memory_usage_mb(df_cleaned) if df_cleaned is not None else 0
                     },
                     'consolidation': {
                         'shape': df_consolidated.shape if df_consolidated is not None else (0, 0),
                         'columns': list(df_consolidated.columns) if df_consolidated is not None else [],
-                        'memory_usage_mb': df_consolidated.memory_usage(deep=True).sum() / 1024 / 1024 if df_consolidated is not None else 0
+                        'memory_usage_mb': estimate_memory_usage_mb(df_consolidated) if df_consolidated is not None else 0
                     },
                     'enrichment': {
                         'shape': df_enriched.shape if df_enriched is not None else (0, 0),
                         'columns': list(df_enriched.columns) if df_enriched is not None else [],
-                        'memory_usage_mb': df_enriched.memory_usage(deep=True).sum() / 1024 / 1024 if df_enriched is not None else 0
+                        'memory_usage_mb': estimate_memory_usage_mb(df_enriched) if df_enriched is not None else 0
                     },
                     'optimization': {
                         'shape': df_optimized.shape if df_optimized is not None else (0, 0),
                         'columns': list(df_optimized.columns) if df_optimized is not None else [],
-                        'memory_usage_mb': df_optimized.memory_usage(deep=True).sum() / 1024 / 1024 if df_optimized is not None else 0
+                        'memory_usage_mb': estimate_memory_usage_mb(df_optimized) if df_optimized is not None else 0
                     }
                 },
                 'validation_results': validation_results,
@@ -480,8 +489,8 @@ class PipelineOrchestrator:
             if df_input is None or df_output is None:
                 return 0.0
             
-            input_size = df_input.memory_usage(deep=True).sum()
-            output_size = df_output.memory_usage(deep=True).sum()
+            input_size = estimate_memory_usage_mb(df_input)
+            output_size = estimate_memory_usage_mb(df_output)
             
             if input_size == 0:
                 return 0.0
@@ -493,13 +502,14 @@ class PipelineOrchestrator:
             return 0.0
     
     def _generate_pipeline_report(self, df: pd.DataFrame, validation_results: Dict, 
-                                 export_results: Dict) -> str:
+                                 export_results: Dict, generated_at: datetime = None) -> str:
         """Génération du rapport de pipeline"""
         try:
+            generated_at = generated_at or datetime.now()
             report = []
             report.append("# 📊 RAPPORT DE PIPELINE ETL")
             report.append("")
-            report.append(f"**Date de génération:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            report.append(f"**Date de génération:** {generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
             report.append(f"**Statut du pipeline:** ✅ Succès")
             report.append("")
             
@@ -507,7 +517,7 @@ class PipelineOrchestrator:
             report.append("## 📈 RÉSUMÉ DES DONNÉES")
             report.append("")
             report.append(f"- **Forme finale:** {df.shape[0]} lignes × {df.shape[1]} colonnes")
-            report.append(f"- **Mémoire utilisée:** {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB")
+            report.append(f"- **Mémoire utilisée:** {estimate_memory_usage_mb(df):.2f} MB")
             report.append("")
             
             # Résultats de validation
@@ -546,11 +556,12 @@ class PipelineOrchestrator:
     def _handle_pipeline_error(self, error: Exception, start_time: datetime):
         """Gestion des erreurs du pipeline"""
         try:
+            error_time = datetime.now()
             error_info = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': error_time.isoformat(),
                 'error_type': type(error).__name__,
                 'error_message': str(error),
-                'pipeline_duration': (datetime.now() - start_time).total_seconds()
+                'pipeline_duration': (error_time - start_time).total_seconds()
             }
             
             logger.error(f"❌ Erreur pipeline enregistrée: {error_info}")
@@ -61,14 +61,14 @@ Exemples d'utilisation:
         # === SOURCE DE DONNÉES ===
         parser.add_argument(
             '--source', 
-            choices=['mongodb', 'csv', 'json', 'test'],
+            choices=['mongodb', 'csv', 'parquet', 'json', 'test'],
             default='test',
             help='Source des données (défaut: test)'
         )
         
         parser.add_argument(
             '--source-path',
-            help='Chemin du fichier (CSV/JSON) ou chaîne de connexion MongoDB'
+            help='Chemin du fichier (CSV/Parquet/JSON) ou chaîne de connexion MongoDB'
         )
         
         # === CONFIGURATION MONGODB ===
@@ -109,8 +109,8 @@ Exemples d'utilisation:
             '--formats',
             nargs='+',
             choices=['csv', 'json', 'parquet', 'geojson', 'hdf5'],
-            default=['csv'],
-            help='Formats d\'export (défaut: csv)'
+            default=['parquet'],
+            help='Formats d\'export (défaut: parquet, CSV sur demande)'
         )
         
         # === OPTIMISATION ET PERFORMANCE ===
@@ -219,7 +219,7 @@ Exemples d'utilisation:
             if config.get('limit'):
                 logger.info(f"Limite MongoDB: {config['limit']} documents")
         
-        elif source in ['csv', 'json']:
+        elif source in ['csv', 'parquet', 'json']:
             if not config.get('source_path'):
                 logger.error(f"❌ Chemin source requis pour {source}")
                 return False
@@ -240,7 +240,7 @@ Exemples d'utilisation:
         output_path.mkdir(parents=True, exist_ok=True)
         
         # === VALIDATION DES FORMATS ===
-        formats = config.get('formats', ['csv'])
+        formats = config.get('formats', ['parquet'])
         logger.info(f"Formats: {', '.join(formats)}")
         
         # === VALIDATION DE L'OPTIMISATION ===
@@ -277,7 +277,7 @@ Exemples d'utilisation:
                 'mongodb_query_file': self.config.get('mongodb_query_file'),
                 'limit': self.config.get('limit')
             }
-        elif source in ['csv', 'json']:
+        elif source in ['csv', 'parquet', 'json']:
             return {
                 'source': source,
                 'source_path': self.config.get('source_path')
@@ -291,7 +291,7 @@ Exemples d'utilisation:
         """Retourne la configuration de sortie"""
         return {
             'output_dir': self.config.get('output', 'exports'),
-            'formats': self.config.get('formats', ['csv']),
+            'formats': self.config.get('formats', ['parquet']),
             'optimization': self.config.get('optimization', 'medium'),
             'parallel': self.config.get('parallel', False),
             'chunked': self.config.get('chunked', False)
@@ -12,6 +12,12 @@ import pandas as pd
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from ..utils.file_utils import cleanup_old_files, get_directory_info, remove_files
+except ImportError:
+    from utils.file_utils import cleanup_old_files, get_directory_info, remove_files
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +38,7 @@ class ExportManager:
         """
         self.pipeline_manager = pipeline_manager
         self.exported_files = {}
+        self.output_dir = None
     
     def export_data(self, df: pd.DataFrame, pipeline_name: str, 
                     formats: List[str], output_dir: str) -> Dict[str, str]:
@@ -48,6 +55,10 @@ class ExportManager:
             Dict avec les chemins des fichiers exportés
         """
         logger.info("💾 === PHASE 6: EXPORT MULTI-FORMATS ===")
+        self.output_dir = output_dir
+        # Formats en minuscules et sans doublon: une seule écriture par fichier,
+        # et un ratio "N/M formats" qui compte chaque format une fois
+        formats = self._normalize_formats(formats)
         
         if self.pipeline_manager.exporter is None:
             logger.warning("⚠️ AdvancedExporter non disponible, export basique utilisé")
@@ -58,7 +69,8 @@ class ExportManager:
             
             start_time = time.time()
             exported_files = self.pipeline_manager.exporter.export_dataset(
-                df, pipeline_name, formats, output_dir
+                df, pipeline_name, formats, output_dir,
+                timestamp=self.pipeline_manager.get_run_timestamp()
             )
             export_time = time.time() - start_time
             
@@ -72,6 +84,11 @@ class ExportManager:
             logger.error(f"❌ Erreur export avancé: {e}, fallback vers export basique")
             return self._basic_export(df, pipeline_name, formats, output_dir)
     
+    @staticmethod
+    def _normalize_formats(formats: List[str]) -> List[str]:
+        """Formats en minuscules, doublons retirés (ordre conservé)"""
+        return list(dict.fromkeys(format_type.lower() for format_type in formats))
+    
     def _basic_export(self, df: pd.DataFrame, pipeline_name: str,
                       formats: List[str], output_dir: str) -> Dict[str, str]:
         """Export basique en cas d'échec de l'exporteur avancé"""
@@ -81,50 +98,56 @@ class ExportManager:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        timestamp = self.pipeline_manager.get_run_timestamp()
+        base_name = f"real_estate_data_{pipeline_name}_{timestamp}"
+        
+        writers = {
+            "csv": lambda filepath: df.to_csv(filepath, index=False, encoding='utf-8'),
+            "json": lambda filepath: df.to_json(filepath, orient='records', indent=2, force_ascii=False),
+            "parquet": lambda filepath: df.to_parquet(filepath, index=False, compression='zstd'),
+        }
         
+        formats = self._normalize_formats(formats)
+        supported_formats = []
         for format_type in formats:
-            try:
-                if format_type.lower() == "csv":
-                    filename = f"real_estate_data_{pipeline_name}_{timestamp}.csv"
-                    filepath = output_path / filename
-                    df.to_csv(filepath, index=False, encoding='utf-8')
-                    exported_files["csv"] = str(filepath)
-                    logger.info(f"✅ CSV exporté: {filepath}")
-                    
-                elif format_type.lower() == "json":
-                    filename = f"real_estate_data_{pipeline_name}_{timestamp}.json"
-                    filepath = output_path / filename
-                    df.to_json(filepath, orient='records', indent=2, force_ascii=False)
-                    exported_files["json"] = str(filepath)
-                    logger.info(f"✅ JSON exporté: {filepath}")
-                    
-                elif format_type.lower() == "parquet":
+            if format_type in writers:
+                supported_formats.append(format_type)
+            else:
+                logger.warning(f"⚠️ Format non supporté: {format_type}")
+        
+        def _write(format_type: str) -> str:
+            filepath = output_path / f"{base_name}.{format_type}"
+            writers[format_type](filepath)
+            return str(filepath)
+        
+        # Écritures indépendantes limitées par les I/O: une par thread
+        if supported_formats:
+            with ThreadPoolExecutor(max_workers=len(supported_formats)) as executor:
+                futures = {executor.submit(_write, format_type): format_type
+                           for format_type in supported_formats}
+                for future in as_completed(futures):
+                    format_type = futures[future]
                     try:
-                        filename = f"real_estate_data_{pipeline_name}_{timestamp}.parquet"
-                        filepath = output_path / filename
-                        df.to_parquet(filepath, index=False)
-                        exported_files["parquet"] = str(filepath)
-                        logger.info(f"✅ Parquet exporté: {filepath}")
+                        exported_files[format_type] = future.result()
+                        logger.info(f"✅ {format_type.upper()} exporté: {exported_files[format_type]}")
                     except ImportError:
-                        logger.warning("⚠️ PyArrow non disponible, export Parquet ignoré")
-                        
-                else:
-                    logger.warning(f"⚠️ Format non supporté: {format_type}")
-                    
-            except Exception as e:
-                logger.error(f"❌ Erreur export {format_type}: {e}")
+                        logger.warning(f"⚠️ Dépendance manquante, export {format_type} ignoré")
+                    except Exception as e:
+                        logger.error(f"❌ Erreur export {format_type}: {e}")
         
         logger.info(f"📊 {len(exported_files)}/{len(formats)} formats exportés avec succès")
         return exported_files
     
     def get_export_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des exports effectués"""
-        return {
+        summary = {
             "total_formats": len(self.exported_files),
             "exported_files": self.exported_files,
             "export_status": "success" if self.exported_files else "failed"
         }
+        if self.output_dir:
+            summary["output_directory"] = get_directory_info(self.output_dir)
+        return summary
     
     def cleanup_exports(self, keep_files: bool = True):
         """
@@ -135,10 +158,28 @@ class ExportManager:
         """
         if not keep_files and self.exported_files:
             logger.info("🧹 Nettoyage des fichiers d'export...")
-            for format_type, filepath in self.exported_files.items():
-                try:
-                    Path(filepath).unlink(missing_ok=True)
-                    logger.info(f"🗑️ Fichier supprimé: {filepath}")
-                except Exception as e:
-                    logger.warning(f"⚠️ Impossible de supprimer {filepath}: {e}")
+            removed, errors = remove_files(self.exported_files.values())
+            for filepath, error in errors.items():
+                logger.warning(f"⚠️ Impossible de supprimer {filepath}: {error}")
+            logger.info(f"🗑️ {len(removed)}/{len(self.exported_files)} fichiers supprimés")
             self.exported_files = {}
+    
+    def cleanup_old_exports(self, output_dir: str = None, days_old: int = 30) -> int:
+        """
+        Supprime les exports plus anciens que days_old jours
+        
+        Args:
+            output_dir: Répertoire d'export (par défaut celui du dernier export)
+            days_old: Âge minimal des fichiers à supprimer (jours)
+            
+        Returns:
+            Nombre de fichiers supprimés
+        """
+        directory = output_dir or self.output_dir
+        if not directory:
+            return 0
+        
+        logger.info(f"🧹 Nettoyage des exports de plus de {days_old} jours: {directory}")
+        removed_count = cleanup_old_files(directory, days_old)
+        logger.info(f"🗑️ {removed_count} anciens fichiers supprimés")
+        return removed_count
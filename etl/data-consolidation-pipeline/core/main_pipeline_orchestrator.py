@@ -163,7 +163,7 @@ class MainPipelineOrchestrator:
         utiliser les modules externes s'ils sont disponibles.
         
         Args:
-            input_source: Source des données ("test", "csv", "json", "mongodb")
+            input_source: Source des données ("test", "csv", "parquet", "json", "mongodb")
             input_config: Configuration d'entrée
             output_config: Configuration de sortie
             
@@ -7,10 +7,13 @@
 Gère l'initialisation et l'orchestration du pipeline ETL modulaire
 """
 
+import ast
+import json
 import logging
 import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
 # Orchestrateur simple intégré pour éviter les dépendances complexes
@@ -35,6 +38,7 @@ class PipelineManager:
         self.config = config or {}
         self.start_time = None
         self.end_time = None
+        self.run_timestamp = None
         
         # === INITIALISATION DE L'ORCHESTRATEUR INTÉGRÉ ===
         logger.info("🎼 === INITIALISATION ORCHESTRATEUR INTÉGRÉ ===")
@@ -73,24 +77,25 @@ class PipelineManager:
                     def _generate_test_data(self):
                         """Génère des données de test"""
                         import numpy as np
-                        np.random.seed(42)
+                        # Générateur local: tirages reproductibles sans modifier l'état global de NumPy
+                        rng = np.random.default_rng(42)
                         num_properties = 1000
                         
                         data = {
-                            'price': np.random.uniform(200000, 2000000, num_properties),
-                            'prix': np.random.uniform(200000, 2000000, num_properties),
-                            'surface': np.random.uniform(50, 500, num_properties),
-                            'superficie': np.random.uniform(50, 500, num_properties),
-                            'bedrooms': np.random.randint(1, 6, num_properties),
-                            'chambres': np.random.randint(1, 6, num_properties),
-                            'bathrooms': np.random.randint(1, 4, num_properties),
-                            'salle_bain': np.random.randint(1, 4, num_properties),
-                            'latitude': np.random.uniform(45.0, 46.0, num_properties),
-                            'longitude': np.random.uniform(-74.0, -73.0, num_properties),
-                            'city': np.random.choice(['Montréal', 'Québec', 'Laval', 'Gatineau'], num_properties),
-                            'type': np.random.choice(['Maison', 'Appartement', 'Condo', 'Duplex'], num_properties),
-                            'year_built': np.random.randint(1950, 2024, num_properties),
-                            'annee_construction': np.random.randint(1950, 2024, num_properties)
+                            'price': rng.uniform(200000, 2000000, num_properties),
+                            'prix': rng.uniform(200000, 2000000, num_properties),
+                            'surface': rng.uniform(50, 500, num_properties),
+                            'superficie': rng.uniform(50, 500, num_properties),
+                            'bedrooms': rng.integers(1, 6, num_properties),
+                            'chambres': rng.integers(1, 6, num_properties),
+                            'bathrooms': rng.integers(1, 4, num_properties),
+                            'salle_bain': rng.integers(1, 4, num_properties),
+                            'latitude': rng.uniform(45.0, 46.0, num_properties),
+                            'longitude': rng.uniform(-74.0, -73.0, num_properties),
+                            'city': rng.choice(['Montréal', 'Québec', 'Laval', 'Gatineau'], num_properties),
+                            'type': rng.choice(['Maison', 'Appartement', 'Condo', 'Duplex'], num_properties),
+                            'year_built': rng.integers(1950, 2024, num_properties),
+                            'annee_construction': rng.integers(1950, 2024, num_properties)
                         }
                         
                         df = pd.DataFrame(data)
@@ -364,12 +369,10 @@ class PipelineManager:
                 if isinstance(value, str):
                     try:
                         # Essayer d'abord json.loads
-                        import json
                         return json.loads(value)
                     except json.JSONDecodeError:
                         try:
                             # Fallback: ast.literal_eval pour les structures Python
-                            import ast
                             return ast.literal_eval(value)
                         except (ValueError, SyntaxError):
                             # Dernier fallback: traiter comme string
@@ -378,50 +381,52 @@ class PipelineManager:
                 # Pour tout autre type, retourner tel quel
                 return value
             
+            def _count_units(self, value) -> int:
+                """Compte les unités décrites par une valeur (liste ou dict JSON)."""
+                parsed_value = self._parse_json_string(value)
+                if isinstance(parsed_value, list):
+                    # Compter les unités dans la liste
+                    count = 0
+                    for item in parsed_value:
+                        if isinstance(item, dict):
+                            # Extraire le count ou nb_unite
+                            if 'count' in item:
+                                try:
+                                    count += int(str(item['count']).strip())
+                                except (ValueError, TypeError):
+                                    count += 1
+                            elif 'nb_unite' in item:
+                                try:
+                                    count += int(str(item['nb_unite']).strip())
+                                except (ValueError, TypeError):
+                                    count += 1
+                            else:
+                                count += 1
+                        else:
+                            count += 1
+                    return count
+                if isinstance(parsed_value, dict):
+                    # Structure simple
+                    for key in ('count', 'nb_unite'):
+                        if key in parsed_value:
+                            try:
+                                return int(str(parsed_value[key]).strip())
+                            except (ValueError, TypeError):
+                                return 1
+                return 0
+            
             def _calculate_total_units(self, df: pd.DataFrame, unit_columns: List[str]) -> pd.Series:
                 """Calcule le nombre total d'unités."""
-                total_units = pd.Series(0, index=df.index)
-                
-                for col in unit_columns:
-                    if col in df.columns:
-                        for idx, value in df[col].items():
-                            if pd.notna(value):
-                                parsed_value = self._parse_json_string(value)
-                                if isinstance(parsed_value, list):
-                                    # Compter les unités dans la liste
-                                    count = 0
-                                    for item in parsed_value:
-                                        if isinstance(item, dict):
-                                            # Extraire le count ou nb_unite
-                                            if 'count' in item:
-                                                try:
-                                                    count += int(str(item['count']).strip())
-                                                except (ValueError, TypeError):
-                                                    count += 1
-                                            elif 'nb_unite' in item:
-                                                try:
-                                                    count += int(str(item['nb_unite']).strip())
-                                                except (ValueError, TypeError):
-                                                    count += 1
-                                            else:
-                                                count += 1
-                                        else:
-                                            count += 1
-                                    total_units[idx] += count
-                                elif isinstance(parsed_value, dict):
-                                    # Structure simple
-                                    if 'count' in parsed_value:
-                                        try:
-                                            total_units[idx] += int(str(parsed_value['count']).strip())
-                                        except (ValueError, TypeError):
-                                            total_units[idx] += 1
-                                    elif 'nb_unite' in parsed_value:
-                                        try:
-                                            total_units[idx] += int(str(parsed_value['nb_unite']).strip())
-                                        except (ValueError, TypeError):
-                                            total_units[idx] += 1
+                # Un vecteur de comptes par colonne, puis une seule réduction NumPy
+                # (plus d'écriture cellule par cellule dans la série résultat)
+                counts = [
+                    df[col].dropna().map(self._count_units).reindex(df.index, fill_value=0).to_numpy(dtype=np.int64)
+                    for col in unit_columns if col in df.columns
+                ]
+                if not counts:
+                    return pd.Series(0, index=df.index)
                 
-                return total_units
+                return pd.Series(np.vstack(counts).sum(axis=0), index=df.index)
             
             def _extract_unit_types(self, df: pd.DataFrame, unit_columns: List[str]) -> pd.Series:
                 """Extrait les types d'unités uniques."""
@@ -483,7 +488,6 @@ class PipelineManager:
                                                 details.append(detail)
                                     
                                     if details:
-                                        import json
                                         unit_details.iloc[idx] = json.dumps(details, ensure_ascii=False)
                                 elif isinstance(parsed_value, dict):
                                     detail = {}
@@ -498,7 +502,6 @@ class PipelineManager:
                                         detail['count'] = parsed_value['nb_unite']
                                     
                                     if detail:
-                                        import json
                                         unit_details.iloc[idx] = json.dumps([detail], ensure_ascii=False)
                 
                 return unit_details
@@ -639,6 +642,7 @@ class PipelineManager:
     def start_pipeline(self):
         """Démarre le pipeline et enregistre le temps de début"""
         self.start_time = time.time()
+        self.run_timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self.start_time))
         logger.info("🚀 === DÉMARRAGE DU PIPELINE MODULAIRE ===")
     
     def end_pipeline(self):
@@ -648,6 +652,15 @@ class PipelineManager:
         logger.info(f"⏱️ Durée totale: {duration:.2f} secondes")
         return duration
     
+    def get_run_timestamp(self) -> str:
+        """
+        Retourne l'horodatage de l'exécution courante
+        
+        Partagé par les exports et les rapports pour que tous les fichiers
+        d'une même exécution portent le même suffixe.
+        """
+        return self.run_timestamp or time.strftime("%Y%m%d_%H%M%S")
+    
     def get_pipeline_status(self) -> Dict[str, Any]:
         """Retourne le statut actuel du pipeline"""
         return {
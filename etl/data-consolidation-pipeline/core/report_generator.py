@@ -11,9 +11,13 @@ import logging
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-import time
 import json
 
+try:
+    from ..utils.file_utils import get_files_stats
+except ImportError:
+    from utils.file_utils import get_files_stats
+
 logger = logging.getLogger(__name__)
 
 class ReportGenerator:
@@ -58,7 +62,7 @@ class ReportGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        timestamp = self.pipeline_manager.get_run_timestamp()
         
         try:
             # === RAPPORT DE SIMILARITÉS ===
@@ -206,10 +210,14 @@ class ReportGenerator:
                 f.write(f"- **Statut:** {'✅ Succès' if exported_files else '❌ Échec'}\n\n")
                 
                 f.write("## 📁 Fichiers Exportés\n\n")
+                file_stats = get_files_stats(exported_files.values())
                 for format_type, filepath_export in exported_files.items():
                     f.write(f"### {format_type.upper()}\n")
                     f.write(f"- **Chemin:** {filepath_export}\n")
-                    f.write(f"- **Taille:** {Path(filepath_export).stat().st_size / 1024:.1f} KB\n\n")
+                    if filepath_export in file_stats:
+                        f.write(f"- **Taille:** {file_stats[filepath_export].st_size / 1024:.1f} KB\n\n")
+                    else:
+                        f.write("- **Taille:** N/A\n\n")
             
             logger.info(f"📄 Rapport d'export sauvegardé: {filepath}")
             return str(filepath)
@@ -17,6 +17,11 @@ import json
 import warnings
 from datetime import datetime
 
+try:
+    from ..utils.memory_utils import estimate_memory_usage_mb
+except ImportError:
+    from utils.memory_utils import estimate_memory_usage_mb
+
 # Imports conditionnels pour Plotly
 try:
     import plotly.express as px
@@ -127,7 +132,7 @@ class ValidationDashboard:
             "metrics": quality_metrics,
             "dataset_info": {
                 "shape": df.shape,
-                "memory_usage": df.memory_usage(deep=True).sum() / 1024**2,  # MB
+                "memory_usage": estimate_memory_usage_mb(df),  # MB
                 "columns": list(df.columns),
                 "dtypes": df.dtypes.to_dict()
             }
@@ -138,7 +143,7 @@ class ValidationDashboard:
     
     def _create_completeness_chart(self, df: pd.DataFrame):
         """Crée un graphique de complétude des données"""
-        completeness = (1 - df.isna().sum() / len(df)) * 100
+        completeness = (df.count() / len(df)) * 100
         
         fig = go.Figure(data=[
             go.Bar(
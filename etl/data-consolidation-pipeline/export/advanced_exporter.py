@@ -14,20 +14,24 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any, Union
 from pathlib import Path
 import json
+import math
 import pickle
 import warnings
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
 
-# Imports conditionnels pour les formats spéciaux
 try:
-    import geopandas as gpd
-    from shapely.geometry import Point
-    GEOPANDAS_AVAILABLE = True
+    from ..utils.file_utils import get_files_stats
 except ImportError:
-    GEOPANDAS_AVAILABLE = False
-    warnings.warn("GeoPandas non disponible - export GeoJSON limité")
+    from utils.file_utils import get_files_stats
 
+try:
+    from ..utils.memory_utils import downcast_float_lossless, estimate_memory_usage_mb
+except ImportError:
+    from utils.memory_utils import downcast_float_lossless, estimate_memory_usage_mb
+
+# Imports conditionnels pour les formats spéciaux
 try:
     import h5py
     H5PY_AVAILABLE = True
@@ -42,6 +46,28 @@ except ImportError:
     OPENPYXL_AVAILABLE = False
     warnings.warn("OpenPyXL non disponible - export Excel limité")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    warnings.warn("orjson non disponible - export JSON via le module standard")
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    warnings.warn("PyArrow non disponible - export CSV via pandas")
+
+try:
+    import pyogrio
+    PYOGRIO_AVAILABLE = hasattr(pyogrio, "write_arrow")  # pyogrio >= 0.8
+except ImportError:
+    PYOGRIO_AVAILABLE = False
+    warnings.warn("pyogrio non disponible - export GeoJSON écrit en flux Python")
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -63,28 +89,37 @@ class AdvancedExporter:
         self.export_stats = {}
         
         logger.info("💾 AdvancedExporter initialisé")
-        logger.info(f"🌍 GeoPandas: {'✅' if GEOPANDAS_AVAILABLE else '❌'}")
         logger.info(f"📊 H5Py: {'✅' if H5PY_AVAILABLE else '❌'}")
         logger.info(f"📈 OpenPyXL: {'✅' if OPENPYXL_AVAILABLE else '❌'}")
+        logger.info(f"⚡ orjson: {'✅' if ORJSON_AVAILABLE else '❌'}")
+        logger.info(f"🌍 pyogrio: {'✅' if PYOGRIO_AVAILABLE else '❌'}")
     
     def _default_export_config(self) -> Dict:
         """Configuration d'export par défaut"""
         return {
-            "formats": ["parquet", "csv", "geojson", "hdf5"],
-            "compression": "snappy",  # Compression Parquet
+            "formats": ["parquet", "geojson", "hdf5"],  # CSV uniquement sur demande
+            "compression": "zstd",  # Compression Parquet
+            "compression_level": 3,
+            "row_group_size": 512_000,  # Lignes max par row group Parquet
+            "data_page_size": 1 << 20,  # Pages de 1 Mo
+            "byte_stream_split_floats": True,  # Encodage BYTE_STREAM_SPLIT des flottants
             "encoding": "utf-8",
             "float_format": "%.6f",
+            "csv_engine": "pandas",  # "pyarrow": écriture plus rapide, format différent (voir _write_csv_pyarrow)
             "index": False,
             "output_directory": "exports",
             "filename_prefix": "real_estate_data",
             "timestamp_format": "%Y%m%d_%H%M%S",
             "chunk_size": 10000,  # Pour les gros datasets
+            "json_lines": False,  # Export JSON en JSON Lines (.jsonl)
             "parallel_export": True,
+            "max_export_workers": 4,  # Écritures simultanées (les writers C libèrent le GIL)
             "memory_optimization": True
         }
     
     def export_dataset(self, df: pd.DataFrame, dataset_name: str = "dataset", 
-                      formats: List[str] = None, output_dir: str = None) -> Dict[str, str]:
+                      formats: List[str] = None, output_dir: str = None,
+                      memory_usage_mb: float = None, timestamp: str = None) -> Dict[str, str]:
         """
         Exporte le dataset dans plusieurs formats
         
@@ -93,6 +128,8 @@ class AdvancedExporter:
             dataset_name: Nom du dataset
             formats: Formats d'export (si None, utilise la config par défaut)
             output_dir: Répertoire de sortie (si None, utilise la config par défaut)
+            memory_usage_mb: Utilisation mémoire déjà calculée (évite un second scan deep)
+            timestamp: Horodatage des noms de fichiers (si None, dérivé du début de l'export)
             
         Returns:
             Dict avec les chemins des fichiers exportés
@@ -106,47 +143,69 @@ class AdvancedExporter:
         # Création du répertoire de sortie
         Path(output_directory).mkdir(parents=True, exist_ok=True)
         
-        # Génération du timestamp
-        timestamp = datetime.now().strftime(self.export_config["timestamp_format"])
+        # Génération du timestamp (une seule lecture de l'horloge)
+        export_start = datetime.now()
+        timestamp = timestamp or export_start.strftime(self.export_config["timestamp_format"])
         
         # Export dans chaque format
-        exported_files = {}
-        export_start = datetime.now()
+        exporters = {
+            "parquet": self._export_parquet,
+            "csv": self._export_csv,
+            "geojson": self._export_geojson,
+            "hdf5": self._export_hdf5,
+            "excel": self._export_excel,
+            "json": self._export_json,
+            "pickle": self._export_pickle
+        }
+        
+        def _run_export(format_type: str) -> Optional[str]:
+            logger.info(f"📤 Export {format_type.upper()}...")
+            return exporters[format_type](df, dataset_name, timestamp, output_directory)
         
+        supported_formats = []
         for format_type in export_formats:
-            try:
-                logger.info(f"📤 Export {format_type.upper()}...")
-                
-                if format_type == "parquet":
-                    file_path = self._export_parquet(df, dataset_name, timestamp, output_directory)
-                elif format_type == "csv":
-                    file_path = self._export_csv(df, dataset_name, timestamp, output_directory)
-                elif format_type == "geojson":
-                    file_path = self._export_geojson(df, dataset_name, timestamp, output_directory)
-                elif format_type == "hdf5":
-                    file_path = self._export_hdf5(df, dataset_name, timestamp, output_directory)
-                elif format_type == "excel":
-                    file_path = self._export_excel(df, dataset_name, timestamp, output_directory)
-                elif format_type == "json":
-                    file_path = self._export_json(df, dataset_name, timestamp, output_directory)
-                elif format_type == "pickle":
-                    file_path = self._export_pickle(df, dataset_name, timestamp, output_directory)
-                else:
-                    logger.warning(f"⚠️ Format non supporté: {format_type}")
-                    continue
-                
-                if file_path:
-                    exported_files[format_type] = file_path
-                    logger.info(f"✅ {format_type.upper()} exporté: {file_path}")
-                
-            except Exception as e:
-                logger.error(f"❌ Erreur export {format_type}: {e}")
-                exported_files[format_type] = f"ERROR: {str(e)}"
+            if format_type in exporters:
+                supported_formats.append(format_type)
+            else:
+                logger.warning(f"⚠️ Format non supporté: {format_type}")
+        
+        # Les écritures sont limitées par les I/O: on les superpose dans des threads
+        workers = min(len(supported_formats), self.export_config.get("max_export_workers", 4))
+        if self.export_config.get("parallel_export", False) and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {format_type: executor.submit(_run_export, format_type)
+                           for format_type in supported_formats}
+            outcomes = {}
+            for format_type, future in futures.items():
+                try:
+                    outcomes[format_type] = future.result()
+                except Exception as e:
+                    outcomes[format_type] = e
+        else:
+            outcomes = {}
+            for format_type in supported_formats:
+                try:
+                    outcomes[format_type] = _run_export(format_type)
+                except Exception as e:
+                    outcomes[format_type] = e
+        
+        exported_files = {}
+        for format_type in supported_formats:
+            file_path = outcomes[format_type]
+            if isinstance(file_path, Exception):
+                logger.error(f"❌ Erreur export {format_type}: {file_path}")
+                exported_files[format_type] = f"ERROR: {str(file_path)}"
+            elif file_path:
+                exported_files[format_type] = file_path
+                logger.info(f"✅ {format_type.upper()} exporté: {file_path}")
         
         # Calcul des statistiques
         export_end = datetime.now()
         export_duration = export_end - export_start
         
+        if memory_usage_mb is None:
+            memory_usage_mb = estimate_memory_usage_mb(df)
+        
         # Mise à jour de l'historique
         export_record = {
             "timestamp": export_start.isoformat(),
@@ -155,7 +214,7 @@ class AdvancedExporter:
             "exported_files": exported_files,
             "duration_seconds": export_duration.total_seconds(),
             "dataset_shape": df.shape,
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024
+            "memory_usage_mb": memory_usage_mb
         }
         
         self.export_history.append(export_record)
@@ -184,10 +243,23 @@ class AdvancedExporter:
             # Optimisation des types de données pour Parquet
             optimized_df = self._optimize_dataframe_for_parquet(df)
             
-            # Export avec compression
+            # Export avec compression (row groups dimensionnés sur le DataFrame)
+            row_group_size = max(1, min(len(optimized_df), self.export_config.get("row_group_size", 512_000)))
+            
+            # Flottants en BYTE_STREAM_SPLIT (meilleur ratio ZSTD), dictionnaire pour le reste
+            float_columns = []
+            if self.export_config.get("byte_stream_split_floats", True):
+                float_columns = [str(col) for col in optimized_df.select_dtypes(include=['floating']).columns]
+            dictionary_columns = [str(col) for col in optimized_df.columns if str(col) not in float_columns]
+            
             optimized_df.to_parquet(
                 file_path,
                 compression=self.export_config["compression"],
+                compression_level=self.export_config.get("compression_level"),
+                row_group_size=row_group_size,
+                data_page_size=self.export_config.get("data_page_size", 1 << 20),
+                use_dictionary=dictionary_columns if float_columns else True,
+                use_byte_stream_split=float_columns or False,
                 index=self.export_config["index"],
                 engine='pyarrow'
             )
@@ -205,6 +277,16 @@ class AdvancedExporter:
             filename = f"{self.export_config['filename_prefix']}_{dataset_name}_{timestamp}.csv"
             file_path = os.path.join(output_dir, filename)
             
+            # Encodeur C++ multithreadé de PyArrow sur demande explicite (UTF-8, sans index)
+            if (PYARROW_AVAILABLE and self.export_config.get("csv_engine", "pandas") == "pyarrow"
+                    and not self.export_config["index"]
+                    and self.export_config["encoding"].lower().replace("-", "") == "utf8"):
+                try:
+                    self._write_csv_pyarrow(df, file_path)
+                    return file_path
+                except (pa.ArrowException, TypeError, ValueError) as e:
+                    logger.warning(f"⚠️ Écriture CSV PyArrow impossible ({e}), repli sur pandas")
+            
             # Export avec optimisations
             df.to_csv(
                 file_path,
@@ -219,17 +301,42 @@ class AdvancedExporter:
             logger.error(f"❌ Erreur export CSV: {e}")
             return None
     
+    def _write_csv_pyarrow(self, df: pd.DataFrame, file_path: str):
+        """
+        Écrit le CSV avec pyarrow.csv (csv_engine="pyarrow")
+        
+        Le format diffère de DataFrame.to_csv: les flottants sont arrondis à la
+        précision de float_format sans zéros de remplissage (1.5 et non 1.500000),
+        les dates gardent leurs fractions de seconde (2024-01-01 00:00:00.000000)
+        et l'en-tête comme toutes les chaînes sont entre guillemets
+        """
+        decimals = self._float_format_decimals(self.export_config.get("float_format"))
+        if decimals is not None:
+            float_columns = df.select_dtypes(include=['floating']).columns
+            if len(float_columns):
+                df = df.copy(deep=False)  # Copy-on-Write: l'original reste intact
+                df[float_columns] = df[float_columns].round(decimals)
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, file_path, write_options=pa_csv.WriteOptions(include_header=True, batch_size=65536))
+    
+    @staticmethod
+    def _float_format_decimals(float_format: Optional[str]) -> Optional[int]:
+        """Nombre de décimales d'un format du type '%.6f' (None sinon)"""
+        if float_format and float_format.startswith("%.") and float_format.endswith("f"):
+            try:
+                return int(float_format[2:-1])
+            except ValueError:
+                return None
+        return None
+    
     def _export_geojson(self, df: pd.DataFrame, dataset_name: str, 
                         timestamp: str, output_dir: str) -> str:
-        """Export au format GeoJSON pour données géospatiales"""
-        if not GEOPANDAS_AVAILABLE:
-            logger.warning("⚠️ GeoPandas non disponible - export GeoJSON ignoré")
-            return None
-        
+        """Export au format GeoJSON (pyogrio ou écriture en flux, sans GeoDataFrame)"""
         try:
             # Détection des colonnes géographiques
-            lat_cols = [col for col in df.columns if any(term in col.lower() for term in ['lat', 'latitude'])]
-            lng_cols = [col for col in df.columns if any(term in col.lower() for term in ['lng', 'long', 'longitude'])]
+            lat_cols = [col for col in df.columns if any(term in str(col).lower() for term in ['lat', 'latitude'])]
+            lng_cols = [col for col in df.columns if any(term in str(col).lower() for term in ['lng', 'long', 'longitude'])]
             
             if not lat_cols or not lng_cols:
                 logger.warning("⚠️ Aucune colonne géographique détectée - export GeoJSON ignoré")
@@ -239,17 +346,54 @@ class AdvancedExporter:
             lat_col = lat_cols[0]
             lng_col = lng_cols[0]
             
-            # Création de la géométrie
-            geometry = [Point(xy) for xy in zip(df[lng_col], df[lat_col])]
+            lats = pd.to_numeric(df[lat_col], errors='coerce').to_numpy(dtype=float)
+            lngs = pd.to_numeric(df[lng_col], errors='coerce').to_numpy(dtype=float)
+            valid_coords = ~(np.isnan(lats) | np.isnan(lngs))
+            
+            # Aucune coordonnée exploitable: pas de fichier vide
+            if not valid_coords.any():
+                logger.warning("⚠️ Aucune coordonnée valide - export GeoJSON ignoré")
+                return None
             
-            # Création du GeoDataFrame
-            gdf = gpd.GeoDataFrame(df, geometry=geometry, crs="EPSG:4326")
+            # Seules les propriétés géolocalisées sont exportées
+            if not valid_coords.all():
+                df = df.loc[valid_coords]
+                lats = lats[valid_coords]
+                lngs = lngs[valid_coords]
+                valid_coords = valid_coords[valid_coords]
             
             # Export
             filename = f"{self.export_config['filename_prefix']}_{dataset_name}_{timestamp}.geojson"
             file_path = os.path.join(output_dir, filename)
             
-            gdf.to_file(file_path, driver='GeoJSON')
+            # Écriture native GDAL via Arrow lorsque pyogrio est disponible
+            if PYOGRIO_AVAILABLE:
+                try:
+                    self._write_geojson_pyogrio(df, lngs, lats, valid_coords, file_path)
+                    return file_path
+                except Exception as e:
+                    logger.warning(f"⚠️ Écriture pyogrio impossible ({e}), écriture en flux")
+            
+            # Écriture feature par feature, par blocs d'enregistrements : pas de géométries
+            # shapely, ni copie du DataFrame entier ni liste complète des enregistrements
+            chunk_size = max(1, self.export_config.get("chunk_size", 10000))
+            with open(file_path, 'wb') as f:
+                f.write(b'{"type":"FeatureCollection","features":[')
+                for start in range(0, len(df), chunk_size):
+                    chunk = df.iloc[start:start + chunk_size]
+                    if ORJSON_AVAILABLE:
+                        records = chunk.to_dict('records')  # orjson écrit NaN comme null
+                    else:
+                        records = chunk.astype(object).where(chunk.notna(), None).to_dict('records')
+                    for i, record in enumerate(records, start):
+                        if i:
+                            f.write(b',')
+                        geometry = None
+                        if valid_coords[i]:
+                            geometry = {"type": "Point", "coordinates": [float(lngs[i]), float(lats[i])]}
+                        feature = {"type": "Feature", "properties": record, "geometry": geometry}
+                        f.write(self._dumps_json(feature))
+                f.write(b']}')
             
             return file_path
             
@@ -257,6 +401,65 @@ class AdvancedExporter:
             logger.error(f"❌ Erreur export GeoJSON: {e}")
             return None
     
+    @staticmethod
+    def _write_geojson_pyogrio(df: pd.DataFrame, lngs: np.ndarray, lats: np.ndarray,
+                               valid_coords: np.ndarray, file_path: str):
+        """Écrit le GeoJSON avec pyogrio à partir de points WKB construits en bloc"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        
+        # Point WKB little-endian: 1 octet d'ordre, type 1 (uint32), x et y (float64)
+        points = np.empty(len(df), dtype=[('byte_order', 'u1'), ('geometry_type', '<u4'),
+                                          ('x', '<f8'), ('y', '<f8')])
+        points['byte_order'] = 1
+        points['geometry_type'] = 1
+        points['x'] = lngs
+        points['y'] = lats
+        
+        wkb = pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(points.dtype.itemsize), len(points), [None, pa.py_buffer(points.tobytes())]
+        ).cast(pa.binary())
+        wkb = pc.if_else(pa.array(valid_coords), wkb, pa.scalar(None, pa.binary()))
+        
+        table = pa.Table.from_pandas(df, preserve_index=False).append_column('geometry', wkb)
+        pyogrio.write_arrow(table, file_path, driver='GeoJSON', geometry_name='geometry',
+                            geometry_type='Point', crs='EPSG:4326')
+    
+    @staticmethod
+    def _count_map(counts: pd.Series) -> Dict[str, int]:
+        """Série de comptages -> dict JSON natif (clés str, valeurs int)"""
+        return {str(key): int(value) for key, value in counts.items()}
+    
+    @staticmethod
+    def _json_default(obj: Any) -> Any:
+        """Conversion des valeurs non sérialisables nativement (NaT, pd.NA, ...)"""
+        # Scalaires NumPy: .item() couvre tous les dtypes numériques et bool_
+        if isinstance(obj, np.generic) and not isinstance(obj, (np.datetime64, np.timedelta64)):
+            value = obj.item()
+            if isinstance(value, float) and math.isnan(value):
+                return None
+            return value
+        # Singletons manquants: évite la dispatch de pd.isna
+        if obj is pd.NaT or obj is pd.NA:
+            return None
+        try:
+            if pd.isna(obj):
+                return None
+        except (TypeError, ValueError):
+            pass
+        return str(obj)
+    
+    def _dumps_json(self, obj: Any, indent: bool = False) -> bytes:
+        """Sérialise un objet en JSON, compact ou indenté (orjson si disponible)"""
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, option=option, default=self._json_default)
+        return json.dumps(
+            obj, ensure_ascii=False, indent=2 if indent else None, default=self._json_default
+        ).encode(self.export_config["encoding"])
+    
     def _export_hdf5(self, df: pd.DataFrame, dataset_name: str, 
                      timestamp: str, output_dir: str) -> str:
         """Export au format HDF5 optimisé"""
@@ -321,20 +524,29 @@ class AdvancedExporter:
             filename = f"{self.export_config['filename_prefix']}_{dataset_name}_{timestamp}.json"
             file_path = os.path.join(output_dir, filename)
             
-            # Conversion en format JSON optimisé
-            json_data = {
-                "metadata": {
-                    "export_timestamp": timestamp,
-                    "dataset_name": dataset_name,
-                    "shape": df.shape,
-                    "columns": list(df.columns)
-                },
-                "data": df.to_dict('records')
+            # JSON Lines: une ligne par enregistrement, sans enveloppe
+            if self.export_config.get("json_lines", False):
+                file_path = os.path.splitext(file_path)[0] + ".jsonl"
+                df.to_json(file_path, orient='records', lines=True, force_ascii=False, date_format='iso')
+                return file_path
+            
+            metadata = {
+                "export_timestamp": timestamp,
+                "dataset_name": dataset_name,
+                "shape": df.shape,
+                "columns": list(df.columns)
             }
             
-            # Export avec indentation
-            with open(file_path, 'w', encoding=self.export_config["encoding"]) as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False, default=str)
+            # Écriture par blocs d'enregistrements : jamais tout le document en mémoire
+            chunk_size = max(1, self.export_config.get("chunk_size", 10000))
+            with open(file_path, 'wb') as f:
+                f.write(b'{"metadata":' + self._dumps_json(metadata) + b',"data":[')
+                for start in range(0, len(df), chunk_size):
+                    if start:
+                        f.write(b',')
+                    records = df.iloc[start:start + chunk_size].to_dict('records')
+                    f.write(self._dumps_json(records)[1:-1])  # Sans les crochets de la liste
+                f.write(b']}')
             
             return file_path
             
@@ -362,27 +574,17 @@ class AdvancedExporter:
         """Optimise le DataFrame pour l'export Parquet"""
         optimized_df = df.copy()
         
-        # Optimisation des types numériques
-        for col in optimized_df.select_dtypes(include=[np.number]).columns:
-            if optimized_df[col].dtype == 'float64':
-                # Conversion en float32 si possible
-                if optimized_df[col].notna().all():
-                    min_val = optimized_df[col].min()
-                    max_val = optimized_df[col].max()
-                    if min_val >= -3.4e38 and max_val <= 3.4e38:
-                        optimized_df[col] = optimized_df[col].astype('float32')
-            
-            elif optimized_df[col].dtype == 'int64':
-                # Conversion en int32 si possible
-                if optimized_df[col].notna().all():
-                    min_val = optimized_df[col].min()
-                    max_val = optimized_df[col].max()
-                    if min_val >= -2147483648 and max_val <= 2147483647:
-                        optimized_df[col] = optimized_df[col].astype('int32')
+        # Optimisation des types numériques (downcast, y compris avec NaN)
+        for col in optimized_df.select_dtypes(include=['integer']).columns:
+            optimized_df[col] = pd.to_numeric(optimized_df[col], downcast='integer')
+        
+        # float32 seulement si sans perte: coordonnées et montants restent en float64
+        for col in optimized_df.select_dtypes(include=['floating']).columns:
+            optimized_df[col] = downcast_float_lossless(optimized_df[col])
         
         # Optimisation des types catégoriels
-        for col in optimized_df.select_dtypes(include=['object']).columns:
-            if optimized_df[col].nunique() / len(optimized_df) < 0.5:  # Moins de 50% de valeurs uniques
+        for col in optimized_df.select_dtypes(include=['object', 'string']).columns:
+            if len(optimized_df) and optimized_df[col].nunique() / len(optimized_df) < 0.5:  # Moins de 50% de valeurs uniques
                 optimized_df[col] = optimized_df[col].astype('category')
         
         return optimized_df
@@ -439,15 +641,17 @@ class AdvancedExporter:
         logger.info(f"📊 === EXPORT AVEC MÉTADONNÉES: {dataset_name} ===")
         
         # Métadonnées par défaut
+        export_time = datetime.now()
         default_metadata = {
-            "export_timestamp": datetime.now().isoformat(),
+            "export_timestamp": export_time.isoformat(),
             "dataset_name": dataset_name,
             "shape": df.shape,
             "columns": list(df.columns),
-            "data_types": df.dtypes.to_dict(),
-            "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
-            "null_counts": df.isnull().sum().to_dict(),
-            "unique_counts": df.nunique().to_dict()
+            "data_types": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+            "dtype_counts": self._count_map(df.dtypes.astype(str).value_counts()),
+            "memory_usage_mb": estimate_memory_usage_mb(df),
+            "null_counts": self._count_map(len(df) - df.count()),  # count(): pas de masque booléen N×M
+            "unique_counts": self._count_map(df.nunique())
         }
         
         # Fusion avec les métadonnées fournies
@@ -459,19 +663,23 @@ class AdvancedExporter:
         Path(output_directory).mkdir(parents=True, exist_ok=True)
         
         # Export des métadonnées
-        timestamp = datetime.now().strftime(self.export_config["timestamp_format"])
+        timestamp = export_time.strftime(self.export_config["timestamp_format"])
         metadata_filename = f"{self.export_config['filename_prefix']}_{dataset_name}_metadata_{timestamp}.json"
         metadata_path = os.path.join(output_directory, metadata_filename)
         
         try:
-            with open(metadata_path, 'w', encoding=self.export_config["encoding"]) as f:
-                json.dump(default_metadata, f, indent=2, ensure_ascii=False, default=str)
+            with open(metadata_path, 'wb') as f:
+                f.write(self._dumps_json(default_metadata, indent=True))
             logger.info(f"📋 Métadonnées exportées: {metadata_path}")
         except Exception as e:
             logger.error(f"❌ Erreur export métadonnées: {e}")
         
         # Export du dataset principal
-        exported_files = self.export_dataset(df, dataset_name, output_dir=output_directory)
+        exported_files = self.export_dataset(
+            df, dataset_name, output_dir=output_directory,
+            memory_usage_mb=default_metadata["memory_usage_mb"],
+            timestamp=timestamp
+        )
         
         # Ajout du chemin des métadonnées
         exported_files["metadata"] = metadata_path
@@ -541,8 +749,8 @@ class AdvancedExporter:
         index_path = os.path.join(output_directory, index_filename)
         
         try:
-            with open(index_path, 'w', encoding=self.export_config["encoding"]) as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(index_path, 'wb') as f:
+                f.write(self._dumps_json(index_data, indent=True))
             logger.info(f"📋 Index des chunks exporté: {index_path}")
         except Exception as e:
             logger.error(f"❌ Erreur export index chunks: {e}")
@@ -603,6 +811,7 @@ class AdvancedExporter:
         
         # Détails par format
         report_content.append("## DÉTAILS PAR FORMAT")
+        file_stats = get_files_stats(export_record['exported_files'].values())
         for format_type, file_path in export_record['exported_files'].items():
             if str(file_path).startswith("ERROR"):
                 report_content.append(f"### ❌ {format_type.upper()}")
@@ -614,8 +823,8 @@ class AdvancedExporter:
                 report_content.append(f"**Fichier:** {file_path}")
                 
                 # Informations sur le fichier
-                if os.path.exists(file_path):
-                    file_size = os.path.getsize(file_path) / 1024 / 1024  # MB
+                if file_path in file_stats:
+                    file_size = file_stats[file_path].st_size / 1024 / 1024  # MB
                     report_content.append(f"**Taille:** {file_size:.2f} MB")
             
             report_content.append("")
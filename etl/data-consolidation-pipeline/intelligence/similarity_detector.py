@@ -17,6 +17,12 @@ from fuzzywuzzy import fuzz, process
 from difflib import SequenceMatcher
 import warnings
 
+# Détection des colonnes dupliquées par MinHash + LSH (utilitaire interne)
+try:
+    from ..utils.minhash import column_minhash_signatures, similar_column_groups
+except ImportError:
+    from utils.minhash import column_minhash_signatures, similar_column_groups
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -239,8 +245,38 @@ class SimilarityDetector:
         numeric_similarities = self._analyze_numeric_distributions(df, numeric_columns)
         content_groups.update(numeric_similarities)
         
+        # Colonnes aux valeurs quasi identiques (copies d'un même champ)
+        try:
+            content_groups.update(self._detect_by_value_overlap(df))
+        except Exception as e:
+            logger.warning(f"⚠️ Détection par recouvrement des valeurs ignorée: {e}")
+        
         return content_groups
     
+    def _detect_by_value_overlap(self, df: pd.DataFrame, threshold: float = 0.85,
+                                 min_unique: int = 10) -> Dict[str, List[str]]:
+        """
+        Détection des colonnes dont les ensembles de valeurs se recouvrent (Jaccard)
+        
+        Signatures MinHash + bandes LSH: seules les colonnes candidates sont comparées,
+        au lieu de toutes les paires. Les colonnes à faible cardinalité (Oui/Non...)
+        sont exclues: deux d'entre elles partagent trivialement le même ensemble
+        """
+        candidate_columns = []
+        for col in df.columns:
+            try:
+                if df[col].nunique() >= min_unique:
+                    candidate_columns.append(col)
+            except TypeError:
+                # Valeurs non hachables (tableaux MongoDB: images, photos...): colonne ignorée
+                continue
+        if len(candidate_columns) < 2:
+            return {}
+        
+        signatures = column_minhash_signatures(df[candidate_columns])
+        groups = similar_column_groups(signatures, candidate_columns, threshold=threshold)
+        return {f"value_overlap_group_{i + 1}": group for i, group in enumerate(groups)}
+    
     def _analyze_numeric_distributions(self, df: pd.DataFrame, numeric_columns: List[str]) -> Dict[str, List[str]]:
         """Analyse des distributions pour détecter des colonnes similaires"""
         distribution_groups = {}
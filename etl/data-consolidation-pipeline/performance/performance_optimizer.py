@@ -13,6 +13,7 @@ import numpy as np
 import logging
 from typing import Dict, List, Tuple, Optional, Any, Union, Callable
 import warnings
+import importlib.util
 import time
 import psutil
 import gc
@@ -21,46 +22,41 @@ from pathlib import Path
 import json
 from datetime import datetime
 
-# Imports conditionnels pour les bibliothèques d'optimisation
-try:
-    import dask.dataframe as dd
-    import dask.array as da
-    DASK_AVAILABLE = True
-except ImportError:
-    DASK_AVAILABLE = False
+# Détection des bibliothèques d'optimisation sans les importer:
+# find_spec ne fait que localiser le module, l'import réel (Dask, Modin,
+# Numba...) est différé au premier usage
+def _module_available(module_name: str) -> bool:
+    """Indique si un module est installé, sans l'exécuter"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+DASK_AVAILABLE = _module_available("dask")
+if not DASK_AVAILABLE:
     warnings.warn("Dask non disponible - parallélisation limitée")
 
-try:
-    import modin.pandas as mpd
-    MODIN_AVAILABLE = True
-except ImportError:
-    MODIN_AVAILABLE = False
+MODIN_AVAILABLE = _module_available("modin")
+if not MODIN_AVAILABLE:
     warnings.warn("Modin non disponible - parallélisation pandas limitée")
 
-try:
-    import numba
-    from numba import jit, prange
-    NUMBA_AVAILABLE = True
-    JIT_AVAILABLE = True
-except ImportError:
-    NUMBA_AVAILABLE = False
-    JIT_AVAILABLE = False
+NUMBA_AVAILABLE = JIT_AVAILABLE = _module_available("numba")
+if not NUMBA_AVAILABLE:
     warnings.warn("Numba non disponible - compilation JIT limitée")
 
-try:
-    import pyarrow as pa
-    PYARROW_AVAILABLE = True
-except ImportError:
-    PYARROW_AVAILABLE = False
+PYARROW_AVAILABLE = _module_available("pyarrow")
+if not PYARROW_AVAILABLE:
     warnings.warn("PyArrow non disponible - optimisations mémoire limitées")
 
-try:
-    from memory_profiler import profile
-    MEMORY_PROFILER_AVAILABLE = True
-except ImportError:
-    MEMORY_PROFILER_AVAILABLE = False
+MEMORY_PROFILER_AVAILABLE = _module_available("memory_profiler")
+if not MEMORY_PROFILER_AVAILABLE:
     warnings.warn("Memory Profiler non disponible - profilage mémoire limité")
 
+def jit(*args, **kwargs):
+    """Décorateur numba.jit importé à la demande"""
+    from numba import jit as numba_jit
+    return numba_jit(*args, **kwargs)
+
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
@@ -233,17 +229,17 @@ class PerformanceOptimizer:
         
         # === DÉTECTION AUTOMATIQUE DES TYPES ===
         for col in optimized_df.columns:
-            if optimized_df[col].dtype == 'object':
-                # Tentative de conversion en numérique
+            values = optimized_df[col]
+            if values.dtype == 'object':
+                # Une seule conversion par type: si errors='raise' réussit, le résultat
+                # est identique à errors='coerce' et peut être affecté directement
                 try:
-                    pd.to_numeric(optimized_df[col], errors='raise')
-                    optimized_df[col] = pd.to_numeric(optimized_df[col], errors='coerce')
+                    optimized_df[col] = pd.to_numeric(values, errors='raise')
                     logger.debug(f"🔢 Colonne '{col}' convertie en numérique")
                 except:
                     # Tentative de conversion en datetime
                     try:
-                        pd.to_datetime(optimized_df[col], errors='raise')
-                        optimized_df[col] = pd.to_datetime(optimized_df[col], errors='coerce')
+                        optimized_df[col] = pd.to_datetime(values, errors='raise')
                         logger.debug(f"📅 Colonne '{col}' convertie en datetime")
                     except:
                         pass
@@ -339,6 +335,7 @@ class PerformanceOptimizer:
         
         # === CONVERSION EN DASK DATAFRAME ===
         logger.info("🔄 Conversion en Dask DataFrame...")
+        import dask.dataframe as dd
         ddf = dd.from_pandas(df, npartitions=self._calculate_optimal_partitions(df))
         
         # === APPLICATION DE L'OPÉRATION ===
@@ -482,10 +479,10 @@ class PerformanceOptimizer:
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         for col in numeric_cols:
-            if df[col].notna().sum() > 10:  # Au moins 10 valeurs non-nulles
+            if df[col].count() > 10:  # Au moins 10 valeurs non-nulles
                 window = min(10, len(df) // 10)  # Fenêtre adaptative
                 df[f"{col}_rolling_mean"] = self._numba_rolling_mean(
-                    df[col].fillna(0).values, window
+                    df[col].to_numpy(dtype=np.float64, na_value=0.0), window
                 )
         
         return df
@@ -495,10 +492,10 @@ class PerformanceOptimizer:
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         for col in numeric_cols:
-            if df[col].notna().sum() > 10:
+            if df[col].count() > 10:
                 window = min(10, len(df) // 10)
                 df[f"{col}_rolling_std"] = self._numba_rolling_std(
-                    df[col].fillna(0).values, window
+                    df[col].to_numpy(dtype=np.float64, na_value=0.0), window
                 )
         
         return df
@@ -508,8 +505,8 @@ class PerformanceOptimizer:
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         for col in numeric_cols:
-            if df[col].notna().sum() > 10:
-                df[f"{col}_z_score"] = self._numba_z_score(df[col].fillna(0).values)
+            if df[col].count() > 10:
+                df[f"{col}_z_score"] = self._numba_z_score(df[col].to_numpy(dtype=np.float64, na_value=0.0))
         
         return df
     
@@ -518,9 +515,9 @@ class PerformanceOptimizer:
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         
         for col in numeric_cols:
-            if df[col].notna().sum() > 10:
+            if df[col].count() > 10:
                 df[f"{col}_is_outlier"] = self._numba_outlier_detection(
-                    df[col].fillna(0).values, threshold=3.0
+                    df[col].to_numpy(dtype=np.float64, na_value=0.0), threshold=3.0
                 )
         
         return df
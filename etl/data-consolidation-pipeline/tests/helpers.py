@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧰 UTILITAIRES DE TEST - PIPELINE ULTRA-INTELLIGENT
+====================================================
+
+Fonctions partagées par les scripts de test (construction des datasets, exécution des tests)
+"""
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+def text_column(n_rows: int, prefix: str, suffix: str = '') -> pd.Series:
+    """
+    Colonne texte 'prefix{i}suffix' pour i = 0..n_rows-1
+    
+    Concaténation vectorisée sur le dtype str par défaut (Arrow avec pandas 3,
+    valeurs manquantes en NaN comme le reste du pipeline) au lieu d'un f-string par ligne
+    """
+    return prefix + pd.Series(np.arange(n_rows).astype(str), dtype="str") + suffix
+
+def _run_test(test_name: str, test_func: Callable[[], bool]) -> str:
+    """Exécute un test (dans un processus du pool) et renvoie son statut"""
+    logger.info(f"\n{'='*60}")
+    logger.info(f"🧪 TEST: {test_name}")
+    logger.info(f"{'='*60}")
+    
+    try:
+        success = test_func()
+        return "✅ SUCCÈS" if success else "❌ ÉCHEC"
+    except Exception as e:
+        logger.error(f"❌ Erreur critique dans {test_name}: {e}")
+        return "💥 ERREUR CRITIQUE"
+
+def run_tests_in_processes(tests: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, str]:
+    """
+    Exécute des tests indépendants (aucun état partagé), un processus par test
+    
+    Args:
+        tests: Couples (nom du test, fonction renvoyant True en cas de succès)
+        
+    Returns:
+        Dict nom du test -> statut, dans l'ordre de la liste
+    """
+    with ProcessPoolExecutor(max_workers=min(len(tests), os.cpu_count() or 1)) as executor:
+        futures = {test_name: executor.submit(_run_test, test_name, test_func) for test_name, test_func in tests}
+        return {test_name: future.result() for test_name, future in futures.items()}
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DE L'EXPORTEUR AVANCÉ
+==============================
+
+Tests unitaires de l'AdvancedExporter (export GeoJSON en flux)
+"""
+
+import sys
+import os
+import json
+import logging
+import tempfile
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export import advanced_exporter
+from export.advanced_exporter import AdvancedExporter
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_export_geojson_streams_in_chunks(monkeypatch, use_orjson):
+    """Features écrites par blocs: document valide, coordonnées et propriétés alignées"""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(advanced_exporter, "ORJSON_AVAILABLE", use_orjson)
+    monkeypatch.setattr(advanced_exporter, "PYOGRIO_AVAILABLE", False)
+
+    df = pd.DataFrame({
+        'latitude': [45.5, np.nan, 46.8, 45.6, 46.3],
+        'longitude': [-73.6, -73.5, -71.2, -73.7, -72.5],
+        'price': [350000.0, 420000.0, np.nan, 510000.0, 275000.0],
+        'city': ['Montréal', 'Laval', 'Québec', 'Laval', 'Trois-Rivières']
+    })
+    exporter = AdvancedExporter()
+    exporter.export_config["chunk_size"] = 2
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = exporter._export_geojson(df, "geo_test", "20240101", tmp_dir)
+        with open(file_path, encoding='utf-8') as f:
+            document = json.load(f)
+
+    features = document["features"]
+    assert [feature["properties"]["city"] for feature in features] == ['Montréal', 'Québec', 'Laval', 'Trois-Rivières']
+    assert features[1]["properties"]["price"] is None
+    assert features[3]["geometry"]["coordinates"] == [-72.5, 46.3]
+
+def test_parquet_optimization_keeps_float_precision():
+    """float32 uniquement si l'aller-retour est exact: coordonnées et prix restent en float64"""
+    df = pd.DataFrame({
+        'latitude': [45.5017123, np.nan, 46.8138],
+        'price': [1234.56, 350000.0, np.nan],
+        'bathrooms': [1.5, np.nan, 2.0],
+        'surface': pd.array([120.25, None, 98.5], dtype='Float64')
+    })
+    optimized = AdvancedExporter()._optimize_dataframe_for_parquet(df)
+
+    assert optimized['latitude'].dtype == np.float64
+    assert optimized['price'].dtype == np.float64
+    assert optimized['bathrooms'].dtype == np.float32
+    assert str(optimized['surface'].dtype) == 'Float32'
+    for col in df.columns:
+        np.testing.assert_array_equal(optimized[col].to_numpy(dtype=np.float64, na_value=np.nan),
+                                      df[col].to_numpy(dtype=np.float64, na_value=np.nan))
@@ -18,11 +18,13 @@ from pathlib import Path
 # Ajout du répertoire parent au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.helpers import run_tests_in_processes, text_column
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def create_test_dataset_with_78_columns():
+def create_test_dataset_with_78_columns(seed=42):
     """
     Crée un dataset de test avec exactement 78 colonnes comme spécifié
     dans le real_estate_prompt.md
@@ -31,12 +33,14 @@ def create_test_dataset_with_78_columns():
     
     # Création de données de test réalistes
     n_rows = 100
+    # Générateur unique initialisé par seed: dataset reproductible, sans état global
+    rng = np.random.default_rng(seed)
     
     test_data = pd.DataFrame({
         # === IDENTIFIANTS (8 colonnes) ===
         '_id': range(n_rows),
-        'link': [f'https://exemple.com/propriete/{i}' for i in range(n_rows)],
-        'company': ['Royal LePage', 'Century 21', 'RE/MAX'] * (n_rows // 3 + 1),
+        'link': text_column(n_rows, 'https://exemple.com/propriete/'),
+        'company': rng.choice(['Royal LePage', 'Century 21', 'RE/MAX'], size=n_rows),
         'version': ['1.0'] * n_rows,
         'created_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
         'updated_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
@@ -44,98 +48,97 @@ def create_test_dataset_with_78_columns():
         'add_date': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
         
         # === LOCALISATION (8 colonnes) ===
-        'address': [f'123 Rue Principale #{i}' for i in range(n_rows)],
-        'full_address': [f'123 Rue Principale #{i}, Montréal, QC' for i in range(n_rows)],
-        'city': ['Montréal', 'Québec', 'Laval'] * (n_rows // 3 + 1),
+        'address': text_column(n_rows, '123 Rue Principale #'),
+        'full_address': text_column(n_rows, '123 Rue Principale #', ', Montréal, QC'),
+        'city': rng.choice(['Montréal', 'Québec', 'Laval'], size=n_rows),
         'region': ['QC'] * n_rows,
-        'longitude': np.random.uniform(-73.8, -73.4, n_rows),
-        'latitude': np.random.uniform(45.4, 45.7, n_rows),
-        'location': [f'Montréal, QC #{i}' for i in range(n_rows)],
-        'geolocation': [f'45.5,-73.6#{i}' for i in range(n_rows)],
-        'geo': [f'45.5,-73.6#{i}' for i in range(n_rows)],
-        'postal_code': ['H1A 1A1', 'H2B 2B2', 'H3C 3C3'] * (n_rows // 3 + 1),
+        'longitude': rng.uniform(-73.8, -73.4, n_rows),
+        'latitude': rng.uniform(45.4, 45.7, n_rows),
+        'location': text_column(n_rows, 'Montréal, QC #'),
+        'geolocation': text_column(n_rows, '45.5,-73.6#'),
+        'geo': text_column(n_rows, '45.5,-73.6#'),
+        'postal_code': rng.choice(['H1A 1A1', 'H2B 2B2', 'H3C 3C3'], size=n_rows),
         
         # === PRIX & ÉVALUATIONS (11 colonnes) ===
-        'price': np.random.uniform(200000, 2000000, n_rows),
-        'price_assessment': np.random.uniform(180000, 1800000, n_rows),
-        'prix_evaluation': np.random.uniform(180000, 1800000, n_rows),
-        'evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-        'evaluation_terrain': np.random.uniform(80000, 800000, n_rows),
-        'evaluation_batiment': np.random.uniform(100000, 1000000, n_rows),
-        'municipal_evaluation_building': np.random.uniform(100000, 1000000, n_rows),
-        'municipal_evaluation_land': np.random.uniform(80000, 800000, n_rows),
-        'municipal_evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-        'evaluation_year': np.random.randint(2018, 2025, n_rows),
-        'municipal_evaluation_year': np.random.randint(2018, 2025, n_rows),
+        'price': rng.uniform(200000, 2000000, n_rows),
+        'price_assessment': rng.uniform(180000, 1800000, n_rows),
+        'prix_evaluation': rng.uniform(180000, 1800000, n_rows),
+        'evaluation_total': rng.uniform(180000, 1800000, n_rows),
+        'evaluation_terrain': rng.uniform(80000, 800000, n_rows),
+        'evaluation_batiment': rng.uniform(100000, 1000000, n_rows),
+        'municipal_evaluation_building': rng.uniform(100000, 1000000, n_rows),
+        'municipal_evaluation_land': rng.uniform(80000, 800000, n_rows),
+        'municipal_evaluation_total': rng.uniform(180000, 1800000, n_rows),
+        'evaluation_year': rng.integers(2018, 2025, n_rows),
+        'municipal_evaluation_year': rng.integers(2018, 2025, n_rows),
         
         # === REVENUS (6 colonnes) ===
-        'revenu': np.random.uniform(15000, 150000, n_rows),
-        'plex-revenue': np.random.uniform(15000, 150000, n_rows),
-        'plex-revenu': np.random.uniform(15000, 150000, n_rows),
-        'plex_revenu': np.random.uniform(15000, 150000, n_rows),
-        'potential_gross_revenue': np.random.uniform(15000, 150000, n_rows),
-        'revenus_annuels_bruts': np.random.uniform(15000, 150000, n_rows),
+        'revenu': rng.uniform(15000, 150000, n_rows),
+        'plex-revenue': rng.uniform(15000, 150000, n_rows),
+        'plex-revenu': rng.uniform(15000, 150000, n_rows),
+        'plex_revenu': rng.uniform(15000, 150000, n_rows),
+        'potential_gross_revenue': rng.uniform(15000, 150000, n_rows),
+        'revenus_annuels_bruts': rng.uniform(15000, 150000, n_rows),
         'revenu_period': ['Annuel'] * n_rows,
         
         # === TAXES (5 colonnes) ===
-        'municipal_taxes': np.random.uniform(2000, 20000, n_rows),
-        'school_taxes': np.random.uniform(1000, 10000, n_rows),
-        'municipal_tax': np.random.uniform(2000, 20000, n_rows),
-        'school_tax': np.random.uniform(1000, 10000, n_rows),
-        'taxes': np.random.uniform(3000, 30000, n_rows),
+        'municipal_taxes': rng.uniform(2000, 20000, n_rows),
+        'school_taxes': rng.uniform(1000, 10000, n_rows),
+        'municipal_tax': rng.uniform(2000, 20000, n_rows),
+        'school_tax': rng.uniform(1000, 10000, n_rows),
+        'taxes': rng.uniform(3000, 30000, n_rows),
         
         # === CARACTÉRISTIQUES (7 colonnes) ===
-        'surface': np.random.uniform(50, 500, n_rows),
-        'living_area': np.random.uniform(50, 500, n_rows),
-        'superficie': np.random.uniform(50, 500, n_rows),
-        'construction_year': np.random.randint(1950, 2025, n_rows),
-        'year_built': np.random.randint(1950, 2025, n_rows),
-        'annee': np.random.randint(1950, 2025, n_rows),
-        'lot_size': np.random.uniform(100, 1000, n_rows),
+        'surface': rng.uniform(50, 500, n_rows),
+        'living_area': rng.uniform(50, 500, n_rows),
+        'superficie': rng.uniform(50, 500, n_rows),
+        'construction_year': rng.integers(1950, 2025, n_rows),
+        'year_built': rng.integers(1950, 2025, n_rows),
+        'annee': rng.integers(1950, 2025, n_rows),
+        'lot_size': rng.uniform(100, 1000, n_rows),
         
         # === PROPRIÉTÉ (8 colonnes) ===
-        'type': ['Maison', 'Appartement', 'Duplex', 'Triplex'] * (n_rows // 4 + 1),
-        'bedrooms': np.random.randint(1, 6, n_rows),
-        'nb_bedroom': np.random.randint(1, 6, n_rows),
-        'nbr_chanbres': np.random.randint(1, 6, n_rows),
-        'rooms': np.random.randint(3, 10, n_rows),
-        'bathrooms': np.random.randint(1, 4, n_rows),
-        'nb_bathroom': np.random.randint(1, 4, n_rows),
-        'nbr_sal_bain': np.random.randint(1, 4, n_rows),
-        'water_rooms': np.random.randint(1, 3, n_rows),
-        'nbr_sal_deau': np.random.randint(1, 3, n_rows),
-        'nb_water_room': np.random.randint(1, 3, n_rows),
-        'unites': np.random.randint(1, 5, n_rows),
-        'residential_units': np.random.randint(1, 5, n_rows),
-        'commercial_units': np.random.randint(0, 3, n_rows),
-        'parking': np.random.randint(0, 4, n_rows),
-        'nb_parking': np.random.randint(0, 4, n_rows),
-        'nb_garage': np.random.randint(0, 3, n_rows),
-        'basement': ['Oui', 'Non', 'Partiel'] * (n_rows // 3 + 1),
-        'building_style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
-        'style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
+        'type': rng.choice(['Maison', 'Appartement', 'Duplex', 'Triplex'], size=n_rows),
+        'bedrooms': rng.integers(1, 6, n_rows),
+        'nb_bedroom': rng.integers(1, 6, n_rows),
+        'nbr_chanbres': rng.integers(1, 6, n_rows),
+        'rooms': rng.integers(3, 10, n_rows),
+        'bathrooms': rng.integers(1, 4, n_rows),
+        'nb_bathroom': rng.integers(1, 4, n_rows),
+        'nbr_sal_bain': rng.integers(1, 4, n_rows),
+        'water_rooms': rng.integers(1, 3, n_rows),
+        'nbr_sal_deau': rng.integers(1, 3, n_rows),
+        'nb_water_room': rng.integers(1, 3, n_rows),
+        'unites': rng.integers(1, 5, n_rows),
+        'residential_units': rng.integers(1, 5, n_rows),
+        'commercial_units': rng.integers(0, 3, n_rows),
+        'parking': rng.integers(0, 4, n_rows),
+        'nb_parking': rng.integers(0, 4, n_rows),
+        'nb_garage': rng.integers(0, 3, n_rows),
+        'basement': rng.choice(['Oui', 'Non', 'Partiel'], size=n_rows),
+        'building_style': rng.choice(['Moderne', 'Traditionnel', 'Contemporain'], size=n_rows),
+        'style': rng.choice(['Moderne', 'Traditionnel', 'Contemporain'], size=n_rows),
         
         # === GESTION (7 colonnes) ===
-        'depenses': np.random.uniform(5000, 50000, n_rows),
-        'expense': np.random.uniform(5000, 50000, n_rows),
+        'depenses': rng.uniform(5000, 50000, n_rows),
+        'expense': rng.uniform(5000, 50000, n_rows),
         'expense_period': ['Annuel'] * n_rows,
-        'vendue': ['Non', 'Oui', 'En cours'] * (n_rows // 3 + 1),
-        'description': [f'Belle propriété #{i}' for i in range(n_rows)],
-        'img_src': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
-        'image': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
-        'images': [f'https://exemple.com/images_{i}.jpg' for i in range(n_rows)],
-        'main_unit_details': [f'Détails unité #{i}' for i in range(n_rows)],
+        'vendue': rng.choice(['Non', 'Oui', 'En cours'], size=n_rows),
+        'description': text_column(n_rows, 'Belle propriété #'),
+        'img_src': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
+        'image': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
+        'images': text_column(n_rows, 'https://exemple.com/images_', '.jpg'),
+        'main_unit_details': text_column(n_rows, 'Détails unité #'),
         
         # === MÉTADONNÉES (1 colonne) ===
-        'extraction_metadata': [f'Metadata extraction #{i}' for i in range(n_rows)]
+        'extraction_metadata': text_column(n_rows, 'Metadata extraction #')
     })
     
-    # Ajout de valeurs manquantes pour tester la consolidation
-    for col in test_data.columns:
-        if test_data[col].dtype in ['object', 'float64']:
-            # 20% de valeurs manquantes aléatoires
-            mask = np.random.choice([True, False], size=n_rows, p=[0.2, 0.8])
-            test_data.loc[mask, col] = np.nan
+    # Ajout de valeurs manquantes pour tester la consolidation: 20% des cellules
+    # texte et flottantes, en un seul masque 2-D (les entiers ne sont pas convertis)
+    nullable_columns = test_data.select_dtypes(include=['object', 'string', 'float64']).columns
+    missing_mask = rng.random((n_rows, len(nullable_columns))) < 0.2
+    test_data[nullable_columns] = test_data[nullable_columns].mask(missing_mask)
     
     logger.info(f"✅ Dataset créé: {test_data.shape[0]} lignes × {test_data.shape[1]} colonnes")
     logger.info(f"📊 Colonnes: {list(test_data.columns)}")
@@ -196,9 +199,9 @@ def test_consolidation_strategy():
         # === DÉTAIL DES RÉSULTATS ===
         for group_name, result in consolidation_results.items():
             if result.get('status') == 'success':
-                logger.info(f"✅ {group_name}: {result.get('completeness', 0):.1f}% complétude")
+                logger.info("✅ %s: %.1f%% complétude", group_name, result.get('completeness', 0))
             else:
-                logger.warning(f"⚠️ {group_name}: {result.get('error', 'Erreur inconnue')}")
+                logger.warning("⚠️ %s: %s", group_name, result.get('error', 'Erreur inconnue'))
         
         return True
         
@@ -231,7 +234,7 @@ def test_specific_consolidation_groups():
         for group in config.CONSOLIDATION_GROUPS:
             if group.name in key_groups:
                 found_groups.append(group.name)
-                logger.info(f"✅ Groupe clé trouvé: {group.name} → {group.final_column}")
+                logger.info("✅ Groupe clé trouvé: %s → %s", group.name, group.final_column)
         
         missing_groups = set(key_groups) - set(found_groups)
         if missing_groups:
@@ -274,19 +277,7 @@ def main():
         ("Stratégie de Consolidation", test_consolidation_strategy)
     ]
     
-    results = {}
-    
-    for test_name, test_func in tests:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"🧪 TEST: {test_name}")
-        logger.info(f"{'='*60}")
-        
-        try:
-            success = test_func()
-            results[test_name] = "✅ SUCCÈS" if success else "❌ ÉCHEC"
-        except Exception as e:
-            logger.error(f"❌ Erreur critique dans {test_name}: {e}")
-            results[test_name] = "💥 ERREUR CRITIQUE"
+    results = run_tests_in_processes(tests)
     
     # === RÉSUMÉ DES TESTS ===
     logger.info(f"\n{'='*70}")
@@ -294,7 +285,7 @@ def main():
     logger.info(f"{'='*70}")
     
     for test_name, result in results.items():
-        logger.info(f"{test_name:35} : {result}")
+        logger.info("%-35s : %s", test_name, result)
     
     success_count = sum(1 for result in results.values() if "SUCCÈS" in result)
     total_count = len(results)
@@ -18,6 +18,8 @@ from pathlib import Path
 # Ajout du répertoire parent au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.helpers import run_tests_in_processes, text_column
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -41,20 +43,28 @@ def test_custom_config_integration():
         logger.info(f"   - Colonnes finales estimées: {summary['estimated_final_columns']}")
         logger.info(f"   - Réduction estimée: {summary['estimated_reduction']}")
         
+        # Listes purement informatives: un seul enregistrement de log par liste,
+        # formaté seulement si le niveau INFO est actif
+        log_details = logger.isEnabledFor(logging.INFO)
+        
         # === VÉRIFICATION DES GROUPES DE CONSOLIDATION ===
-        logger.info(f"\n🏗️ Groupes de consolidation configurés:")
-        for group in custom_config.CONSOLIDATION_GROUPS:
-            logger.info(f"   {group.name} → {group.final_column}: {len(group.source_columns)} colonnes")
+        if log_details:
+            logger.info("\n🏗️ Groupes de consolidation configurés:\n%s", "\n".join(
+                f"   {group.name} → {group.final_column}: {len(group.source_columns)} colonnes"
+                for group in custom_config.CONSOLIDATION_GROUPS
+            ))
         
         # === VÉRIFICATION DES CHAMPS PRÉSERVÉS ===
-        logger.info(f"\n🔧 Champs préservés sans consolidation:")
-        for col in custom_config.PRESERVED_COLUMNS:
-            logger.info(f"   - {col}")
+        if log_details:
+            logger.info("\n🔧 Champs préservés sans consolidation:\n%s", "\n".join(
+                f"   - {col}" for col in custom_config.PRESERVED_COLUMNS
+            ))
         
         # === VÉRIFICATION DES COLONNES À SUPPRIMER ===
-        logger.info(f"\n🗑️ Colonnes à supprimer:")
-        for col in custom_config.COLUMNS_TO_REMOVE:
-            logger.info(f"   - {col}")
+        if log_details:
+            logger.info("\n🗑️ Colonnes à supprimer:\n%s", "\n".join(
+                f"   - {col}" for col in custom_config.COLUMNS_TO_REMOVE
+            ))
         
         return True
         
@@ -126,131 +136,158 @@ def test_consolidation_with_custom_config():
         logger.error(f"❌ Erreur lors du test de consolidation: {e}")
         return False
 
-def create_test_dataset_with_67_columns():
+def create_test_dataset_with_67_columns(seed=42):
     """Crée un dataset de test avec exactement 67 colonnes comme dans votre configuration"""
     logger.info("🏗️ === CRÉATION DU DATASET DE TEST AVEC 67 COLONNES ===")
     
     # Création de données de test réalistes
     n_rows = 100
+    # Générateur unique initialisé par seed: dataset reproductible, sans état global
+    rng = np.random.default_rng(seed)
     
-    test_data = pd.DataFrame({
+    def categorical(values):
+        # Colonnes à faible cardinalité: codes entiers + dictionnaire de valeurs
+        return pd.Categorical.from_codes(rng.integers(0, len(values), n_rows), categories=values)
+    
+    # Colonnes numériques: une matrice 2-D par type (un seul bloc float64 et un
+    # seul bloc int64) au lieu d'un tableau alloué par colonne
+    float_ranges = {
         # === PRIX & ÉVALUATIONS ===
-        'price': np.random.uniform(200000, 2000000, n_rows),
-        'prix_evaluation': np.random.uniform(180000, 1800000, n_rows),
-        'price_assessment': np.random.uniform(180000, 1800000, n_rows),
+        'price': (200000, 2000000),
+        'prix_evaluation': (180000, 1800000),
+        'price_assessment': (180000, 1800000),
         
         # === SURFACE ===
-        'surface': np.random.uniform(50, 500, n_rows),
-        'living_area': np.random.uniform(50, 500, n_rows),
-        'superficie': np.random.uniform(50, 500, n_rows),
-        'lot_size': np.random.uniform(100, 1000, n_rows),
-        
-        # === CHAMBRES ===
-        'bedrooms': np.random.randint(1, 6, n_rows),
-        'nbr_chanbres': np.random.randint(1, 6, n_rows),
-        'nb_bedroom': np.random.randint(1, 6, n_rows),
-        'rooms': np.random.randint(3, 10, n_rows),
-        
-        # === SALLES DE BAIN ===
-        'bathrooms': np.random.randint(1, 4, n_rows),
-        'nbr_sal_deau': np.random.randint(1, 3, n_rows),
-        'nbr_sal_bain': np.random.randint(1, 4, n_rows),
-        'nb_bathroom': np.random.randint(1, 4, n_rows),
-        'water_rooms': np.random.randint(1, 3, n_rows),
-        'nb_water_room': np.random.randint(1, 3, n_rows),
+        'surface': (50, 500),
+        'living_area': (50, 500),
+        'superficie': (50, 500),
+        'lot_size': (100, 1000),
         
         # === COORDONNÉES ===
-        'latitude': np.random.uniform(45.4, 45.7, n_rows),
-        'longitude': np.random.uniform(-73.8, -73.4, n_rows),
-        'geolocation': [f'45.5,-73.6#{i}' for i in range(n_rows)],
-        'geo': [f'45.5,-73.6#{i}' for i in range(n_rows)],
-        
-        # === ADRESSES ===
-        'address': [f'123 Rue Principale #{i}' for i in range(n_rows)],
-        'full_address': [f'123 Rue Principale #{i}, Montréal, QC' for i in range(n_rows)],
-        'location': [f'Montréal, QC #{i}' for i in range(n_rows)],
-        'city': ['Montréal', 'Québec', 'Laval'] * (n_rows // 3 + 1),
-        'postal_code': ['H1A 1A1', 'H2B 2B2', 'H3C 3C3'] * (n_rows // 3 + 1),
-        
-        # === TYPE PROPRIÉTÉ ===
-        'type': ['Maison', 'Appartement', 'Duplex', 'Triplex'] * (n_rows // 4 + 1),
-        'building_style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
-        'style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
-        
-        # === ANNÉE CONSTRUCTION ===
-        'year_built': np.random.randint(1950, 2025, n_rows),
-        'construction_year': np.random.randint(1950, 2025, n_rows),
-        'annee': np.random.randint(1950, 2025, n_rows),
+        'latitude': (45.4, 45.7),
+        'longitude': (-73.8, -73.4),
         
         # === TAXES ===
-        'municipal_taxes': np.random.uniform(2000, 20000, n_rows),
-        'municipal_tax': np.random.uniform(2000, 20000, n_rows),
-        'taxes': np.random.uniform(3000, 30000, n_rows),
-        'school_taxes': np.random.uniform(1000, 10000, n_rows),
-        'school_tax': np.random.uniform(1000, 10000, n_rows),
+        'municipal_taxes': (2000, 20000),
+        'municipal_tax': (2000, 20000),
+        'taxes': (3000, 30000),
+        'school_taxes': (1000, 10000),
+        'school_tax': (1000, 10000),
         
         # === ÉVALUATIONS ===
-        'evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-        'municipal_evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-        'evaluation_terrain': np.random.uniform(80000, 800000, n_rows),
-        'evaluation_batiment': np.random.uniform(100000, 1000000, n_rows),
-        'municipal_evaluation_land': np.random.uniform(80000, 800000, n_rows),
-        'municipal_evaluation_building': np.random.uniform(100000, 1000000, n_rows),
+        'evaluation_total': (180000, 1800000),
+        'municipal_evaluation_total': (180000, 1800000),
+        'evaluation_terrain': (80000, 800000),
+        'evaluation_batiment': (100000, 1000000),
+        'municipal_evaluation_land': (80000, 800000),
+        'municipal_evaluation_building': (100000, 1000000),
         
         # === REVENUS ===
-        'revenu': np.random.uniform(15000, 150000, n_rows),
-        'revenus_annuels_bruts': np.random.uniform(15000, 150000, n_rows),
-        'plex-revenu': np.random.uniform(15000, 150000, n_rows),
-        'plex_revenu': np.random.uniform(15000, 150000, n_rows),
-        'potential_gross_revenue': np.random.uniform(15000, 150000, n_rows),
+        'revenu': (15000, 150000),
+        'revenus_annuels_bruts': (15000, 150000),
+        'plex-revenu': (15000, 150000),
+        'plex_revenu': (15000, 150000),
+        'potential_gross_revenue': (15000, 150000),
         
         # === DÉPENSES ===
-        'expense': np.random.uniform(5000, 50000, n_rows),
-        'depenses': np.random.uniform(5000, 50000, n_rows),
-        'expense_period': ['Annuel'] * n_rows,
+        'expense': (5000, 50000),
+        'depenses': (5000, 50000)
+    }
+    
+    int_ranges = {  # bornes [min, max)
+        # === CHAMBRES ===
+        'bedrooms': (1, 6),
+        'nbr_chanbres': (1, 6),
+        'nb_bedroom': (1, 6),
+        'rooms': (3, 10),
+        
+        # === SALLES DE BAIN ===
+        'bathrooms': (1, 4),
+        'nbr_sal_deau': (1, 3),
+        'nbr_sal_bain': (1, 4),
+        'nb_bathroom': (1, 4),
+        'water_rooms': (1, 3),
+        'nb_water_room': (1, 3),
+        
+        # === ANNÉE CONSTRUCTION ===
+        'year_built': (1950, 2025),
+        'construction_year': (1950, 2025),
+        'annee': (1950, 2025),
         
         # === PARKING ===
-        'nb_parking': np.random.randint(0, 4, n_rows),
-        'parking': np.random.randint(0, 4, n_rows),
-        'nb_garage': np.random.randint(0, 3, n_rows),
+        'nb_parking': (0, 4),
+        'parking': (0, 4),
+        'nb_garage': (0, 3),
         
         # === UNITÉS ===
-        'unites': np.random.randint(1, 5, n_rows),
-        'residential_units': np.random.randint(1, 5, n_rows),
-        'commercial_units': np.random.randint(0, 3, n_rows),
+        'unites': (1, 5),
+        'residential_units': (1, 5),
+        'commercial_units': (0, 3),
+        
+        # === CHAMPS PRÉSERVÉS ===
+        'evaluation_year': (2018, 2025),
+        'municipal_evaluation_year': (2018, 2025)
+    }
+    
+    def numeric_block(ranges, draw):
+        low, high = np.array(list(ranges.values())).T
+        return pd.DataFrame(draw(low, high, size=(n_rows, len(ranges))), columns=list(ranges))
+    
+    other_columns = pd.DataFrame({
+        # === COORDONNÉES ===
+        'geolocation': text_column(n_rows, '45.5,-73.6#'),
+        'geo': text_column(n_rows, '45.5,-73.6#'),
+        
+        # === ADRESSES ===
+        'address': text_column(n_rows, '123 Rue Principale #'),
+        'full_address': text_column(n_rows, '123 Rue Principale #', ', Montréal, QC'),
+        'location': text_column(n_rows, 'Montréal, QC #'),
+        'city': categorical(['Montréal', 'Québec', 'Laval']),
+        'postal_code': rng.choice(['H1A 1A1', 'H2B 2B2', 'H3C 3C3'], size=n_rows),
+        
+        # === TYPE PROPRIÉTÉ ===
+        'type': categorical(['Maison', 'Appartement', 'Duplex', 'Triplex']),
+        'building_style': categorical(['Moderne', 'Traditionnel', 'Contemporain']),
+        'style': rng.choice(['Moderne', 'Traditionnel', 'Contemporain'], size=n_rows),
+        
+        # === DÉPENSES ===
+        'expense_period': categorical(['Annuel']),
         
         # === IMAGES ===
-        'image': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
-        'images': [f'https://exemple.com/images_{i}.jpg' for i in range(n_rows)],
-        'img_src': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
+        'image': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
+        'images': text_column(n_rows, 'https://exemple.com/images_', '.jpg'),
+        'img_src': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
         
         # === PÉRIODES ===
-        'revenu_period': ['Annuel'] * n_rows,
+        'revenu_period': categorical(['Annuel']),
         
         # === SOUS-SOL ===
-        'basement': ['Oui', 'Non', 'Partiel'] * (n_rows // 3 + 1),
+        'basement': categorical(['Oui', 'Non', 'Partiel']),
         
         # === CHAMPS PRÉSERVÉS ===
-        'main_unit_details': [f'Détails unité #{i}' for i in range(n_rows)],
-        'vendue': ['Non', 'Oui', 'En cours'] * (n_rows // 3 + 1),
-        'description': [f'Belle propriété #{i}' for i in range(n_rows)],
+        'main_unit_details': text_column(n_rows, 'Détails unité #'),
+        'vendue': rng.choice(['Non', 'Oui', 'En cours'], size=n_rows),
+        'description': text_column(n_rows, 'Belle propriété #'),
         '_id': range(n_rows),
         'updated_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-        'evaluation_year': np.random.randint(2018, 2025, n_rows),
         'add_date': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
         'created_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-        'municipal_evaluation_year': np.random.randint(2018, 2025, n_rows),
         'update_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-        'region': ['QC'] * n_rows,
-        'extraction_metadata': [f'Metadata extraction #{i}' for i in range(n_rows)]
+        'region': categorical(['QC']),
+        'extraction_metadata': text_column(n_rows, 'Metadata extraction #')
     })
     
-    # Ajout de valeurs manquantes pour tester la consolidation
-    for col in test_data.columns:
-        if test_data[col].dtype in ['object', 'float64']:
-            # 20% de valeurs manquantes aléatoires
-            mask = np.random.choice([True, False], size=n_rows, p=[0.2, 0.8])
-            test_data.loc[mask, col] = np.nan
+    test_data = pd.concat([
+        numeric_block(float_ranges, rng.uniform),
+        numeric_block(int_ranges, rng.integers),
+        other_columns
+    ], axis=1)
+    
+    # Ajout de valeurs manquantes pour tester la consolidation: 20% des cellules
+    # texte et flottantes, en un seul masque 2-D (les entiers ne sont pas convertis)
+    nullable_columns = test_data.columns.isin(test_data.select_dtypes(include=['object', 'string', 'float64']).columns)
+    missing_mask = (rng.random(test_data.shape) < 0.2) & nullable_columns
+    test_data = test_data.mask(missing_mask)
     
     logger.info(f"✅ Dataset créé: {test_data.shape[0]} lignes × {test_data.shape[1]} colonnes")
     logger.info(f"📊 Colonnes: {list(test_data.columns)}")
@@ -266,19 +303,7 @@ def main():
         ("Consolidation avec Config Personnalisée", test_consolidation_with_custom_config)
     ]
     
-    results = {}
-    
-    for test_name, test_func in tests:
-        logger.info(f"\n{'='*60}")
-        logger.info(f"🧪 TEST: {test_name}")
-        logger.info(f"{'='*60}")
-        
-        try:
-            success = test_func()
-            results[test_name] = "✅ SUCCÈS" if success else "❌ ÉCHEC"
-        except Exception as e:
-            logger.error(f"❌ Erreur critique dans {test_name}: {e}")
-            results[test_name] = "💥 ERREUR CRITIQUE"
+    results = run_tests_in_processes(tests)
     
     # === RÉSUMÉ DES TESTS ===
     logger.info(f"\n{'='*70}")
@@ -286,7 +311,7 @@ def main():
     logger.info(f"{'='*70}")
     
     for test_name, result in results.items():
-        logger.info(f"{test_name:40} : {result}")
+        logger.info("%-40s : %s", test_name, result)
     
     success_count = sum(1 for result in results.values() if "SUCCÈS" in result)
     total_count = len(results)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DU NETTOYEUR DE DONNÉES
+================================
+
+Tests unitaires du composant DataCleaner (nettoyage en flux, types, doublons)
+"""
+
+import sys
+import os
+import logging
+import tempfile
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.components.data_cleaner import DataCleaner
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def test_clean_csv_streaming_late_typed_columns():
+    """Colonnes vides dans le premier bloc puis remplies: un seul schéma pour tout le fichier"""
+    source = pd.DataFrame({
+        'Price': [100, 200, 300.5, 400, 400],
+        'note': [None, None, ' abc ', 'x', 'x'],
+        'year_built': [None, None, 1995, 2001, 2001],
+        'city': ['Laval', 'Québec', 'Montréal', 'Laval', 'Laval'],
+        'bedrooms': [3, None, 2, 4, 4],
+        'lot_size': [4500.5, 3200, 'n/d', 5100, 5100]
+    })
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'source.csv')
+        output_path = os.path.join(tmp_dir, 'clean.parquet')
+        source.to_csv(input_path, index=False)
+
+        stats = DataCleaner().clean_csv_streaming(input_path, output_path, chunksize=2)
+        table = pq.read_table(output_path)
+
+    assert stats['chunks'] == 3
+    assert stats['final_rows'] == 4  # Doublon du dernier bloc supprimé
+    assert str(table.schema.field('price').type) == 'double'
+    assert str(table.schema.field('year_built').type) == 'int64'
+    assert table.column('note').to_pylist() == [None, None, 'abc', 'x']
+    assert table.column('year_built').to_pylist() == [None, None, 1995, 2001]
+    assert table.column('price').to_pylist() == [100.0, 200.0, 300.5, 400.0]
+    # Colonnes hors règles: type déduit du premier bloc, comme clean_data
+    assert str(table.schema.field('bedrooms').type) == 'double'
+    assert str(table.schema.field('city').type) in ('string', 'large_string')
+    assert table.column('bedrooms').to_pylist() == [3.0, None, 2.0, 4.0]
+    assert table.column('lot_size').to_pylist() == [4500.5, 3200.0, None, 5100.0]
+
+def test_integer_rule_columns_use_fixed_int64():
+    """Type entier identique pour un bloc vide et un bloc rempli, sans arrondi des fractions"""
+    cleaner = DataCleaner()
+
+    empty_chunk = cleaner._convert_column(pd.Series([None, None], dtype=object), 'integer')
+    filled_chunk = cleaner._convert_column(pd.Series(['1995', '2001']), 'integer')
+    assert str(empty_chunk.dtype) == 'Int64'
+    assert str(filled_chunk.dtype) == 'Int64'
+    assert filled_chunk.tolist() == [1995, 2001]
+
+    # Médiane fractionnaire: conversion refusée, valeurs inchangées
+    df = cleaner._normalize_data_types(pd.DataFrame({'rooms': [2.0, 2.5, None]}))
+    assert df['rooms'].tolist()[:2] == [2.0, 2.5]
+
+def test_drop_duplicate_rows_checks_equality():
+    """Même empreinte ne suffit pas: 1 et "1" restent distincts, les vrais doublons partent"""
+    cleaner = DataCleaner()
+    df = pd.DataFrame({
+        'value': pd.Series([1, '1', 1, 2.5, 2.5], dtype=object),
+        'city': ['Laval', 'Laval', 'Laval', 'Québec', 'Québec']
+    })
+    result = cleaner._drop_duplicate_rows(df)
+    assert result.index.tolist() == [0, 1, 3]
+    assert result.index.tolist() == df.loc[~df.duplicated()].index.tolist()
+
+def test_optimize_data_types_keeps_float_precision():
+    """Flottants réduits en float32 seulement sans perte, NaN compris"""
+    df = pd.DataFrame({
+        'longitude': [-73.5673119, None, -71.2080],
+        'bathrooms': [1.5, None, 2.0]
+    })
+    optimized = DataCleaner()._optimize_data_types(df.copy())
+    assert optimized['longitude'].dtype == 'float64'
+    assert optimized['bathrooms'].dtype == 'float32'
+    assert optimized['longitude'].tolist()[0] == -73.5673119
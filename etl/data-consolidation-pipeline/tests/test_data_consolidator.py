@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DU CONSOLIDATEUR DE DONNÉES
+====================================
+
+Tests unitaires du composant DataConsolidator (coalescence des groupes)
+"""
+
+import sys
+import os
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.components.data_consolidator import DataConsolidator
+from utils import jit_kernels
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_float_group():
+    """Groupe flottant: lignes partiellement remplies et une ligne entièrement vide"""
+    return pd.DataFrame({
+        'price': [np.nan, 200.0, np.nan, np.nan],
+        'prix': [150.0, 250.0, np.nan, np.nan],
+        'asking_price': [175.0, np.nan, 300.0, np.nan]
+    })
+
+def check_float_group():
+    data = create_float_group()
+    result = DataConsolidator._first_valid_numeric(data)
+    expected = data.bfill(axis=1).iloc[:, 0]
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+    assert result.tolist()[:3] == [150.0, 200.0, 300.0]
+    assert np.isnan(result.iloc[3])
+
+def test_first_valid_numeric_numpy(monkeypatch):
+    """Coalescence flottante sans Numba (valeurs manquantes mêlées, ligne vide)"""
+    monkeypatch.setattr(jit_kernels, "NUMBA_AVAILABLE", False)
+    check_float_group()
+
+def test_first_valid_numeric_numba():
+    """Coalescence flottante par le noyau Numba"""
+    pytest.importorskip("numba")
+    assert jit_kernels._kernel(jit_kernels._first_non_nan_impl) is not None
+    check_float_group()
+
+def test_first_valid_numeric_keeps_nullable_integers():
+    """Groupes Int64: dtype conservé et entiers au-delà de 2**53 exacts"""
+    big = 2 ** 53 + 1
+    data = pd.DataFrame({
+        'units': pd.array([None, 2, None], dtype='Int64'),
+        'nb_unit': pd.array([big, 3, None], dtype='Int64')
+    })
+    result = DataConsolidator._first_valid_numeric(data)
+    assert str(result.dtype) == 'Int64'
+    assert result.iloc[0] == big
+    assert result.iloc[1] == 2
+    assert result.isna().iloc[2]
+    pd.testing.assert_series_equal(result, DataConsolidator._first_valid(data), check_names=False)
+
+def test_datetime_extreme_preserves_dtype():
+    """Unité et fuseau des colonnes conservés, NaT ignorés"""
+    data = pd.DataFrame({
+        'listed': pd.to_datetime(['2024-01-05', None, '2023-06-01']).tz_localize('America/Montreal'),
+        'updated': pd.to_datetime(['2024-03-01', '2024-02-10', None]).tz_localize('America/Montreal')
+    })
+    latest = DataConsolidator._datetime_extreme(data, latest=True)
+    earliest = DataConsolidator._datetime_extreme(data, latest=False)
+    assert latest.dtype == data['listed'].dtype
+    assert earliest.dtype == data['listed'].dtype
+    assert latest.tolist() == [data['updated'][0], data['updated'][1], data['listed'][2]]
+    assert earliest.tolist() == [data['listed'][0], data['updated'][1], data['listed'][2]]
+
+    naive = pd.DataFrame({
+        'a': pd.Series(pd.to_datetime(['2024-01-05', None])).dt.as_unit('us'),
+        'b': pd.Series(pd.to_datetime([None, None])).dt.as_unit('us')
+    })
+    result = DataConsolidator._datetime_extreme(naive, latest=True)
+    assert result.dtype == 'datetime64[us]'
+    assert result[0] == pd.Timestamp('2024-01-05') and pd.isna(result[1])
+
+def test_datetime_extreme_mixed_units():
+    """Unités différentes: unité la plus fine, valeurs comparées correctement"""
+    data = pd.DataFrame({
+        'a': pd.Series(pd.to_datetime(['2024-01-05', '2020-01-01'])).dt.as_unit('s'),
+        'b': pd.Series(pd.to_datetime(['2023-01-01 00:00:00.000001', '2021-01-01 00:00:00.000000'])).dt.as_unit('ns')
+    })
+    result = DataConsolidator._datetime_extreme(data, latest=True)
+    assert result.dtype == 'datetime64[ns]'
+    assert result.tolist() == [pd.Timestamp('2024-01-05'), pd.Timestamp('2021-01-01')]
+
+def test_consumed_sources_are_not_reused():
+    """Une source supprimée par un groupe n'alimente pas un groupe suivant (suppression différée)"""
+    from types import SimpleNamespace
+
+    def group(sources, target):
+        return SimpleNamespace(source_columns=sources, target_column=target, consolidation_type='numeric',
+                               consolidation_strategy='first_valid', remove_source_columns=True,
+                               post_processing={})
+
+    config = SimpleNamespace(consolidation_groups={
+        'price': group(['prix', 'asking_price'], 'price_final'),
+        'price_copy': group(['asking_price', 'list_price'], 'list_price_final')
+    })
+    df = pd.DataFrame({
+        'prix': [np.nan, 200.0],
+        'asking_price': [150.0, 250.0],
+        'list_price': [np.nan, 300.0]
+    })
+    result = DataConsolidator(config).consolidate_variables(df)
+
+    assert result['price_final'].tolist() == [150.0, 200.0]
+    # asking_price déjà consommée: seule list_price alimente le second groupe
+    assert result['list_price_final'].isna().tolist() == [True, False]
+    assert result['list_price_final'].tolist()[1] == 300.0
+    assert list(result.columns) == ['price_final', 'list_price_final']
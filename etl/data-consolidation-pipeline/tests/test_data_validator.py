@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DU VALIDATEUR DE DONNÉES
+=================================
+
+Tests unitaires du composant DataValidator (validation, statut global)
+"""
+
+import sys
+import os
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.components.data_validator import DataValidator
+from utils import jit_kernels
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_small_dataset(n_rows=50, seed=42):
+    """Petit dataset immobilier reproductible"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'price': rng.uniform(150000, 800000, n_rows),
+        'surface': rng.uniform(50, 300, n_rows),
+        'year_built': rng.integers(1950, 2024, n_rows),
+        'latitude': rng.uniform(45.4, 45.7, n_rows),
+        'longitude': rng.uniform(-73.8, -73.4, n_rows)
+    })
+
+def test_validate_data_results_are_independent():
+    """Une revalidation du même DataFrame ne renvoie pas un résultat modifié par l'appelant"""
+    validator = DataValidator()
+    df = create_small_dataset()
+
+    first = validator.validate_data(df)
+    expected_status = first['overall_status']['status']
+    first['overall_status']['status'] = 'ALTERED'
+
+    second = validator.validate_data(df)
+    assert second is not first
+    assert second['overall_status']['status'] == expected_status
+
+# Valeurs de part et d'autre des bornes [0, 10], NaN compris
+RANGE_VALUES = np.array([-5.0, 0.0, 3.0, np.nan, 10.0, 12.5, np.nan, 11.0])
+RANGE_EXPECTED = (6, 1, 2)  # (non-NaN, < 0, > 10)
+
+def test_range_counts_numpy(monkeypatch):
+    """Comptage des bornes sans Numba"""
+    monkeypatch.setattr(jit_kernels, "NUMBA_AVAILABLE", False)
+    assert jit_kernels.range_counts(RANGE_VALUES, 0, 10) == RANGE_EXPECTED
+    assert DataValidator._count_in_range(pd.Series(RANGE_VALUES), 0, 10) == 3
+
+def test_range_counts_numba():
+    """Comptage des bornes par le noyau Numba (mêmes résultats que NumPy)"""
+    pytest.importorskip("numba")
+    assert jit_kernels._kernel(jit_kernels._range_counts_impl) is not None
+    assert jit_kernels.range_counts(RANGE_VALUES, 0, 10) == RANGE_EXPECTED
+    assert DataValidator._count_in_range(pd.Series(RANGE_VALUES), 0, 10) == 3
+
+def test_range_violation_counts_ignores_non_numeric():
+    """Valeurs non numériques ignorées; champs absents non comptés"""
+    validator = DataValidator()
+    df = pd.DataFrame({'price': ['-1', 'n/a', '500000', '20000000'], 'surface': [10.0, None, -3.0, 20000.0]})
+    assert validator._range_violation_counts(df) == {'price': (1, 1), 'surface': (1, 1)}
+
+def test_nan_score_maps_to_failed():
+    """Un score global NaN donne le palier le plus bas (FAILED)"""
+    status = DataValidator()._determine_overall_validation_status({'basic': {'score': np.nan}})
+    assert status['status'] == 'FAILED'
+
+def test_basic_quality_without_columns():
+    """DataFrame sans colonnes: scores nuls au lieu d'une division par zéro"""
+    results = DataValidator()._validate_basic_data_quality(pd.DataFrame(index=range(3)))
+    assert 'error' not in results
+    assert results['completeness']['score'] == 0.0
+    assert results['uniqueness']['score'] == 0.0
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DES UTILITAIRES DE DATES
+=================================
+
+Tests unitaires de la détection de format et de la conversion des dates
+"""
+
+import sys
+import os
+import logging
+import pandas as pd
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.date_utils import detect_datetime_format, parse_datetime_column
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def test_utc_suffix_keeps_timezone():
+    """Suffixe 'Z' (MongoDB ISO): date tz-aware en UTC, comme l'inférence pandas"""
+    values = pd.Series(['2024-01-05T10:00:00Z', '2024-02-10T08:30:00.250Z', None], name='updated_at')
+    result = parse_datetime_column(values)
+    assert str(result.dt.tz) == 'UTC'
+    assert result[0] == pd.Timestamp('2024-01-05T10:00:00', tz='UTC')
+    assert pd.isna(result[2])
+
+def test_mixed_offsets_are_converted_to_utc():
+    """Décalages horaires différents: une seule colonne UTC au lieu d'une erreur"""
+    values = pd.Series(['2024-01-05T10:00:00+02:00', '2024-01-05T10:00:00-05:00'], name='listed_at')
+    result = parse_datetime_column(values)
+    assert result.tolist() == [pd.Timestamp('2024-01-05T08:00:00', tz='UTC'),
+                               pd.Timestamp('2024-01-05T15:00:00', tz='UTC')]
+
+def test_ambiguous_day_month_is_not_guessed():
+    """Jour et mois tous deux <= 12: aucun format imposé; sinon l'ordre lisible est retenu"""
+    assert detect_datetime_format(pd.Series(['05/01/2024', '03/02/2024'], name='date')) is None
+    assert detect_datetime_format(pd.Series(['25/01/2024', '03/02/2024'])) == "%d/%m/%Y"
+    assert detect_datetime_format(pd.Series(['01/25/2024', '02/03/2024'])) == "%m/%d/%Y"
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DU GESTIONNAIRE D'EXPORT
+=================================
+
+Tests unitaires de l'ExportManager (export basique)
+"""
+
+import sys
+import os
+import logging
+import tempfile
+from unittest.mock import MagicMock
+from types import SimpleNamespace
+import pandas as pd
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.export_manager import ExportManager
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def test_basic_export_writes_each_format_once(monkeypatch):
+    """Formats répétés ou de casse différente: un seul fichier écrit par format"""
+    calls = []
+    to_csv = pd.DataFrame.to_csv
+
+    def counting_to_csv(self, *args, **kwargs):
+        calls.append(args[0] if args else kwargs.get('path_or_buf'))
+        return to_csv(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "to_csv", counting_to_csv)
+    manager = ExportManager(SimpleNamespace(get_run_timestamp=lambda: "20240101_120000"))
+    df = pd.DataFrame({'price': [350000, 420000], 'city': ['Laval', 'Québec']})
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        exported = manager._basic_export(df, "test", ["csv", "CSV", "json", "csv"], tmp_dir)
+        written = sorted(os.listdir(tmp_dir))
+
+    assert sorted(exported) == ['csv', 'json']
+    assert len(calls) == 1
+    assert written == ['real_estate_data_test_20240101_120000.csv',
+                       'real_estate_data_test_20240101_120000.json']
+
+def test_export_data_counts_each_format_once(caplog):
+    """Le ratio du résumé compte chaque format une seule fois"""
+    exporter = MagicMock()
+    exporter.export_dataset.side_effect = lambda df, name, formats, output_dir, timestamp: {
+        format_type: f"{output_dir}/{name}.{format_type}" for format_type in formats
+    }
+    manager = ExportManager(SimpleNamespace(exporter=exporter, get_run_timestamp=lambda: "20240101_120000"))
+    df = pd.DataFrame({'price': [350000, 420000]})
+
+    with caplog.at_level(logging.INFO, logger='core.export_manager'):
+        exported = manager.export_data(df, "test", ["csv", "CSV", "parquet"], "/tmp/unused")
+
+    assert exporter.export_dataset.call_args.args[2] == ['csv', 'parquet']
+    assert sorted(exported) == ['csv', 'parquet']
+    assert "2/2 formats exportés avec succès" in caplog.text
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST MINHASH - DÉTECTION DES COLONNES DUPLIQUÉES
+====================================================
+
+Tests unitaires des signatures MinHash + LSH et de leur usage par le SimilarityDetector
+"""
+
+import sys
+import os
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.minhash import column_minhash_signatures, similar_column_groups
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_duplicated_columns(n_rows=500, seed=42):
+    """Colonnes copiées (dont une copie flottante avec valeurs manquantes) et colonnes disjointes"""
+    rng = np.random.default_rng(seed)
+    price = rng.integers(100_000, 900_000, n_rows)
+    price_copy = price.astype(np.float64)
+    price_copy[rng.random(n_rows) < 0.1] = np.nan
+    return pd.DataFrame({
+        'price': price,
+        'prix': price_copy,
+        'address': "Rue " + pd.Series(np.arange(n_rows).astype(str)),
+        'adresse': "Rue " + pd.Series(np.arange(n_rows).astype(str)),
+        'surface': rng.uniform(50, 300, n_rows),
+        'lot_size': rng.uniform(1000, 5000, n_rows)
+    })
+
+def find_groups(df):
+    signatures = column_minhash_signatures(df)
+    return similar_column_groups(signatures, list(df.columns), threshold=0.85)
+
+def test_identical_columns_are_grouped():
+    """Copies exactes regroupées, y compris une copie entière -> flottante avec NaN"""
+    groups = find_groups(create_duplicated_columns())
+    assert ['price', 'prix'] in groups
+    assert ['address', 'adresse'] in groups
+
+def test_disjoint_columns_are_not_grouped():
+    """Colonnes sans valeurs communes jamais regroupées"""
+    groups = find_groups(create_duplicated_columns())
+    grouped = {col for group in groups for col in group}
+    assert 'surface' not in grouped
+    assert 'lot_size' not in grouped
+
+def test_empty_column_is_ignored():
+    """Une colonne entièrement vide n'a pas de signature et ne forme aucun groupe"""
+    df = pd.DataFrame({'a': [np.nan] * 20, 'b': [np.nan] * 20, 'c': np.arange(20)})
+    assert find_groups(df) == []
+
+def test_similarity_detector_value_overlap():
+    """Les groupes MinHash sont exposés par le SimilarityDetector"""
+    pytest.importorskip("fuzzywuzzy")
+    from intelligence.similarity_detector import SimilarityDetector
+
+    groups = SimilarityDetector()._detect_by_value_overlap(create_duplicated_columns())
+    assert sorted(groups.values()) == [['address', 'adresse'], ['price', 'prix']]
+
+def test_similarity_detector_skips_list_columns():
+    """Colonnes de listes (tableaux MongoDB) ignorées sans perdre les autres groupes"""
+    pytest.importorskip("fuzzywuzzy")
+    from intelligence.similarity_detector import SimilarityDetector
+
+    df = create_duplicated_columns()
+    df['images'] = [[f"img_{i}.jpg", f"img_{i + 1}.jpg"] for i in range(len(df))]
+    groups = SimilarityDetector()._detect_by_value_overlap(df)
+    assert sorted(groups.values()) == [['address', 'adresse'], ['price', 'prix']]
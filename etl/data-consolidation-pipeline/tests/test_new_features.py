@@ -18,6 +18,8 @@ from pathlib import Path
 # Ajout du répertoire parent au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.helpers import run_tests_in_processes
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -184,19 +186,7 @@ def main():
         ("Optimisations de Performance", test_performance_optimizations)
     ]
     
-    results = {}
-    
-    for test_name, test_func in tests:
-        logger.info(f"\n{'='*50}")
-        logger.info(f"🧪 TEST: {test_name}")
-        logger.info(f"{'='*50}")
-        
-        try:
-            success = test_func()
-            results[test_name] = "✅ SUCCÈS" if success else "❌ ÉCHEC"
-        except Exception as e:
-            logger.error(f"❌ Erreur critique dans {test_name}: {e}")
-            results[test_name] = "💥 ERREUR CRITIQUE"
+    results = run_tests_in_processes(tests)
     
     # === RÉSUMÉ DES TESTS ===
     logger.info(f"\n{'='*60}")
@@ -204,7 +194,7 @@ def main():
     logger.info(f"{'='*60}")
     
     for test_name, result in results.items():
-        logger.info(f"{test_name:30} : {result}")
+        logger.info("%-30s : %s", test_name, result)
     
     success_count = sum(1 for result in results.values() if "SUCCÈS" in result)
     total_count = len(results)
@@ -25,6 +25,8 @@ from datetime import datetime
 # Ajout du répertoire parent au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.helpers import text_column
+
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -37,6 +39,7 @@ class PipelineCompleteTest:
         self.test_results = {}
         self.test_data = None
         self.pipeline = None
+        self.cleaner = None
         
     def run_complete_test(self):
         """Exécute tous les tests du pipeline"""
@@ -77,6 +80,14 @@ class PipelineCompleteTest:
         # Rapport final
         self.generate_final_report()
         
+    def get_cleaner(self):
+        """Nettoyeur partagé par les phases: configuration personnalisée chargée une seule fois"""
+        if self.cleaner is None:
+            from config.custom_fields_config import custom_config
+            from core.ultra_intelligent_cleaner import UltraIntelligentCleaner
+            self.cleaner = UltraIntelligentCleaner(custom_config)
+        return self.cleaner
+    
     def test_configuration_imports(self):
         """Test de la configuration et des imports"""
         logger.info("⚙️ === TEST CONFIGURATION ET IMPORTS ===")
@@ -158,10 +169,7 @@ class PipelineCompleteTest:
             
             # Configuration avec la config personnalisée
             logger.info("⚙️ Configuration pour consolidation...")
-            from config.custom_fields_config import custom_config
-            from core.ultra_intelligent_cleaner import UltraIntelligentCleaner
-            
-            cleaner = UltraIntelligentCleaner(custom_config)
+            cleaner = self.get_cleaner()
             logger.info("✅ Nettoyeur configuré")
             
             # Consolidation
@@ -206,10 +214,12 @@ class PipelineCompleteTest:
             from intelligence.similarity_detector import SimilarityDetector
             detector = SimilarityDetector()
             
+            rng = np.random.default_rng(42)
+            
             # Ajouter des coordonnées si nécessaire
             if 'latitude' not in df.columns:
-                df['latitude'] = np.random.uniform(45.4, 45.7, len(df))
-                df['longitude'] = np.random.uniform(-73.8, -73.4, len(df))
+                df['latitude'] = rng.uniform(45.4, 45.7, len(df))
+                df['longitude'] = rng.uniform(-73.8, -73.4, len(df))
             
             spatial_results = detector.spatial_clustering(df)
             if spatial_results.get("success"):
@@ -219,16 +229,13 @@ class PipelineCompleteTest:
             
             # Test de la catégorisation automatique
             logger.info("🏷️ Test catégorisation automatique...")
-            from core.ultra_intelligent_cleaner import UltraIntelligentCleaner
-            from config.custom_fields_config import custom_config
-            
-            cleaner = UltraIntelligentCleaner(custom_config)
+            cleaner = self.get_cleaner()
             
             # Ajouter des données financières si nécessaire
             if 'revenue_final' not in df.columns:
-                df['revenue_final'] = np.random.uniform(15000, 150000, len(df))
+                df['revenue_final'] = rng.uniform(15000, 150000, len(df))
             if 'price_final' not in df.columns:
-                df['price_final'] = np.random.uniform(200000, 2000000, len(df))
+                df['price_final'] = rng.uniform(200000, 2000000, len(df))
             
             df_categorized = cleaner.categorize_investment_opportunities(df)
             
@@ -393,122 +400,142 @@ class PipelineCompleteTest:
             logger.error(f"❌ Erreur validation qualité: {e}")
             return False
     
-    def create_comprehensive_test_data(self):
-        """Crée un dataset de test complet avec toutes les colonnes nécessaires"""
-        n_rows = 200
+    def create_comprehensive_test_data(self, n_rows=200, seed=42, n_duplicates=5):
+        """
+        Crée un dataset de test complet avec toutes les colonnes nécessaires
+        
+        Chaque colonne est générée en un seul tirage vectorisé (aucune boucle par ligne)
+        """
+        rng = np.random.default_rng(seed)
+        dates = pd.date_range('2024-01-01', periods=n_rows, freq='D')
+        
+        def uniform(low, high):
+            return rng.uniform(low, high, n_rows)
+        
+        def integers(low, high):
+            return rng.integers(low, high, n_rows)
+        
+        def categorical(values):
+            # Colonnes à faible cardinalité: codes entiers + dictionnaire de valeurs
+            return pd.Categorical.from_codes(rng.integers(0, len(values), n_rows), categories=values)
         
         # Dataset complet avec 78 colonnes comme spécifié
         test_data = pd.DataFrame({
             # Prix et évaluations
-            'price': np.random.uniform(200000, 2000000, n_rows),
-            'prix_evaluation': np.random.uniform(180000, 1800000, n_rows),
-            'price_assessment': np.random.uniform(180000, 1800000, n_rows),
-            'evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-            'evaluation_terrain': np.random.uniform(80000, 800000, n_rows),
-            'evaluation_batiment': np.random.uniform(100000, 1000000, n_rows),
-            'municipal_evaluation_building': np.random.uniform(100000, 1000000, n_rows),
-            'municipal_evaluation_land': np.random.uniform(80000, 800000, n_rows),
-            'municipal_evaluation_total': np.random.uniform(180000, 1800000, n_rows),
-            'evaluation_year': np.random.randint(2018, 2025, n_rows),
-            'municipal_evaluation_year': np.random.randint(2018, 2025, n_rows),
+            'price': uniform(200000, 2000000),
+            'prix_evaluation': uniform(180000, 1800000),
+            'price_assessment': uniform(180000, 1800000),
+            'evaluation_total': uniform(180000, 1800000),
+            'evaluation_terrain': uniform(80000, 800000),
+            'evaluation_batiment': uniform(100000, 1000000),
+            'municipal_evaluation_building': uniform(100000, 1000000),
+            'municipal_evaluation_land': uniform(80000, 800000),
+            'municipal_evaluation_total': uniform(180000, 1800000),
+            'evaluation_year': integers(2018, 2025),
+            'municipal_evaluation_year': integers(2018, 2025),
             
             # Surface et caractéristiques
-            'surface': np.random.uniform(50, 500, n_rows),
-            'living_area': np.random.uniform(50, 500, n_rows),
-            'superficie': np.random.uniform(50, 500, n_rows),
-            'lot_size': np.random.uniform(100, 1000, n_rows),
-            'bedrooms': np.random.randint(1, 6, n_rows),
-            'nbr_chanbres': np.random.randint(1, 6, n_rows),
-            'nb_bedroom': np.random.randint(1, 6, n_rows),
-            'rooms': np.random.randint(3, 10, n_rows),
-            'bathrooms': np.random.randint(1, 4, n_rows),
-            'nbr_sal_deau': np.random.randint(1, 3, n_rows),
-            'nbr_sal_bain': np.random.randint(1, 4, n_rows),
-            'nb_bathroom': np.random.randint(1, 4, n_rows),
-            'water_rooms': np.random.randint(1, 3, n_rows),
-            'nb_water_room': np.random.randint(1, 3, n_rows),
+            'surface': uniform(50, 500),
+            'living_area': uniform(50, 500),
+            'superficie': uniform(50, 500),
+            'lot_size': uniform(100, 1000),
+            'bedrooms': integers(1, 6),
+            'nbr_chanbres': integers(1, 6),
+            'nb_bedroom': integers(1, 6),
+            'rooms': integers(3, 10),
+            'bathrooms': integers(1, 4),
+            'nbr_sal_deau': integers(1, 3),
+            'nbr_sal_bain': integers(1, 4),
+            'nb_bathroom': integers(1, 4),
+            'water_rooms': integers(1, 3),
+            'nb_water_room': integers(1, 3),
             
             # Coordonnées
-            'latitude': np.random.uniform(45.4, 45.7, n_rows),
-            'longitude': np.random.uniform(-73.8, -73.4, n_rows),
-            'geolocation': [f'45.5,-73.6#{i}' for i in range(n_rows)],
-            'geo': [f'45.5,-73.6#{i}' for i in range(n_rows)],
+            'latitude': uniform(45.4, 45.7),
+            'longitude': uniform(-73.8, -73.4),
+            'geolocation': text_column(n_rows, '45.5,-73.6#'),
+            'geo': text_column(n_rows, '45.5,-73.6#'),
             
             # Adresses
-            'address': [f'123 Rue Principale #{i}' for i in range(n_rows)],
-            'full_address': [f'123 Rue Principale #{i}, Montréal, QC' for i in range(n_rows)],
-            'location': [f'Montréal, QC #{i}' for i in range(n_rows)],
-            'city': ['Montréal', 'Québec', 'Laval'] * (n_rows // 3 + 1),
-            'postal_code': ['H1A 1A1', 'H2B 2B2', 'H3C 3C3'] * (n_rows // 3 + 1),
+            'address': text_column(n_rows, '123 Rue Principale #'),
+            'full_address': text_column(n_rows, '123 Rue Principale #', ', Montréal, QC'),
+            'location': text_column(n_rows, 'Montréal, QC #'),
+            'city': categorical(['Montréal', 'Québec', 'Laval']),
+            'postal_code': categorical(['H1A 1A1', 'H2B 2B2', 'H3C 3C3']),
             
             # Type propriété
-            'type': ['Maison', 'Appartement', 'Duplex', 'Triplex'] * (n_rows // 4 + 1),
-            'building_style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
-            'style': ['Moderne', 'Traditionnel', 'Contemporain'] * (n_rows // 3 + 1),
+            'type': categorical(['Maison', 'Appartement', 'Duplex', 'Triplex']),
+            'building_style': categorical(['Moderne', 'Traditionnel', 'Contemporain']),
+            'style': categorical(['Moderne', 'Traditionnel', 'Contemporain']),
             
             # Année construction
-            'year_built': np.random.randint(1950, 2025, n_rows),
-            'construction_year': np.random.randint(1950, 2025, n_rows),
-            'annee': np.random.randint(1950, 2025, n_rows),
+            'year_built': integers(1950, 2025),
+            'construction_year': integers(1950, 2025),
+            'annee': integers(1950, 2025),
             
             # Taxes
-            'municipal_taxes': np.random.uniform(2000, 20000, n_rows),
-            'municipal_tax': np.random.uniform(2000, 20000, n_rows),
-            'taxes': np.random.uniform(3000, 30000, n_rows),
-            'school_taxes': np.random.uniform(1000, 10000, n_rows),
-            'school_tax': np.random.uniform(1000, 10000, n_rows),
+            'municipal_taxes': uniform(2000, 20000),
+            'municipal_tax': uniform(2000, 20000),
+            'taxes': uniform(3000, 30000),
+            'school_taxes': uniform(1000, 10000),
+            'school_tax': uniform(1000, 10000),
             
             # Revenus
-            'revenu': np.random.uniform(15000, 150000, n_rows),
-            'revenus_annuels_bruts': np.random.uniform(15000, 150000, n_rows),
-            'plex-revenu': np.random.uniform(15000, 150000, n_rows),
-            'plex_revenu': np.random.uniform(15000, 150000, n_rows),
-            'potential_gross_revenue': np.random.uniform(15000, 150000, n_rows),
+            'revenu': uniform(15000, 150000),
+            'revenus_annuels_bruts': uniform(15000, 150000),
+            'plex-revenu': uniform(15000, 150000),
+            'plex_revenu': uniform(15000, 150000),
+            'potential_gross_revenue': uniform(15000, 150000),
             
             # Dépenses
-            'expense': np.random.uniform(5000, 50000, n_rows),
-            'depenses': np.random.uniform(5000, 50000, n_rows),
-            'expense_period': ['Annuel'] * n_rows,
+            'expense': uniform(5000, 50000),
+            'depenses': uniform(5000, 50000),
+            'expense_period': categorical(['Annuel']),
             
             # Parking et unités
-            'nb_parking': np.random.randint(0, 4, n_rows),
-            'parking': np.random.randint(0, 4, n_rows),
-            'nb_garage': np.random.randint(0, 3, n_rows),
-            'unites': np.random.randint(1, 5, n_rows),
-            'residential_units': np.random.randint(1, 5, n_rows),
-            'commercial_units': np.random.randint(0, 3, n_rows),
+            'nb_parking': integers(0, 4),
+            'parking': integers(0, 4),
+            'nb_garage': integers(0, 3),
+            'unites': integers(1, 5),
+            'residential_units': integers(1, 5),
+            'commercial_units': integers(0, 3),
             
             # Images et métadonnées
-            'image': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
-            'images': [f'https://exemple.com/images_{i}.jpg' for i in range(n_rows)],
-            'img_src': [f'https://exemple.com/image_{i}.jpg' for i in range(n_rows)],
-            'revenu_period': ['Annuel'] * n_rows,
-            'basement': ['Oui', 'Non', 'Partiel'] * (n_rows // 3 + 1),
+            'image': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
+            'images': text_column(n_rows, 'https://exemple.com/images_', '.jpg'),
+            'img_src': text_column(n_rows, 'https://exemple.com/image_', '.jpg'),
+            'revenu_period': categorical(['Annuel']),
+            'basement': categorical(['Oui', 'Non', 'Partiel']),
             
             # Champs préservés
-            'main_unit_details': [f'Détails unité #{i}' for i in range(n_rows)],
-            'vendue': ['Non', 'Oui', 'En cours'] * (n_rows // 3 + 1),
-            'description': [f'Belle propriété #{i}' for i in range(n_rows)],
+            'main_unit_details': text_column(n_rows, 'Détails unité #'),
+            'vendue': categorical(['Non', 'Oui', 'En cours']),
+            'description': text_column(n_rows, 'Belle propriété #'),
             '_id': range(n_rows),
-            'updated_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-            'add_date': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-            'created_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-            'update_at': pd.date_range('2024-01-01', periods=n_rows, freq='D'),
-            'region': ['QC'] * n_rows,
-            'extraction_metadata': [f'Metadata extraction #{i}' for i in range(n_rows)],
+            'updated_at': dates,
+            'add_date': dates,
+            'created_at': dates,
+            'update_at': dates,
+            'region': categorical(['QC']),
+            'extraction_metadata': text_column(n_rows, 'Metadata extraction #'),
             
             # Métadonnées à supprimer
-            'link': [f'https://exemple.com/propriete/{i}' for i in range(n_rows)],
-            'company': ['Royal LePage', 'Century 21', 'RE/MAX'] * (n_rows // 3 + 1),
-            'version': ['1.0'] * n_rows
+            'link': text_column(n_rows, 'https://exemple.com/propriete/'),
+            'company': categorical(['Royal LePage', 'Century 21', 'RE/MAX']),
+            'version': categorical(['1.0'])
         })
         
-        # Ajout de valeurs manquantes pour tester la consolidation
-        for col in test_data.columns:
-            if test_data[col].dtype in ['object', 'float64']:
-                # 15% de valeurs manquantes aléatoires
-                mask = np.random.choice([True, False], size=n_rows, p=[0.15, 0.85])
-                test_data.loc[mask, col] = np.nan
+        # Ajout de valeurs manquantes pour tester la consolidation: 15% des cellules
+        # texte et flottantes, en un seul masque 2-D (les entiers ne sont pas convertis)
+        nullable_columns = test_data.select_dtypes(include=['object', 'string', 'float64']).columns
+        missing_mask = rng.random((n_rows, len(nullable_columns))) < 0.15
+        test_data[nullable_columns] = test_data[nullable_columns].mask(missing_mask)
+        
+        # Doublons exacts des premières lignes pour le contrôle d'unicité:
+        # un seul take sur des positions répétées, sans copie ni concaténation
+        if n_duplicates:
+            positions = np.concatenate([np.arange(n_rows), np.arange(min(n_duplicates, n_rows))])
+            test_data = test_data.take(positions).reset_index(drop=True)
         
         return test_data
     
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 TEST DU VALIDATEUR DE QUALITÉ
+=================================
+
+Tests unitaires du QualityValidator (validation, export JSON)
+"""
+
+import sys
+import os
+import json
+import logging
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Ajout du répertoire parent au PYTHONPATH pour les imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation.quality_validator import QualityValidator
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def create_small_dataset(n_rows=50, seed=42):
+    """Petit dataset immobilier reproductible"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'price': rng.uniform(150000, 800000, n_rows),
+        'surface': rng.uniform(50, 300, n_rows),
+        'year_built': rng.integers(1950, 2024, n_rows),
+        'city': rng.choice(['Montréal', 'Québec', 'Laval'], size=n_rows)
+    })
+
+def test_export_validation_results_reads_back():
+    """Le fichier écrit en arrière-plan est complet une fois les écritures attendues"""
+    validator = QualityValidator()
+    validator.validate_dataset(create_small_dataset(), dataset_name="export_test")
+    expected_keys = set(validator.validation_results["export_test"])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, 'validation.json')
+        exported = validator.export_validation_results("export_test", output_path)
+        # Une modification après l'appel n'affecte pas le fichier (copie propre au thread)
+        exported["dataset_name"] = "altered"
+        exported["validation_results"] = {}
+        validator.wait_for_pending_writes()
+        assert not validator._pending_writes
+
+        with open(output_path, encoding='utf-8') as f:
+            written = json.load(f)
+
+    assert written["dataset_name"] == "export_test"
+    assert set(written["validation_results"]) == expected_keys
+
+def test_validate_dataset_revalidates_changed_data():
+    """Pas de résultats en cache: 1 et '1' dans une colonne object donnent deux validations"""
+    validator = QualityValidator()
+    as_text = create_small_dataset()
+    as_text['code'] = pd.Series([str(i % 7) for i in range(len(as_text))], dtype=object)
+    as_int = as_text.copy()
+    as_int['code'] = pd.Series([i % 7 for i in range(len(as_int))], dtype=object)
+
+    first = validator.validate_dataset(as_text, dataset_name="revalidation_test")
+    first_samples = first["validation_results"]["types"]["type_analysis"]["code"]["sample_values"]
+    second = validator.validate_dataset(as_int, dataset_name="revalidation_test")
+    second_samples = second["validation_results"]["types"]["type_analysis"]["code"]["sample_values"]
+
+    assert first_samples == ['0', '1', '2']
+    assert second_samples == [0, 1, 2]
+
+def test_report_nan_score_gets_lowest_recommendation():
+    """Un score global NaN donne la recommandation du palier le plus bas"""
+    validator = QualityValidator()
+    validator.validate_dataset(create_small_dataset(), dataset_name="nan_test")
+    validator.validation_results["nan_test"]["overall_score"] = float('nan')
+
+    report = validator.generate_quality_report("nan_test")
+    assert "**Faible**" in report
+    assert "**Excellent**" not in report
+
+def test_duplicate_row_count_checks_equality():
+    """Valeurs de même texte mais de types différents: pas des doublons"""
+    df = pd.DataFrame({'value': pd.Series([1, '1', None, 'None', 2.0, '2.0', 2.0], dtype=object)})
+    assert QualityValidator._duplicate_row_count(df) == 1
+    assert QualityValidator._duplicate_row_count(df) == int(df.duplicated().sum())
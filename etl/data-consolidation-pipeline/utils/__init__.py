@@ -7,14 +7,45 @@
 Utilitaires et modules de support pour le pipeline
 """
 
-from .db import read_mongodb_to_dataframe, get_mongodb_stats, test_mongodb_connection
-from .property_type_normalizer import PropertyTypeNormalizer
+from .lazy_imports import lazy_attributes
+
+# Attribut public -> sous-module, importé au premier accès (évite PyMongo & co. à l'import du package)
+_LAZY_IMPORTS = {
+    "read_mongodb_to_dataframe": ".db",
+    "get_mongodb_stats": ".db",
+    "test_mongodb_connection": ".db",
+    "PropertyTypeNormalizer": ".property_type_normalizer",
+    "get_files_stats": ".file_utils",
+    "get_directory_info": ".file_utils",
+    "remove_files": ".file_utils",
+    "cleanup_old_files": ".file_utils",
+    "detect_datetime_format": ".date_utils",
+    "parse_datetime_column": ".date_utils",
+    "estimate_memory_usage_mb": ".memory_utils",
+    "downcast_float_lossless": ".memory_utils",
+    "count_nulls": ".null_utils",
+    "column_minhash_signatures": ".minhash",
+    "similar_column_groups": ".minhash"
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "read_mongodb_to_dataframe",
     "get_mongodb_stats", 
     "test_mongodb_connection",
-    "PropertyTypeNormalizer"
+    "PropertyTypeNormalizer",
+    "get_files_stats",
+    "get_directory_info",
+    "remove_files",
+    "cleanup_old_files",
+    "detect_datetime_format",
+    "parse_datetime_column",
+    "estimate_memory_usage_mb",
+    "downcast_float_lossless",
+    "count_nulls",
+    "column_minhash_signatures",
+    "similar_column_groups"
 ]
 
 __version__ = "7.0.0"
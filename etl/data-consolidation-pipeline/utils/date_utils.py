@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📅 MODULE DATES - Pipeline ETL Ultra-Intelligent
+=================================================
+
+Conversion de colonnes textuelles en datetime
+Le format est détecté sur un échantillon puis passé explicitement à
+pd.to_datetime (avec cache) pour éviter l'analyse valeur par valeur.
+Les suffixes de fuseau ('Z', '+02:00') sont lus par %z: la date reste
+tz-aware; un échantillon compatible jour/mois et mois/jour n'impose aucun format
+"""
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Formats candidats, du plus spécifique au plus général
+DATETIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f%z",
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y",
+)
+
+# Jour/mois et mois/jour: indiscernables tant qu'aucun jour de l'échantillon ne dépasse 12
+AMBIGUOUS_FORMATS = {
+    "%d/%m/%Y %H:%M:%S": "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y": "%m/%d/%Y",
+}
+
+def _matches(sample: List[str], fmt: str) -> bool:
+    """True si toutes les valeurs de l'échantillon respectent le format"""
+    try:
+        for value in sample:
+            datetime.strptime(value, fmt)
+        return True
+    except ValueError:
+        return False
+
+def detect_datetime_format(values: pd.Series, sample_size: int = 10) -> Optional[str]:
+    """
+    Détecte le format strptime commun aux premières valeurs non nulles
+
+    Args:
+        values: Série de dates sous forme de texte
+        sample_size: Nombre de valeurs testées
+
+    Returns:
+        Format détecté ou None si aucun candidat ne convient (ou si l'ordre
+        jour/mois est ambigu)
+    """
+    sample = values.dropna().head(sample_size).astype(str).str.strip().tolist()
+    if not sample:
+        return None
+
+    for fmt in DATETIME_FORMATS:
+        if not _matches(sample, fmt):
+            continue
+        if fmt in AMBIGUOUS_FORMATS and _matches(sample, AMBIGUOUS_FORMATS[fmt]):
+            logger.warning(f"⚠️ Ordre jour/mois ambigu pour '{values.name}', inférence pandas")
+            return None
+        return fmt
+
+    return None
+
+def parse_datetime_column(values: pd.Series) -> pd.Series:
+    """
+    Convertit une série en datetime avec un format explicite lorsque possible
+
+    Args:
+        values: Série à convertir
+
+    Returns:
+        Série datetime64 (valeurs invalides -> NaT)
+    """
+    # Déjà converti (ex: lecteur PyArrow ou BSON date): aucune ré-analyse
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+
+    fmt = detect_datetime_format(values)
+    if fmt is None:
+        logger.debug(f"📅 Format de date non détecté pour '{values.name}', inférence pandas")
+    try:
+        return pd.to_datetime(values, errors='coerce', format=fmt, cache=True)
+    except ValueError:
+        # Décalages horaires différents dans la colonne: ramenés à UTC
+        return pd.to_datetime(values, errors='coerce', format=fmt, cache=True, utc=True)
@@ -16,6 +16,8 @@ import warnings
 import json
 from datetime import datetime
 
+from .date_utils import parse_datetime_column
+
 # Import conditionnel de MongoDB
 try:
     import pymongo
@@ -66,27 +68,21 @@ def read_mongodb_to_dataframe(connection_string: str = "mongodb://localhost:2701
         if query is None:
             query = {}
         
-        # Exécution de la requête
+        # Exécution de la requête: '_id' exclu par projection côté serveur
+        # (ni transféré, ni supprimé du DataFrame après coup)
+        cursor = collection.find(query, {'_id': 0})
         if limit:
-            cursor = collection.find(query).limit(limit)
-        else:
-            cursor = collection.find(query)
+            cursor = cursor.limit(limit)
         
-        # Conversion en liste
-        documents = list(cursor)
+        # Conversion en DataFrame directement depuis le curseur,
+        # sans liste intermédiaire de documents
+        df = pd.DataFrame.from_records(cursor, nrows=limit or None)
         
-        if not documents:
+        if df.empty:
             logger.warning("⚠️ Aucun document trouvé dans MongoDB")
             return _generate_test_data(limit=limit)
         
-        logger.info(f"📊 {len(documents)} documents extraits de MongoDB")
-        
-        # Conversion en DataFrame
-        df = pd.DataFrame(documents)
-        
-        # Nettoyage des colonnes MongoDB
-        if '_id' in df.columns:
-            df = df.drop('_id', axis=1)
+        logger.info(f"📊 {len(df)} documents extraits de MongoDB")
         
         # Conversion des types
         df = _convert_mongodb_types(df)
@@ -198,7 +194,7 @@ def _convert_mongodb_types(df: pd.DataFrame) -> pd.DataFrame:
         
         # Conversion des colonnes de dates
         for col in date_columns:
-            df[col] = pd.to_datetime(df[col], errors='coerce')
+            df[col] = parse_datetime_column(df[col])
         
         # Conversion des colonnes numériques
         numeric_columns = []
@@ -240,6 +236,9 @@ def _generate_test_data(size: int = 1000, limit: Optional[int] = None) -> pd.Dat
     logger.info(f"🧪 Génération de {final_size} propriétés de test")
     
     np.random.seed(42)
+    # Identifiants texte (dtype str par défaut, NaN comme le reste du pipeline):
+    # colonnes construites par concaténation vectorisée
+    row_ids = pd.Series(np.arange(final_size).astype(str), dtype="str")
     
     data = {
         # === PRIX ===
@@ -269,8 +268,8 @@ def _generate_test_data(size: int = 1000, limit: Optional[int] = None) -> pd.Dat
         "lng": np.random.uniform(-74.5, -71.0, final_size),
         
         # === ADRESSES ===
-        "address": [f"Rue {i} Montréal QC" for i in range(final_size)],
-        "adresse": [f"Street {i} Quebec QC" for i in range(final_size)],
+        "address": "Rue " + row_ids + " Montréal QC",
+        "adresse": "Street " + row_ids + " Quebec QC",
         
         # === TYPES DE PROPRIÉTÉ ===
         "property_type": np.random.choice(["Maison", "Appartement", "Condo", "Duplex"], final_size),
@@ -313,8 +312,8 @@ def _generate_test_data(size: int = 1000, limit: Optional[int] = None) -> pd.Dat
         "units": np.random.randint(1, 10, final_size),
         
         # === LIENS ===
-        "link": [f"https://example.com/property/{i}" for i in range(final_size)],
-        "lien": [f"https://exemple.com/propriete/{i}" for i in range(final_size)],
+        "link": "https://example.com/property/" + row_ids,
+        "lien": "https://exemple.com/propriete/" + row_ids,
         
         # === ENTREPRISES ===
         "company": np.random.choice(["RE/MAX", "Century 21", "Royal LePage"], final_size),
@@ -325,8 +324,8 @@ def _generate_test_data(size: int = 1000, limit: Optional[int] = None) -> pd.Dat
         "data_version": ["1.0"] * final_size,
         
         # === MÉTADONNÉES ===
-        "extraction_metadata": [f"{{'source': 'test', 'id': {i}}}" for i in range(final_size)],
-        "metadata": [f"{{'test': True, 'id': {i}}}" for i in range(final_size)]
+        "extraction_metadata": "{'source': 'test', 'id': " + row_ids + "}",
+        "metadata": "{'test': True, 'id': " + row_ids + "}"
     }
     
     # Création du DataFrame
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📁 MODULE FICHIERS - Pipeline ETL Ultra-Intelligent
+====================================================
+
+Utilitaires d'accès au système de fichiers pour les exports et rapports
+Fichiers connus: un os.stat par chemin; parcours de répertoires: un seul
+os.scandir, les DirEntry mettent en cache le type lu avec le répertoire
+"""
+
+import os
+import stat
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+def get_files_stats(file_paths: Iterable[str]) -> Dict[str, os.stat_result]:
+    """
+    Récupère les métadonnées de plusieurs fichiers connus
+    
+    Un os.stat par chemin: le coût ne dépend pas de la taille des répertoires
+    (les répertoires d'export s'accumulent d'une exécution à l'autre)
+    
+    Args:
+        file_paths: Chemins des fichiers à inspecter
+        
+    Returns:
+        Dict chemin -> os.stat_result (les fichiers absents sont omis)
+    """
+    stats = {}
+    for file_path in file_paths:
+        if not file_path:
+            continue
+        file_path = str(file_path)
+        try:
+            file_stat = os.stat(file_path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(f"⚠️ Impossible de lire {file_path}: {e}")
+            continue
+        if stat.S_ISREG(file_stat.st_mode):
+            stats[file_path] = file_stat
+    
+    return stats
+
+def get_directory_info(directory_path: str) -> Dict[str, Any]:
+    """
+    Nombre de fichiers et taille totale d'un répertoire en un seul os.scandir
+    
+    Args:
+        directory_path: Répertoire à inspecter (non récursif)
+        
+    Returns:
+        Dict avec le chemin, le nombre de fichiers et la taille totale en MB
+    """
+    file_count = 0
+    total_size = 0
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                # Type lu avec le répertoire; stat sans suivre les liens symboliques
+                if entry.is_file(follow_symlinks=False):
+                    file_count += 1
+                    total_size += entry.stat(follow_symlinks=False).st_size
+    except OSError as e:
+        logger.warning(f"⚠️ Impossible de lire le répertoire {directory_path}: {e}")
+    
+    return {
+        "path": str(directory_path),
+        "file_count": file_count,
+        "total_size_mb": total_size / (1024 * 1024)
+    }
+
+def remove_files(file_paths: Iterable[str], max_workers: int = 8) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Supprime plusieurs fichiers en parallèle (les unlink sont des appels bloquants)
+
+    Args:
+        file_paths: Chemins des fichiers à supprimer
+        max_workers: Nombre de threads de suppression
+
+    Returns:
+        Tuple (fichiers supprimés, dict chemin -> erreur)
+    """
+    paths = [str(file_path) for file_path in file_paths if file_path]
+    if not paths:
+        return [], {}
+
+    def _remove(file_path: str):
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            return str(e)
+        return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as executor:
+        outcomes = list(executor.map(_remove, paths))
+
+    removed = [path for path, error in zip(paths, outcomes) if error is None]
+    errors = {path: error for path, error in zip(paths, outcomes) if error is not None}
+    return removed, errors
+
+def cleanup_old_files(directory_path: str, days_old: int = 30, max_workers: int = 8) -> int:
+    """
+    Supprime les fichiers plus anciens que days_old jours (non récursif)
+    
+    Args:
+        directory_path: Répertoire à nettoyer
+        days_old: Âge minimal (jours, selon la date de modification)
+        max_workers: Nombre de threads de suppression
+        
+    Returns:
+        Nombre de fichiers supprimés
+    """
+    # Seuil calculé une fois: comparaison directe avec st_mtime
+    cutoff_ts = time.time() - days_old * 86400
+    
+    victims = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff_ts:
+                    victims.append(entry.path)
+    except OSError as e:
+        logger.warning(f"⚠️ Impossible de lire le répertoire {directory_path}: {e}")
+        return 0
+    
+    removed, errors = remove_files(victims, max_workers=max_workers)
+    for file_path, error in errors.items():
+        logger.warning(f"⚠️ Impossible de supprimer {file_path}: {error}")
+    return len(removed)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⚡ MODULE NOYAUX JIT - Pipeline ETL Ultra-Intelligent
+======================================================
+
+Noyaux numériques partagés par les composants, avec repli NumPy
+Numba est seulement détecté à l'import (find_spec); il est importé et chaque
+noyau compilé (puis relu depuis le cache disque) au premier appel
+"""
+
+import importlib.util
+import logging
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Remplacé par numba.prange avant la première compilation
+prange = range
+
+@lru_cache(maxsize=None)
+def _compiled(impl: Callable) -> Optional[Callable]:
+    """Version njit(parallel=True) d'un noyau, compilée une fois (None si Numba est inutilisable)"""
+    global prange
+    try:
+        from numba import njit, prange
+        return njit(cache=True, parallel=True)(impl)
+    except Exception as e:
+        logger.warning(f"⚠️ Noyau Numba {impl.__name__} indisponible, repli NumPy: {e}")
+        return None
+
+def _kernel(impl: Callable) -> Optional[Callable]:
+    """Noyau compilé si Numba est disponible, None sinon"""
+    return _compiled(impl) if NUMBA_AVAILABLE else None
+
+# === COMPTAGE DES BORNES ===
+def _range_counts_impl(values, min_value, max_value):
+    n_valid = 0
+    n_below = 0
+    n_above = 0
+    for i in prange(values.size):
+        value = values[i]
+        if value == value:  # NaN exclu
+            n_valid += 1
+            if value < min_value:
+                n_below += 1
+            elif value > max_value:
+                n_above += 1
+    return n_valid, n_below, n_above
+
+def range_counts(values: np.ndarray, min_value: float, max_value: float) -> Tuple[int, int, int]:
+    """
+    Comptes d'un tableau float64 par rapport à des bornes, en une passe
+
+    Args:
+        values: Valeurs float64 (NaN = manquante)
+        min_value: Borne inférieure
+        max_value: Borne supérieure
+
+    Returns:
+        Tuple (non-NaN, < min_value, > max_value); les NaN ne sont comptés d'aucun côté
+    """
+    kernel = _kernel(_range_counts_impl)
+    if kernel is not None:
+        n_valid, n_below, n_above = kernel(values, float(min_value), float(max_value))
+        return int(n_valid), int(n_below), int(n_above)
+    # Les comparaisons avec NaN sont fausses
+    return (int(np.count_nonzero(~np.isnan(values))),
+            int(np.count_nonzero(values < min_value)),
+            int(np.count_nonzero(values > max_value)))
+
+# === COALESCENCE ===
+def _first_non_nan_impl(matrix):
+    n_rows, n_cols = matrix.shape
+    out = np.empty(n_rows, dtype=np.float64)
+    for i in prange(n_rows):
+        out[i] = np.nan
+        for j in range(n_cols):
+            value = matrix[i, j]
+            if value == value:  # NaN exclu
+                out[i] = value
+                break
+    return out
+
+def first_non_nan(matrix: np.ndarray) -> np.ndarray:
+    """
+    Première valeur non-NaN de chaque ligne d'une matrice float64
+
+    Args:
+        matrix: Matrice (lignes, colonnes dans l'ordre de priorité)
+
+    Returns:
+        Tableau float64 (NaN si la ligne n'a aucune valeur)
+    """
+    kernel = _kernel(_first_non_nan_impl)
+    if kernel is not None:
+        return kernel(matrix)
+    # Lignes entièrement NaN: argmax -> 0, qui renvoie bien NaN
+    first = (~np.isnan(matrix)).argmax(axis=1)
+    return matrix[np.arange(matrix.shape[0]), first]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+💤 MODULE IMPORTS DIFFÉRÉS - Pipeline ETL Ultra-Intelligent
+============================================================
+
+Attributs de package importés au premier accès (PEP 562), partagés par les
+__init__ des packages core, core.components et utils
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+def lazy_attributes(package_name: str, namespace: Dict[str, Any],
+                    lazy_imports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Construit les fonctions __getattr__ et __dir__ d'un package
+    
+    Args:
+        package_name: __name__ du package
+        namespace: globals() du package (l'attribut y est conservé après le premier import)
+        lazy_imports: Attribut public -> sous-module relatif ('.module')
+        
+    Returns:
+        Tuple (__getattr__, __dir__) à affecter au niveau module du package
+    """
+    def __getattr__(name: str) -> Any:
+        """Import à la demande des sous-modules (PEP 562)"""
+        module_name = lazy_imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        namespace[name] = value
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(lazy_imports))
+    
+    return __getattr__, __dir__
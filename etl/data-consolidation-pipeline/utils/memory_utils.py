@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧮 MODULE MÉMOIRE - Pipeline ETL Ultra-Intelligent
+===================================================
+
+Estimation de l'empreinte mémoire d'un DataFrame pour les rapports
+Seules les colonnes object sont mesurées en profondeur, sur un échantillon
+de lignes, au lieu de parcourir tous les objets Python du DataFrame.
+Réduction des flottants en float32 lorsqu'elle est sans perte
+"""
+
+import numpy as np
+import pandas as pd
+
+def estimate_memory_usage_mb(df: pd.DataFrame, sample_size: int = 10_000) -> float:
+    """
+    Estime la mémoire occupée par un DataFrame (MB)
+
+    Args:
+        df: DataFrame à mesurer
+        sample_size: Nombre de lignes mesurées en profondeur pour les colonnes object
+
+    Returns:
+        Taille estimée en MB (exacte si le DataFrame a au plus sample_size lignes)
+    """
+    # Tailles des buffers (index compris): immédiat, sans parcourir les objets
+    total = float(df.memory_usage(index=True, deep=False).sum())
+
+    object_positions = [i for i, dtype in enumerate(df.dtypes) if dtype == object]
+    if object_positions and len(df):
+        object_columns = df.iloc[:, object_positions]
+        shallow = object_columns.memory_usage(index=False, deep=False).sum()
+        if len(df) <= sample_size:
+            deep = object_columns.memory_usage(index=False, deep=True).sum()
+        else:
+            # Lignes régulièrement espacées: déterministe, représentatif des fichiers triés
+            rows = np.linspace(0, len(df) - 1, sample_size, dtype=np.int64)
+            sample_deep = object_columns.iloc[rows].memory_usage(index=False, deep=True).sum()
+            deep = sample_deep * len(df) / sample_size
+        total += deep - shallow
+
+    return total / 1024 / 1024
+
+def downcast_float_lossless(series: pd.Series) -> pd.Series:
+    """
+    Convertit une colonne flottante en float32 si aucune valeur n'est modifiée
+
+    pd.to_numeric(downcast='float') ne vérifie pas la précision: des coordonnées
+    ou des montants (45.5017123, 1234.56) perdraient leurs dernières décimales
+
+    Args:
+        series: Colonne flottante (numpy ou nullable Float64)
+
+    Returns:
+        Colonne float32 (Float32 si nullable) si l'aller-retour float64 -> float32
+        -> float64 est exact (NaN compris), colonne inchangée sinon
+    """
+    if series.dtype.itemsize <= 4:
+        return series
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(over='ignore'):
+        narrowed = values.astype(np.float32)
+    if not np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+        return series
+    return series.astype('Float32' if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) else np.float32)
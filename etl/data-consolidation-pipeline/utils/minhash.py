@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔏 MODULE MINHASH - Pipeline ETL Ultra-Intelligent
+===================================================
+
+Détection des colonnes au contenu quasi identique par MinHash + LSH
+Chaque colonne est résumée par une signature de taille fixe; seules les colonnes
+qui partagent une bande de signature sont comparées, au lieu de toutes les paires
+"""
+
+from collections import defaultdict
+from itertools import combinations
+from typing import List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Hachage universel (a * h + b) mod p sur des empreintes 32 bits: aucun débordement uint64
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_HASH_MASK = np.uint64(0xFFFFFFFF)
+_EMPTY_SLOT = np.iinfo(np.uint64).max
+
+def column_minhash_signatures(df: pd.DataFrame, n_perm: int = 128, seed: int = 42,
+                              chunk_size: int = 4096) -> np.ndarray:
+    """
+    Signatures MinHash de l'ensemble des valeurs distinctes de chaque colonne
+
+    Args:
+        df: DataFrame à résumer
+        n_perm: Nombre de permutations (longueur des signatures)
+        seed: Graine des permutations (signatures comparables pour une même graine)
+        chunk_size: Valeurs permutées par bloc (borne la matrice temporaire)
+
+    Returns:
+        Tableau uint64 (n_colonnes, n_perm); une colonne vide garde des cases vides
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 1 << 32, n_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, n_perm, dtype=np.uint64)
+
+    signatures = np.full((df.shape[1], n_perm), _EMPTY_SLOT, dtype=np.uint64)
+    for position in range(df.shape[1]):
+        values = df.iloc[:, position].dropna()
+        if values.empty:
+            continue
+        if pd.api.types.is_numeric_dtype(values):
+            # Valeurs numériques en float64: 123 et sa copie flottante 123.0 ont la même empreinte
+            values = pd.Series(values.to_numpy(dtype=np.float64))
+        else:
+            # Représentation texte: les colonnes object hétérogènes restent hachables
+            values = values.astype(str)
+        value_hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        value_hashes = np.unique(value_hashes & _HASH_MASK)
+
+        signature = signatures[position]
+        for start in range(0, len(value_hashes), chunk_size):
+            chunk = value_hashes[start:start + chunk_size, None]
+            permuted = ((a * chunk) % _MERSENNE_PRIME + b) % _MERSENNE_PRIME
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+
+    return signatures
+
+def similar_column_groups(signatures: np.ndarray, columns: Sequence, threshold: float = 0.85,
+                          bands: int = 16) -> List[List]:
+    """
+    Groupes de colonnes dont la similarité de Jaccard estimée atteint le seuil
+
+    Candidats: colonnes identiques sur au moins une bande de signature (LSH);
+    chaque candidat est vérifié sur la signature complète, puis les paires
+    retenues sont réunies en groupes (union-find)
+
+    Args:
+        signatures: Signatures de column_minhash_signatures
+        columns: Noms alignés sur les lignes de signatures
+        threshold: Similarité de Jaccard minimale (0-1)
+        bands: Nombre de bandes LSH (n_perm doit en être un multiple)
+
+    Returns:
+        Liste de groupes (au moins 2 colonnes, dans l'ordre de columns)
+    """
+    n_columns, n_perm = signatures.shape
+    rows = n_perm // bands
+    parent = list(range(n_columns))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    non_empty = np.flatnonzero((signatures != _EMPTY_SLOT).any(axis=1))
+    checked = set()
+    for band in range(bands):
+        band_values = signatures[:, band * rows:(band + 1) * rows]
+        buckets = defaultdict(list)
+        for position in non_empty:
+            buckets[band_values[position].tobytes()].append(position)
+
+        for members in buckets.values():
+            for i, j in combinations(members, 2):
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if np.count_nonzero(signatures[i] == signatures[j]) >= threshold * n_perm:
+                    parent[find(j)] = find(i)
+
+    groups = defaultdict(list)
+    for position in non_empty:
+        groups[find(position)].append(columns[position])
+    return [group for group in groups.values() if len(group) > 1]
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🕳️ MODULE VALEURS MANQUANTES - Pipeline ETL Ultra-Intelligent
+==============================================================
+
+Comptage des valeurs manquantes partagé par les validateurs
+Un seul parcours du DataFrame par validation, réutilisé par toutes les phases
+"""
+
+import numpy as np
+import pandas as pd
+
+def count_nulls(df: pd.DataFrame) -> np.ndarray:
+    """
+    Nombre de valeurs manquantes par position de colonne
+
+    count() agrège directement chaque bloc sans matérialiser le masque
+    booléen N x M que produirait df.isna().sum()
+
+    Args:
+        df: DataFrame à inspecter
+
+    Returns:
+        Tableau int64 aligné sur df.columns
+    """
+    return len(df) - df.count().to_numpy(dtype=np.int64)
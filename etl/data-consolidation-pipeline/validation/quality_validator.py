@@ -14,8 +14,23 @@ import logging
 from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime, timedelta
 import warnings
+import copy
 import json
 import os
+import atexit
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    from ..utils.memory_utils import estimate_memory_usage_mb
+except ImportError:
+    from utils.memory_utils import estimate_memory_usage_mb
+
+try:
+    from ..utils.null_utils import count_nulls
+except ImportError:
+    from utils.null_utils import count_nulls
 
 # Imports conditionnels pour les bibliothèques optionnelles
 try:
@@ -48,6 +63,21 @@ except ImportError:
     PANDAS_PROFILING_AVAILABLE = False
     warnings.warn("Pandas Profiling non disponible - profils limités")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    warnings.warn("orjson non disponible - export JSON via le module standard")
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    warnings.warn("PyArrow non disponible - contrôles de chaînes via pandas")
+
 try:
     import missingno as msno
     MISSINGNO_AVAILABLE = True
@@ -58,6 +88,15 @@ except ImportError:
 warnings.filterwarnings('ignore')
 logger = logging.getLogger(__name__)
 
+# Recommandations du rapport: bornes inférieures croissantes (>=) et texte de chaque palier
+_RECOMMENDATION_THRESHOLDS = (0.6, 0.8, 0.9)
+_RECOMMENDATION_LEVELS = (
+    "❌ **Faible** - Actions correctives nécessaires",
+    "⚠️ **Moyen** - Améliorations recommandées",
+    "✅ **Bon** - La qualité des données est acceptable",
+    "✅ **Excellent** - La qualité des données est très bonne",
+)
+
 class QualityValidator:
     """
     Validateur de qualité des données avec tests automatisés
@@ -76,6 +115,9 @@ class QualityValidator:
         self.quality_metrics = {}
         self.anomalies_detected = {}
         self.current_output_path = None
+        self._pending_writes: List[threading.Thread] = []
+        self._join_at_exit = False
+        self.max_workers = min(4, os.cpu_count() or 1)  # Validations indépendantes en parallèle
         
         logger.info("✅ QualityValidator initialisé")
         logger.info(f"📊 Great Expectations: {'✅' if GREAT_EXPECTATIONS_AVAILABLE else '❌'}")
@@ -114,6 +156,9 @@ class QualityValidator:
                 "bedrooms_max": 20,
                 "bathrooms_min": 0,
                 "bathrooms_max": 20
+            },
+            "performance": {
+                "column_chunk_size": 16  # Colonnes numériques converties ensemble en float64
             }
         }
     
@@ -132,59 +177,48 @@ class QualityValidator:
         
         validation_start = datetime.now()
         
-        # === VALIDATION DE BASE ===
-        logger.info("📋 Validation de base...")
-        try:
-            basic_validation = self._basic_validation(df)
-            logger.info("✅ Validation de base terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur validation de base: {e}")
-            raise
-        
-        # === VALIDATION DES TYPES ===
-        logger.info("🔧 Validation des types de données...")
-        try:
-            type_validation = self._type_validation(df)
-            logger.info("✅ Validation des types terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur validation des types: {e}")
-            raise
-        
-        # === VALIDATION DES VALEURS ===
-        logger.info("✅ Validation des valeurs...")
-        try:
-            value_validation = self._value_validation(df)
-            logger.info("✅ Validation des valeurs terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur validation des valeurs: {e}")
-            raise
-        
-        # === VALIDATION GÉOGRAPHIQUE ===
-        logger.info("🌍 Validation géographique...")
-        try:
-            geographic_validation = self._geographic_validation(df)
-            logger.info("✅ Validation géographique terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur validation géographique: {e}")
-            raise
-        
-        # === VALIDATION DES RÈGLES MÉTIER ===
-        logger.info("💼 Validation des règles métier...")
-        try:
-            business_validation = self._business_rule_validation(df)
-            logger.info("✅ Validation des règles métier terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur validation des règles métier: {e}")
-            raise
+        # Valeurs manquantes par colonne, calculées une fois pour les validations de base et de types
+        null_counts = self._null_counts(df)
+        # Colonnes numériques détectées une fois pour les valeurs et les anomalies
+        numeric_columns = self._numeric_columns(df)
+        
+        # === VALIDATIONS INDÉPENDANTES (EN PARALLÈLE) ===
+        # Chaque validation lit df sans le modifier et accumule ses résultats localement;
+        # NumPy/pandas relâchent le GIL pendant les conversions et comparaisons
+        validation_tasks = {
+            "basic": ("📋", "Validation de base", lambda: self._basic_validation(df, null_counts)),
+            "types": ("🔧", "Validation des types", lambda: self._type_validation(df, null_counts)),
+            "values": ("✅", "Validation des valeurs", lambda: self._value_validation(df, numeric_columns)),
+            "geographic": ("🌍", "Validation géographique", lambda: self._geographic_validation(df)),
+            "business": ("💼", "Validation des règles métier", lambda: self._business_rule_validation(df)),
+            "anomalies": ("🚨", "Détection d'anomalies", lambda: self._anomaly_detection(df, numeric_columns)),
+        }
         
-        # === DÉTECTION D'ANOMALIES ===
-        logger.info("🚨 Détection d'anomalies...")
-        try:
-            anomaly_detection = self._anomaly_detection(df)
-            logger.info("✅ Détection d'anomalies terminée")
-        except Exception as e:
-            logger.error(f"❌ Erreur détection d'anomalies: {e}")
-            raise
+        task_results = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            futures = {}
+            for name, (icon, label, task) in validation_tasks.items():
+                logger.info(f"{icon} {label}...")
+                futures[executor.submit(task)] = name
+            
+            for future in as_completed(futures):
+                name = futures[future]
+                label = validation_tasks[name][1]
+                try:
+                    task_results[name] = future.result()
+                    logger.info(f"✅ {label} terminée")
+                except Exception as e:
+                    logger.error(f"❌ Erreur {label.lower()}: {e}")
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+        
+        basic_validation = task_results["basic"]
+        type_validation = task_results["types"]
+        value_validation = task_results["values"]
+        geographic_validation = task_results["geographic"]
+        business_validation = task_results["business"]
+        anomaly_detection = task_results["anomalies"]
         
         # === VALIDATION AVEC GREAT EXPECTATIONS ===
         if GREAT_EXPECTATIONS_AVAILABLE:
@@ -217,7 +251,7 @@ class QualityValidator:
             "validation_duration_seconds": validation_duration.total_seconds(),
             "dataset_info": {
                 "shape": df.shape,
-                "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024,
+                "memory_usage_mb": estimate_memory_usage_mb(df),
                 "columns": list(df.columns)
             },
             "validation_results": {
@@ -241,13 +275,37 @@ class QualityValidator:
         
         return self.validation_results[dataset_name]
     
-    def _basic_validation(self, df: pd.DataFrame) -> Dict[str, Any]:
+    @staticmethod
+    def _null_counts(df: pd.DataFrame) -> np.ndarray:
+        """Nombre de valeurs manquantes par position de colonne (partagé avec DataValidator)"""
+        return count_nulls(df)
+    
+    @staticmethod
+    def _duplicate_row_count(df: pd.DataFrame) -> int:
+        """
+        Nombre de lignes en double (hors première occurrence)
+        
+        Une empreinte uint64 par ligne (hachage par colonne en C) isole les lignes
+        dont l'empreinte est partagée; duplicated() confirme l'égalité réelle sur ces
+        seules candidates (collisions, 1 et "1" dans une colonne object).
+        TypeError si une valeur est non hachable
+        """
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        _, inverse, counts = np.unique(row_hashes, return_inverse=True, return_counts=True)
+        candidates = np.flatnonzero(counts[inverse] > 1)
+        if candidates.size == 0:
+            return 0
+        return int(df.iloc[candidates].duplicated().sum())
+    
+    def _basic_validation(self, df: pd.DataFrame, null_counts: np.ndarray = None) -> Dict[str, Any]:
         """Validation de base du dataset"""
         results = {}
+        if null_counts is None:
+            null_counts = self._null_counts(df)
         
         # === COMPLÉTUDE ===
         total_cells = df.shape[0] * df.shape[1]
-        null_cells = df.isnull().sum().sum()
+        null_cells = int(null_counts.sum())
         completeness = 1 - (null_cells / total_cells)
         
         results["completeness"] = {
@@ -260,8 +318,8 @@ class QualityValidator:
         
         # === UNICITÉ ===
         try:
-            # Essayer la méthode standard
-            duplicate_rows = df.duplicated().sum()
+            # Hachage vectorisé des lignes: pas de tuples Python par ligne
+            duplicate_rows = self._duplicate_row_count(df)
         except TypeError as e:
             # Si on a des valeurs non-hashables, on fait une approximation
             logger.warning(f"⚠️ Impossible de calculer duplicated() à cause de valeurs non-hashables: {e}")
@@ -290,10 +348,12 @@ class QualityValidator:
         
         # === CONSISTANCE DES COLONNES ===
         column_consistency = {}
+        # Boucle par colonne: journalisation paresseuse (%-style), aperçu calculé seulement en DEBUG
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for col in df.columns:
             # Convertir la colonne en string pour éviter les problèmes de hashabilité
             col_key = str(col)
-            logger.debug(f"🔍 Validation cohérence colonne: {col_key} (type: {df[col].dtype})")
+            logger.debug("🔍 Validation cohérence colonne: %s (type: %s)", col_key, df[col].dtype)
             try:
                 if df[col].dtype == 'object':
                     # Pour les colonnes textuelles, vérifier la cohérence des formats
@@ -302,15 +362,16 @@ class QualityValidator:
                         try:
                             # Vérifier si les valeurs sont des dictionnaires ou des chaînes
                             first_value = sample_values.iloc[0]
-                            logger.debug(f"🔍 Première valeur de {col_key}: {type(first_value)} - {str(first_value)[:100]}")
+                            if debug_enabled:
+                                logger.debug("🔍 Première valeur de %s: %s - %s", col_key, type(first_value), str(first_value)[:100])
                             
                             if isinstance(first_value, dict):
                                 # Pour les colonnes de dictionnaires, cohérence parfaite
-                                logger.debug(f"✅ Colonne {col_key}: dictionnaire détecté")
+                                logger.debug("✅ Colonne %s: dictionnaire détecté", col_key)
                                 column_consistency[col_key] = 1.0
                             elif isinstance(first_value, str):
                                 # Pour les colonnes textuelles, vérifier la cohérence des formats
-                                logger.debug(f"✅ Colonne {col_key}: chaîne détectée")
+                                logger.debug("✅ Colonne %s: chaîne détectée", col_key)
                                 try:
                                     length_variation = sample_values.str.len().std() / sample_values.str.len().mean()
                                     column_consistency[col_key] = max(0, 1 - length_variation)
@@ -319,7 +380,7 @@ class QualityValidator:
                                     column_consistency[col_key] = 1.0
                             else:
                                 # Pour les autres types d'objets
-                                logger.debug(f"⚠️ Colonne {col_key}: type inattendu {type(first_value)}")
+                                logger.debug("⚠️ Colonne %s: type inattendu %s", col_key, type(first_value))
                                 column_consistency[col_key] = 1.0
                         except Exception as e:
                             # En cas d'erreur, considérer comme cohérent
@@ -334,12 +395,9 @@ class QualityValidator:
                 logger.warning(f"⚠️ Erreur générale pour colonne {col_key}: {e}")
                 column_consistency[col_key] = 1.0
         
-        # Calcul de la moyenne avec gestion d'erreur
-        try:
-            avg_column_consistency = np.mean(list(column_consistency.values()))
-        except Exception as e:
-            logger.warning(f"⚠️ Erreur calcul moyenne cohérence: {e}")
-            avg_column_consistency = 1.0
+        # Moyenne (aucune colonne: cohérence parfaite)
+        avg_column_consistency = (sum(column_consistency.values()) / len(column_consistency)
+                                  if column_consistency else 1.0)
         
         results["column_consistency"] = {
             "score": avg_column_consistency,
@@ -349,30 +407,33 @@ class QualityValidator:
         
         return results
     
-    def _type_validation(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _type_validation(self, df: pd.DataFrame, null_counts: np.ndarray = None) -> Dict[str, Any]:
         """Validation des types de données"""
         results = {}
+        if null_counts is None:
+            null_counts = self._null_counts(df)
         
         # === ANALYSE DES TYPES ===
         type_analysis = {}
-        for col in df.columns:
+        for i, col in enumerate(df.columns):
             col_key = str(col)
-            col_type = str(df[col].dtype)
+            series = df.iloc[:, i]
             type_analysis[col_key] = {
-                "current_type": col_type,
-                "sample_values": df[col].dropna().head(3).tolist(),
-                "null_count": df[col].isnull().sum()
+                "current_type": str(series.dtype),
+                "sample_values": series.dropna().head(3).tolist(),
+                "null_count": int(null_counts[i])
             }
         
         # === DÉTECTION DE TYPES INAPPROPRIÉS ===
         type_issues = []
+        # Index clé -> colonne originale (une seule passe au lieu d'une recherche par colonne)
+        original_columns = {}
+        for col in df.columns:
+            original_columns.setdefault(str(col), col)
+        
         for col_key, info in type_analysis.items():
             # Trouver la colonne originale correspondante
-            original_col = None
-            for col in df.columns:
-                if str(col) == col_key:
-                    original_col = col
-                    break
+            original_col = original_columns.get(col_key)
             
             if original_col is None:
                 continue
@@ -410,26 +471,47 @@ class QualityValidator:
         
         return results
     
-    def _value_validation(self, df: pd.DataFrame) -> Dict[str, Any]:
+    @staticmethod
+    def _numeric_columns(df: pd.DataFrame) -> pd.Index:
+        """Colonnes numériques du DataFrame (un seul parcours des dtypes)"""
+        return df.select_dtypes(include=[np.number]).columns
+    
+    def _value_validation(self, df: pd.DataFrame, numeric_columns: pd.Index = None) -> Dict[str, Any]:
         """Validation des valeurs des données"""
         results = {}
+        if numeric_columns is None:
+            numeric_columns = self._numeric_columns(df)
         
         # === VALIDATION DES VALEURS NUMÉRIQUES ===
         numeric_validation = {}
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_columns:
-            col_key = str(col)
-            series = df[col].dropna()
-            if len(series) > 0:
-                numeric_validation[col_key] = {
-                    "min": float(series.min()),
-                    "max": float(series.max()),
-                    "mean": float(series.mean()),
-                    "std": float(series.std()),
-                    "zero_count": int((series == 0).sum()),
-                    "negative_count": int((series < 0).sum()),
-                    "outlier_count": self._count_outliers(series)
+        numeric_positions = np.flatnonzero(df.columns.isin(numeric_columns))
+        # Colonnes traitées par paquets: la matrice float64 temporaire reste bornée
+        # à N x column_chunk_size quelle que soit la largeur du DataFrame
+        chunk_size = max(1, self.validation_config.get("performance", {}).get("column_chunk_size", 16))
+        
+        for start in range(0, len(numeric_positions), chunk_size):
+            # Une matrice float64 et une réduction par statistique pour le paquet de colonnes
+            numeric_block = df.iloc[:, numeric_positions[start:start + chunk_size]]
+            values = numeric_block.to_numpy(dtype=np.float64, na_value=np.nan)
+            valid_counts = np.count_nonzero(~np.isnan(values), axis=0)
+            zero_counts = np.count_nonzero(values == 0, axis=0)
+            negative_counts = np.count_nonzero(values < 0, axis=0)
+            mins = numeric_block.min().to_numpy(dtype=np.float64)
+            maxs = numeric_block.max().to_numpy(dtype=np.float64)
+            means = numeric_block.mean().to_numpy(dtype=np.float64)
+            stds = numeric_block.std().to_numpy(dtype=np.float64)
+            
+            for idx, col in enumerate(numeric_block.columns):
+                if valid_counts[idx] == 0:
+                    continue
+                numeric_validation[str(col)] = {
+                    "min": float(mins[idx]),
+                    "max": float(maxs[idx]),
+                    "mean": float(means[idx]),
+                    "std": float(stds[idx]),
+                    "zero_count": int(zero_counts[idx]),
+                    "negative_count": int(negative_counts[idx]),
+                    "outlier_count": self._count_outliers(values[:, idx])
                 }
         
         # === VALIDATION DES VALEURS CATÉGORIELLES ===
@@ -461,11 +543,12 @@ class QualityValidator:
                         else:
                             most_common = {"error": "Valeurs non-hashables détectées"}
                         
+                        empty_count, whitespace_only_count = self._blank_string_counts(series)
                         categorical_validation[col_key] = {
                             "unique_count": int(series.nunique()),
                             "most_common": most_common,
-                            "empty_string_count": int((series == "").sum()),
-                            "whitespace_only_count": int((series.str.strip() == "").sum())
+                            "empty_string_count": empty_count,
+                            "whitespace_only_count": whitespace_only_count
                         }
                     except Exception as e:
                         logger.warning(f"⚠️ Erreur validation catégorielle pour {col_key}: {e}")
@@ -497,65 +580,94 @@ class QualityValidator:
         
         return results
     
+    @staticmethod
+    def _blank_string_masks(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """Masques (chaîne vide, chaîne vide après strip) via les kernels Arrow si possible"""
+        if PYARROW_AVAILABLE:
+            try:
+                arr = pa.array(values, type=pa.string(), from_pandas=True)
+                empty = pc.equal(pc.utf8_length(arr), 0)
+                blank = pc.equal(pc.utf8_length(pc.utf8_trim_whitespace(arr)), 0)
+                return (pc.fill_null(empty, False).to_numpy(zero_copy_only=False),
+                        pc.fill_null(blank, False).to_numpy(zero_copy_only=False))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                # Valeurs non textuelles mélangées: repli pandas
+                pass
+        
+        empty = (values == "").to_numpy(dtype=bool, na_value=False)
+        blank = (values.str.strip() == "").to_numpy(dtype=bool, na_value=False)
+        return empty, blank
+    
+    @classmethod
+    def _blank_string_counts(cls, series: pd.Series) -> Tuple[int, int]:
+        """
+        Nombre de chaînes vides et de chaînes blanches (vides après strip)
+        
+        Pour une colonne catégorielle, seules les catégories sont testées puis
+        pondérées par leurs effectifs
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = pd.Series(series.cat.categories)
+            codes = series.cat.codes.to_numpy()
+            weights = np.bincount(codes[codes >= 0], minlength=len(categories))
+            empty, blank = cls._blank_string_masks(categories)
+            return int(weights[empty].sum()), int(weights[blank].sum())
+        
+        empty, blank = cls._blank_string_masks(series)
+        return int(np.count_nonzero(empty)), int(np.count_nonzero(blank))
+    
     def _geographic_validation(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Validation des données géographiques"""
         results = {}
         
         # === DÉTECTION DES COLONNES GÉOGRAPHIQUES ===
-        lat_columns = [col for col in df.columns if any(term in col.lower() for term in ['lat', 'latitude'])]
-        lng_columns = [col for col in df.columns if any(term in col.lower() for term in ['lng', 'long', 'longitude'])]
+        lat_columns = [col for col in df.columns if any(term in str(col).lower() for term in ['lat', 'latitude'])]
+        lng_columns = [col for col in df.columns if any(term in str(col).lower() for term in ['lng', 'long', 'longitude'])]
         
-        geographic_issues = []
+        # Une conversion float64 par colonne, partagée par les contrôles ci-dessous
+        coordinates = {
+            col: pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in dict.fromkeys(lat_columns + lng_columns)
+        }
         
-        # === VALIDATION DES LATITUDES ===
-        for col in lat_columns:
-            col_key = str(col)
-            if col in df.columns:
-                series = df[col].dropna()
-                if len(series) > 0:
-                    bounds = self.validation_config["geographic_validation"]["latitude_bounds"]
-                    out_of_bounds = series[(series < bounds["min"]) | (series > bounds["max"])]
-                    
-                    if len(out_of_bounds) > 0:
-                        geographic_issues.append({
-                            "column": col_key,
-                            "issue": f"Latitudes hors limites ({bounds['min']} à {bounds['max']})",
-                            "count": len(out_of_bounds),
-                            "severity": "ERROR"
-                        })
+        geographic_issues = []
         
-        # === VALIDATION DES LONGITUDES ===
-        for col in lng_columns:
-            col_key = str(col)
-            if col in df.columns:
-                series = df[col].dropna()
-                if len(series) > 0:
-                    bounds = self.validation_config["geographic_validation"]["longitude_bounds"]
-                    out_of_bounds = series[(series < bounds["min"]) | (series > bounds["max"])]
-                    
-                    if len(out_of_bounds) > 0:
-                        geographic_issues.append({
-                            "column": col_key,
-                            "issue": f"Longitudes hors limites ({bounds['min']} à {bounds['max']})",
-                            "count": len(out_of_bounds),
-                            "severity": "ERROR"
-                        })
+        # === VALIDATION DES LATITUDES ET LONGITUDES ===
+        geo_config = self.validation_config["geographic_validation"]
+        for columns, bounds, label in (
+            (lat_columns, geo_config["latitude_bounds"], "Latitudes"),
+            (lng_columns, geo_config["longitude_bounds"], "Longitudes")
+        ):
+            for col in columns:
+                values = coordinates[col]
+                # Comparaisons NaN -> False: les valeurs manquantes ne sont pas comptées
+                out_of_bounds = int(np.count_nonzero((values < bounds["min"]) | (values > bounds["max"])))
+                if out_of_bounds > 0:
+                    geographic_issues.append({
+                        "column": str(col),
+                        "issue": f"{label} hors limites ({bounds['min']} à {bounds['max']})",
+                        "count": out_of_bounds,
+                        "severity": "ERROR"
+                    })
         
         # === VALIDATION DES COORDONNÉES COHERENTES ===
-        if len(lat_columns) > 0 and len(lng_columns) > 0:
-            for lat_col in lat_columns:
-                for lng_col in lng_columns:
-                    if lat_col in df.columns and lng_col in df.columns:
-                        # Vérifier que les coordonnées sont cohérentes
-                        valid_coords = df[[lat_col, lng_col]].dropna()
-                        if len(valid_coords) > 0:
-                            # Vérifier que les coordonnées ne sont pas identiques partout
-                            if valid_coords[lat_col].nunique() == 1 and valid_coords[lng_col].nunique() == 1:
-                                geographic_issues.append({
-                                    "column": f"{lat_col}+{lng_col}",
-                                    "issue": "Coordonnées identiques partout (possible erreur)",
-                                    "severity": "WARNING"
-                                })
+        for lat_col in lat_columns:
+            lat_values = coordinates[lat_col]
+            for lng_col in lng_columns:
+                lng_values = coordinates[lng_col]
+                both_valid = ~(np.isnan(lat_values) | np.isnan(lng_values))
+                if not both_valid.any():
+                    continue
+                
+                # Vérifier que les coordonnées ne sont pas identiques partout
+                lat_located = lat_values[both_valid]
+                lng_located = lng_values[both_valid]
+                if lat_located.min() == lat_located.max() and lng_located.min() == lng_located.max():
+                    geographic_issues.append({
+                        "column": f"{lat_col}+{lng_col}",
+                        "issue": "Coordonnées identiques partout (possible erreur)",
+                        "severity": "WARNING"
+                    })
         
         results["latitude_columns"] = lat_columns
         results["longitude_columns"] = lng_columns
@@ -571,84 +683,60 @@ class QualityValidator:
         business_rules = self.validation_config["business_rules"]
         rule_violations = []
         
-        # === VALIDATION DES PRIX ===
-        price_columns = [col for col in df.columns if any(term in col.lower() for term in ['price', 'prix', 'valeur'])]
-        for col in price_columns:
-            col_key = str(col)
-            if col in df.columns:
-                series = df[col].dropna()
-                if len(series) > 0:
-                    # S'assurer que les valeurs sont numériques
-                    try:
-                        numeric_series = pd.to_numeric(series, errors='coerce').dropna()
-                        if len(numeric_series) > 0:
-                            violations = numeric_series[(numeric_series < business_rules["price_min"]) | (numeric_series > business_rules["price_max"])]
-                            if len(violations) > 0:
-                                rule_violations.append({
-                                    "rule": "Prix dans les limites",
-                                    "column": col_key,
-                                    "violations": len(violations),
-                                    "min_violation": float(violations.min()),
-                                    "max_violation": float(violations.max()),
-                                    "severity": "ERROR"
-                                })
-                    except Exception as e:
-                        logger.warning(f"⚠️ Impossible de valider la colonne {col_key} (prix): {e}")
-        
-        # === VALIDATION DES SURFACES ===
-        surface_columns = [col for col in df.columns if any(term in col.lower() for term in ['surface', 'area', 'sqft', 'm2'])]
-        for col in surface_columns:
-            col_key = str(col)
-            if col in df.columns:
-                series = df[col].dropna()
-                if len(series) > 0:
-                    # S'assurer que les valeurs sont numériques
-                    try:
-                        numeric_series = pd.to_numeric(series, errors='coerce').dropna()
-                        if len(numeric_series) > 0:
-                            violations = numeric_series[(numeric_series < business_rules["surface_min"]) | (numeric_series > business_rules["surface_max"])]
-                            if len(violations) > 0:
-                                rule_violations.append({
-                                    "rule": "Surface dans les limites",
-                                    "column": col_key,
-                                    "violations": len(violations),
-                                    "min_violation": float(violations.min()),
-                                    "max_violation": float(violations.max()),
-                                    "severity": "ERROR"
-                                })
-                    except Exception as e:
-                        logger.warning(f"⚠️ Impossible de valider la colonne {col_key} (surface): {e}")
-        
-        # === VALIDATION DES CHAMBRES ===
-        bedroom_columns = [col for col in df.columns if any(term in col.lower() for term in ['bedroom', 'chambre', 'bed'])]
-        for col in bedroom_columns:
-            col_key = str(col)
-            if col in df.columns:
-                series = df[col].dropna()
-                if len(series) > 0:
-                    # S'assurer que les valeurs sont numériques
+        # === RÈGLES (libellé, termes de détection, bornes, nom pour les logs) ===
+        rule_specs = [
+            ("Prix dans les limites", ['price', 'prix', 'valeur'],
+             business_rules["price_min"], business_rules["price_max"], "prix"),
+            ("Surface dans les limites", ['surface', 'area', 'sqft', 'm2'],
+             business_rules["surface_min"], business_rules["surface_max"], "surface"),
+            ("Nombre de chambres dans les limites", ['bedroom', 'chambre', 'bed'],
+             business_rules["bedrooms_min"], business_rules["bedrooms_max"], "chambres"),
+        ]
+        
+        # Conversion numérique une seule fois par colonne, même si plusieurs règles la ciblent
+        numeric_values = {}
+        checks = []
+        for rule_name, terms, min_value, max_value, label in rule_specs:
+            for col in df.columns:
+                if not any(term in str(col).lower() for term in terms):
+                    continue
+                if col not in numeric_values:
                     try:
-                        numeric_series = pd.to_numeric(series, errors='coerce').dropna()
-                        if len(numeric_series) > 0:
-                            violations = numeric_series[(numeric_series < business_rules["bedrooms_min"]) | (numeric_series > business_rules["bedrooms_max"])]
-                            if len(violations) > 0:
-                                rule_violations.append({
-                                    "rule": "Nombre de chambres dans les limites",
-                                    "column": col_key,
-                                    "violations": len(violations),
-                                    "min_violation": float(violations.min()),
-                                    "max_violation": float(violations.max()),
-                                    "severity": "ERROR"
-                                })
+                        numeric_values[col] = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
                     except Exception as e:
-                        logger.warning(f"⚠️ Impossible de valider la colonne {col_key} (chambres): {e}")
+                        logger.warning(f"⚠️ Impossible de valider la colonne {col} ({label}): {e}")
+                        numeric_values[col] = None
+                if numeric_values[col] is not None:
+                    checks.append((rule_name, col, min_value, max_value))
+        
+        # === ÉVALUATION FUSIONNÉE DE TOUTES LES RÈGLES ===
+        if checks:
+            values = np.column_stack([numeric_values[col] for _, col, _, _ in checks])
+            lower = np.array([min_value for _, _, min_value, _ in checks], dtype=float)
+            upper = np.array([max_value for _, _, _, max_value in checks], dtype=float)
+            
+            # Les NaN ne sont ni < ni > aux bornes : ils ne comptent pas comme violations
+            violation_mask = (values < lower) | (values > upper)
+            violation_counts = violation_mask.sum(axis=0)
+            
+            for idx, (rule_name, col, _, _) in enumerate(checks):
+                if violation_counts[idx] > 0:
+                    violating_values = values[violation_mask[:, idx], idx]
+                    rule_violations.append({
+                        "rule": rule_name,
+                        "column": str(col),
+                        "violations": int(violation_counts[idx]),
+                        "min_violation": float(violating_values.min()),
+                        "max_violation": float(violating_values.max()),
+                        "severity": "ERROR"
+                    })
         
         results["rule_violations"] = rule_violations
         results["status"] = "PASS" if len(rule_violations) == 0 else "FAIL"
         
         return results
     
-    def _anomaly_detection(self, df: pd.DataFrame) -> Dict[str, Any]:
+    def _anomaly_detection(self, df: pd.DataFrame, numeric_columns: pd.Index = None) -> Dict[str, Any]:
         """Détection d'anomalies avec Scikit-learn"""
         results = {}
         
@@ -658,7 +746,8 @@ class QualityValidator:
             return results
         
         # === DÉTECTION PAR ISOLATION FOREST ===
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        if numeric_columns is None:
+            numeric_columns = self._numeric_columns(df)
         if len(numeric_columns) > 0:
             try:
                 # Préparation des données
@@ -817,17 +906,25 @@ class QualityValidator:
         
         return results
     
-    def _count_outliers(self, series: pd.Series) -> int:
-        """Compte les outliers avec la méthode IQR"""
+    def _count_outliers(self, values) -> int:
+        """
+        Compte les outliers avec la méthode IQR
+        
+        Les deux quartiles sont obtenus par un seul np.percentile sur un tableau
+        float64 et les outliers sont comptés sans extraire de sous-série
+        """
         try:
-            Q1 = series.quantile(0.25)
-            Q3 = series.quantile(0.75)
+            values = np.asarray(values, dtype=np.float64)
+            values = values[~np.isnan(values)]
+            if values.size == 0:
+                return 0
+            
+            Q1, Q3 = np.percentile(values, [25, 75])
             IQR = Q3 - Q1
             lower_bound = Q1 - (self.validation_config["anomaly_detection"]["iqr_multiplier"] * IQR)
             upper_bound = Q3 + (self.validation_config["anomaly_detection"]["iqr_multiplier"] * IQR)
             
-            outliers = series[(series < lower_bound) | (series > upper_bound)]
-            return len(outliers)
+            return int(np.count_nonzero((values < lower_bound) | (values > upper_bound)))
         except:
             return 0
     
@@ -841,7 +938,7 @@ class QualityValidator:
             if "completeness" in result:
                 completeness_scores.append(result["completeness"]["score"])
         
-        metrics["completeness_score"] = np.mean(completeness_scores) if completeness_scores else 0.0
+        metrics["completeness_score"] = sum(completeness_scores) / len(completeness_scores) if completeness_scores else 0.0
         
         # === SCORE DE QUALITÉ GLOBALE ===
         overall_score = metrics["completeness_score"]
@@ -931,14 +1028,10 @@ class QualityValidator:
         
         # Recommandations
         report_content.append("## RECOMMANDATIONS")
-        if results['overall_score'] >= 0.9:
-            report_content.append("✅ **Excellent** - La qualité des données est très bonne")
-        elif results['overall_score'] >= 0.8:
-            report_content.append("✅ **Bon** - La qualité des données est acceptable")
-        elif results['overall_score'] >= 0.6:
-            report_content.append("⚠️ **Moyen** - Améliorations recommandées")
-        else:
-            report_content.append("❌ **Faible** - Actions correctives nécessaires")
+        # Score NaN: palier le plus bas
+        overall_score = results['overall_score']
+        level = 0 if pd.isna(overall_score) else bisect_right(_RECOMMENDATION_THRESHOLDS, overall_score)
+        report_content.append(_RECOMMENDATION_LEVELS[level])
         
         report_content.append("")
         report_content.append("# " + "="*80)
@@ -962,6 +1055,10 @@ class QualityValidator:
         """
         Exporte les résultats de validation au format JSON
         
+        L'écriture du fichier se fait dans un thread d'arrière-plan à partir d'une
+        copie profonde prise avant le retour: wait_for_pending_writes() attend la
+        fin des écritures (appelé aussi à la sortie de l'interpréteur)
+        
         Args:
             dataset_name: Nom du dataset
             output_path: Chemin de sauvegarde
@@ -986,13 +1083,48 @@ class QualityValidator:
             "validation_results": results
         }
         
-        # Sauvegarde si un chemin est fourni
+        # Sauvegarde en arrière-plan si un chemin est fourni (hors chemin critique);
+        # le thread écrit sa propre copie: les modifications ultérieures ne la touchent pas
         if output_path:
-            try:
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
-                logger.info(f"💾 Résultats exportés: {output_path}")
-            except Exception as e:
-                logger.error(f"❌ Erreur export: {e}")
+            writer = threading.Thread(
+                target=self._write_json_file,
+                args=(output_path, copy.deepcopy(export_data)),
+                name=f"quality-export-{dataset_name}"
+            )
+            if not self._join_at_exit:
+                atexit.register(self.wait_for_pending_writes)
+                self._join_at_exit = True
+            writer.start()
+            self._pending_writes.append(writer)
         
         return export_data
+    
+    @staticmethod
+    def _write_json_file(output_path: str, data: Dict):
+        """Écrit un fichier JSON (orjson si disponible, exécuté dans un thread d'arrière-plan)"""
+        try:
+            if ORJSON_AVAILABLE:
+                # Types NumPy et datetime sérialisés nativement par orjson
+                with open(output_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data,
+                        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        default=str
+                    ))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            logger.info(f"💾 Résultats exportés: {output_path}")
+        except Exception as e:
+            logger.error(f"❌ Erreur export: {e}")
+    
+    def wait_for_pending_writes(self, timeout: float = None):
+        """
+        Attend la fin des écritures JSON lancées en arrière-plan
+        
+        Args:
+            timeout: Délai maximal d'attente par écriture (secondes)
+        """
+        for writer in self._pending_writes:
+            writer.join(timeout)
+        self._pending_writes = [writer for writer in self._pending_writes if writer.is_alive()]